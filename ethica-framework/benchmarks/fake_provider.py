@@ -0,0 +1,100 @@
+"""
+Ethica.AI Benchmarks - Fake Provider
+Deterministic stand-in for Gemini, Mistral and DeepSeek with configurable latency
+"""
+
+import asyncio
+import hashlib
+import math
+import random
+import threading
+import time
+from typing import Dict, Optional
+
+from providers import Transport, cache_key
+from providers.fake_server import synthetic_response
+
+
+class LatencyModel:
+    """
+    Latency distribution for one provider
+
+    Specs:
+        constant:S          always S seconds
+        uniform:A:B         uniform between A and B
+        normal:MU:SIGMA     normal, clipped at 0
+        lognormal:MED:SIGMA lognormal with median MED (long right tail)
+    """
+
+    KINDS = ('constant', 'uniform', 'normal', 'lognormal')
+
+    def __init__(self, kind: str, *params: float):
+        if kind not in self.KINDS:
+            raise ValueError(f"Unknown latency distribution '{kind}' (expected one of {self.KINDS})")
+        self.kind = kind
+        self.params = params
+
+    @classmethod
+    def parse(cls, spec: str) -> 'LatencyModel':
+        kind, *params = spec.split(':')
+        return cls(kind, *(float(p) for p in params))
+
+    def sample(self, rng: random.Random) -> float:
+        if self.kind == 'constant':
+            return self.params[0]
+        if self.kind == 'uniform':
+            return rng.uniform(*self.params)
+        if self.kind == 'normal':
+            return max(0.0, rng.gauss(*self.params))
+        median, sigma = self.params
+        return rng.lognormvariate(math.log(median), sigma) if median > 0 else 0.0
+
+    def __str__(self) -> str:
+        return ':'.join([self.kind] + [f"{p:g}" for p in self.params])
+
+
+DEFAULT_LATENCIES = {
+    'gemini': LatencyModel('lognormal', 0.040, 0.35),
+    'mistral': LatencyModel('lognormal', 0.060, 0.35),
+    'deepseek': LatencyModel('lognormal', 0.080, 0.45)
+}
+
+
+class FakeProviderTransport(Transport):
+    """
+    Serves synthetic responses after a sampled latency
+
+    The latency of each request is drawn from a generator seeded with
+    (seed, request key, repetition), so a benchmark sees the same delays
+    on every run regardless of thread scheduling, while repeated requests
+    still sample the distribution.
+    """
+
+    def __init__(self, latencies: Optional[Dict[str, LatencyModel]] = None, seed: int = 0):
+        self.latencies = dict(DEFAULT_LATENCIES, **(latencies or {}))
+        self.seed = seed
+        self.calls = 0
+        self.simulated_seconds = 0.0
+        self._seen: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def send(self, provider, prompt: str, options: dict) -> str:
+        text, delay = self._respond(provider, prompt, options)
+        time.sleep(delay)
+        return text
+
+    async def send_async(self, provider, prompt: str, options: dict) -> str:
+        text, delay = self._respond(provider, prompt, options)
+        await asyncio.sleep(delay)
+        return text
+
+    def _respond(self, provider, prompt: str, options: dict):
+        key = cache_key(provider.name, provider.model, prompt, options)
+        with self._lock:
+            repetition = self._seen[key] = self._seen.get(key, -1) + 1
+        seed = hashlib.sha256(f"{self.seed}:{key}:{repetition}".encode()).hexdigest()
+        delay = self.latencies[provider.name].sample(random.Random(seed))
+        with self._lock:
+            self.calls += 1
+            self.simulated_seconds += delay
+        return synthetic_response(provider.name, prompt, options), delay
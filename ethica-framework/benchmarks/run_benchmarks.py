@@ -0,0 +1,407 @@
+"""
+Ethica.AI Framework - Benchmark Suite
+
+Measures what the framework adds on top of provider latency, using a
+deterministic fake provider (no API keys or network needed):
+
+- per-stage and end-to-end latency percentiles (p50/p95/p99)
+- framework overhead (same pipeline with zero provider latency)
+- throughput at several concurrency levels (threads and asyncio)
+- the sefirot chain, when that package is importable
+- peak RSS
+
+Usage:
+    python benchmarks/run_benchmarks.py --output results.json
+    python benchmarks/run_benchmarks.py --baseline benchmarks/baseline.json
+    python benchmarks/run_benchmarks.py --latency gemini=lognormal:0.8:0.4 --repeats 10
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, '..', 'src'))
+sys.path.insert(0, os.path.join(HERE, '..', 'examples'))
+
+# Benchmarks measure the bare pipeline: no response cache, stage reuse or
+# rate limits from env (ETHICA_TRANSPORT is left alone; it only affects the
+# sefirot run)
+for name in list(os.environ):
+    if name.startswith(('ETHICA_CACHE', 'ETHICA_RATE_LIMIT', 'ETHICA_INCREMENTAL')):
+        del os.environ[name]
+
+from core.framework import EthicaFramework
+from core.events import STAGE_STARTED, STAGE_COMPLETED
+from fake_provider import FakeProviderTransport, LatencyModel, DEFAULT_LATENCIES
+from scenarios_examples import (
+    scenario_education,
+    scenario_health,
+    scenario_environment,
+    scenario_workplace,
+    scenario_justice,
+    scenario_entertainment
+)
+
+SCENARIOS = {
+    'education': scenario_education,
+    'health': scenario_health,
+    'environment': scenario_environment,
+    'workplace': scenario_workplace,
+    'justice': scenario_justice,
+    'entertainment': scenario_entertainment
+}
+
+# Order of the Tree of Life; classes missing from the sefirot package are skipped
+SEFIROT_CHAIN = (
+    'Keter', 'ChochmahGemini', 'Binah', 'Chesed', 'Gevurah',
+    'Tiferet', 'Netzach', 'Hod', 'Yesod', 'Malchut'
+)
+
+# Relative change beyond which a metric counts as a regression
+DEFAULT_TOLERANCE = 0.10
+
+
+def percentile(samples: List[float], q: float) -> float:
+    """Linear-interpolated percentile (q in 0-100)"""
+    ordered = sorted(samples)
+    if len(ordered) == 1:
+        return ordered[0]
+    rank = (len(ordered) - 1) * q / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """Latency summary in milliseconds"""
+    return {
+        'n': len(samples),
+        'mean_ms': round(statistics.mean(samples) * 1000, 3),
+        'p50_ms': round(percentile(samples, 50) * 1000, 3),
+        'p95_ms': round(percentile(samples, 95) * 1000, 3),
+        'p99_ms': round(percentile(samples, 99) * 1000, 3),
+        'max_ms': round(max(samples) * 1000, 3)
+    }
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process (None where unsupported)"""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is kilobytes on Linux, bytes on macOS
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def build_framework(transport: FakeProviderTransport) -> EthicaFramework:
+    return EthicaFramework(
+        'benchmark', 'benchmark', 'benchmark',
+        deduplicate_requests=False,
+        transport=transport
+    )
+
+
+def quiet() -> contextlib.AbstractContextManager:
+    """Swallow the framework's progress output"""
+    return contextlib.redirect_stdout(io.StringIO())
+
+
+def bench_pipeline(latencies: Dict[str, LatencyModel], repeats: int, seed: int) -> Dict[str, Any]:
+    """Sequential analyses; per-stage timings come from the framework's events"""
+    transport = FakeProviderTransport(latencies, seed=seed)
+    ethica = build_framework(transport)
+    end_to_end: List[float] = []
+    stages: Dict[str, List[float]] = {}
+
+    for _ in range(repeats):
+        for scenario in SCENARIOS.values():
+            started: Dict[str, float] = {}
+
+            def on_event(event):
+                if event.type == STAGE_STARTED:
+                    started[event.stage] = time.perf_counter()
+                elif event.type == STAGE_COMPLETED:
+                    elapsed = time.perf_counter() - started.pop(event.stage)
+                    stages.setdefault(event.stage, []).append(elapsed)
+
+            start = time.perf_counter()
+            with quiet():
+                ethica.analyze(scenario, on_event=on_event)
+            end_to_end.append(time.perf_counter() - start)
+
+    return {
+        'end_to_end': summarize(end_to_end),
+        'stages': {name: summarize(samples) for name, samples in stages.items()},
+        'provider_calls': transport.calls,
+        'simulated_provider_seconds': round(transport.simulated_seconds, 3)
+    }
+
+
+def bench_overhead(repeats: int, seed: int) -> Dict[str, Any]:
+    """End-to-end time with instant providers: pure framework cost"""
+    zero = {name: LatencyModel('constant', 0.0) for name in DEFAULT_LATENCIES}
+    return bench_pipeline(zero, repeats, seed)['end_to_end']
+
+
+def bench_throughput(
+    latencies: Dict[str, LatencyModel],
+    concurrency: int,
+    analyses: int,
+    use_async: bool,
+    seed: int
+) -> Dict[str, Any]:
+    """Analyses per second with `concurrency` analyses in flight"""
+    ethica = build_framework(FakeProviderTransport(latencies, seed=seed))
+    scenarios = list(SCENARIOS.values())
+    batch = [scenarios[i % len(scenarios)] for i in range(analyses)]
+
+    async def run_async() -> int:
+        failures = 0
+        async for item in ethica.analyze_batch_async(batch, max_concurrency=concurrency):
+            failures += item.error is not None
+        return failures
+
+    start = time.perf_counter()
+    with quiet():
+        if use_async:
+            failures = asyncio.run(run_async())
+        else:
+            failures = sum(
+                item.error is not None
+                for item in ethica.analyze_batch(batch, max_concurrency=concurrency)
+            )
+    elapsed = time.perf_counter() - start
+
+    return {
+        'mode': 'async' if use_async else 'thread',
+        'concurrency': concurrency,
+        'analyses': analyses,
+        'failures': failures,
+        'seconds': round(elapsed, 3),
+        'per_second': round(analyses / elapsed, 3)
+    }
+
+
+def bench_sefirot(repeats: int) -> Dict[str, Any]:
+    """
+    Each available Sefira's `process` over the example scenarios
+
+    Requires the sefirot package (and its `core` parent) to be importable
+    and ETHICA_TRANSPORT=replay with a recorded cassette for offline runs.
+    """
+    sys.path.insert(0, os.path.join(HERE, '..', '..'))
+    try:
+        import sefirot
+    except Exception as e:
+        return {'skipped': f"sefirot not importable: {e}"}
+
+    chain = [(name, getattr(sefirot, name, None)) for name in SEFIROT_CHAIN]
+    chain = [(name, cls) for name, cls in chain if cls is not None]
+    if not chain:
+        return {'skipped': "no Sefira classes importable (missing sefirot core package)"}
+
+    stages: Dict[str, List[float]] = {}
+    errors: Dict[str, str] = {}
+    end_to_end: List[float] = []
+    instances = []
+    for name, cls in chain:
+        try:
+            instances.append((name, cls()))
+        except Exception as e:
+            errors[name] = f"init: {e}"
+
+    for _ in range(repeats):
+        for scenario in SCENARIOS.values():
+            start = time.perf_counter()
+            for name, sefira in instances:
+                if name in errors:
+                    continue
+                stage_start = time.perf_counter()
+                try:
+                    sefira.process(dict(scenario))
+                except Exception as e:
+                    errors[name] = str(e)
+                    continue
+                stages.setdefault(name, []).append(time.perf_counter() - stage_start)
+            end_to_end.append(time.perf_counter() - start)
+
+    return {
+        'end_to_end': summarize(end_to_end),
+        'stages': {name: summarize(samples) for name, samples in stages.items()},
+        'errors': errors
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[Dict[str, Any]]:
+    """Metric-by-metric change against a stored baseline"""
+    rows = []
+
+    def add(metric: str, now: Optional[float], before: Optional[float], higher_is_better: bool = False):
+        if now is None or not before:
+            return
+        change = (now - before) / before
+        regressed = change < -tolerance if higher_is_better else change > tolerance
+        rows.append({
+            'metric': metric,
+            'baseline': before,
+            'current': now,
+            'change': round(change, 4),
+            'regression': regressed
+        })
+
+    for q in ('p50_ms', 'p95_ms', 'p99_ms'):
+        add(f"end_to_end.{q}",
+            current['pipeline']['end_to_end'][q],
+            baseline.get('pipeline', {}).get('end_to_end', {}).get(q))
+        add(f"overhead.{q}",
+            current['overhead'][q],
+            baseline.get('overhead', {}).get(q))
+
+    for stage, summary in current['pipeline']['stages'].items():
+        before = baseline.get('pipeline', {}).get('stages', {}).get(stage, {})
+        add(f"stage.{stage}.p95_ms", summary['p95_ms'], before.get('p95_ms'))
+
+    previous = {(t['mode'], t['concurrency']): t for t in baseline.get('throughput', [])}
+    for entry in current['throughput']:
+        before = previous.get((entry['mode'], entry['concurrency']), {})
+        add(f"throughput.{entry['mode']}.c{entry['concurrency']}",
+            entry['per_second'], before.get('per_second'), higher_is_better=True)
+
+    add('peak_rss_mb', current['peak_rss_mb'], baseline.get('peak_rss_mb'))
+    return rows
+
+
+def print_report(results: Dict[str, Any], comparison: Optional[List[Dict[str, Any]]]):
+    def line(label: str, summary: Dict[str, float]):
+        print(f"  {label:<28} p50 {summary['p50_ms']:>9.1f} ms   "
+              f"p95 {summary['p95_ms']:>9.1f} ms   p99 {summary['p99_ms']:>9.1f} ms")
+
+    print("\nPIPELINE (sequential)")
+    line('end-to-end', results['pipeline']['end_to_end'])
+    line('framework overhead', results['overhead'])
+    for stage, summary in results['pipeline']['stages'].items():
+        line(f"stage {stage}", summary)
+
+    print("\nTHROUGHPUT")
+    for entry in results['throughput']:
+        print(f"  {entry['mode']:<6} concurrency {entry['concurrency']:>3}: "
+              f"{entry['per_second']:>8.2f} analyses/s ({entry['analyses']} in {entry['seconds']}s)")
+
+    print("\nSEFIROT")
+    sefirot = results['sefirot']
+    if 'skipped' in sefirot:
+        print(f"  skipped: {sefirot['skipped']}")
+    else:
+        line('end-to-end', sefirot['end_to_end'])
+        for stage, summary in sefirot['stages'].items():
+            line(f"sefira {stage}", summary)
+
+    print(f"\nPeak RSS: {results['peak_rss_mb']} MB")
+
+    if comparison is not None:
+        print("\nBASELINE COMPARISON")
+        for row in comparison:
+            flag = '  REGRESSION' if row['regression'] else ''
+            print(f"  {row['metric']:<40} {row['baseline']:>10} -> {row['current']:>10} "
+                  f"({row['change']:+.1%}){flag}")
+
+
+def parse_latencies(specs: List[str]) -> Dict[str, LatencyModel]:
+    """['gemini=lognormal:0.8:0.4', 'all=constant:0.1'] -> models"""
+    latencies = {}
+    for spec in specs:
+        name, _, model = spec.partition('=')
+        targets = DEFAULT_LATENCIES if name == 'all' else [name]
+        for target in targets:
+            if target not in DEFAULT_LATENCIES:
+                raise SystemExit(f"Unknown provider '{target}' in --latency {spec}")
+            latencies[target] = LatencyModel.parse(model)
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ethica.AI pipeline benchmarks")
+    parser.add_argument('--repeats', type=int, default=5,
+                        help="Passes over the example scenarios for latency percentiles")
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 4, 16],
+                        help="Concurrency levels for the throughput runs")
+    parser.add_argument('--analyses', type=int, default=48,
+                        help="Analyses per throughput run")
+    parser.add_argument('--latency', action='append', default=[],
+                        metavar='PROVIDER=SPEC',
+                        help="Latency distribution, e.g. gemini=lognormal:0.8:0.4 or all=constant:0.05")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help="Write results as JSON to this file")
+    parser.add_argument('--baseline', help="Compare against a previous results file")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help="Relative change counted as a regression (default 0.10)")
+    parser.add_argument('--fail-on-regression', action='store_true',
+                        help="Exit with status 1 if any metric regressed")
+    args = parser.parse_args()
+
+    latencies = dict(DEFAULT_LATENCIES, **parse_latencies(args.latency))
+
+    print("Running pipeline latency benchmark...")
+    pipeline = bench_pipeline(latencies, args.repeats, args.seed)
+    overhead = bench_overhead(args.repeats, args.seed)
+
+    throughput = []
+    for use_async in (False, True):
+        for concurrency in args.concurrency:
+            print(f"Running throughput benchmark ({'async' if use_async else 'thread'}, "
+                  f"concurrency {concurrency})...")
+            throughput.append(
+                bench_throughput(latencies, concurrency, args.analyses, use_async, args.seed)
+            )
+
+    print("Running sefirot benchmark...")
+    sefirot = bench_sefirot(args.repeats)
+
+    results = {
+        'meta': {
+            'timestamp': datetime.now().isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'repeats': args.repeats,
+            'scenarios': list(SCENARIOS),
+            'seed': args.seed,
+            'latencies': {name: str(model) for name, model in latencies.items()}
+        },
+        'pipeline': pipeline,
+        'overhead': overhead,
+        'throughput': throughput,
+        'sefirot': sefirot,
+        'peak_rss_mb': peak_rss_mb()
+    }
+
+    comparison = None
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            comparison = compare(results, json.load(f), args.tolerance)
+        results['comparison'] = comparison
+
+    print_report(results, comparison)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        print(f"\nResults written to {args.output}")
+
+    if args.fail_on_regression and comparison and any(r['regression'] for r in comparison):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -14,6 +14,7 @@ setup(
         "google-generativeai>=0.3.0",
         "mistralai>=0.1.0",
         "requests>=2.31.0",
+        "httpx>=0.25.0",
         "python-dotenv>=1.0.0"
     ],
     classifiers=[
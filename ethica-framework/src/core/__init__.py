@@ -2,6 +2,7 @@
 Ethica.AI Framework - Core Module
 """
 
+from .events import AnalysisEvent, STAGE_STARTED, STAGE_COMPLETED, ANALYSIS_COMPLETED
 from .framework import (
     EthicaFramework,
     AnalysisResult,
@@ -14,8 +15,10 @@ from .framework import (
     SustainabilityEvaluation,
     ImplementationPlan,
     IntegrationResult,
-    Decision
+    Decision,
+    BatchItem
 )
+from providers.telemetry import Telemetry
 
 __all__ = [
     'EthicaFramework',
@@ -29,5 +32,11 @@ __all__ = [
     'SustainabilityEvaluation',
     'ImplementationPlan',
     'IntegrationResult',
-    'Decision'
+    'Decision',
+    'BatchItem',
+    'Telemetry',
+    'AnalysisEvent',
+    'STAGE_STARTED',
+    'STAGE_COMPLETED',
+    'ANALYSIS_COMPLETED'
 ]
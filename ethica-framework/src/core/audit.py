@@ -0,0 +1,256 @@
+"""
+Ethica.AI Framework - Audit Trail
+Append-only, compressed log of every analysis
+
+One record per analysis: scenario, every prompt and raw response,
+parsed module outputs and timings. Records are written as JSON lines
+into gzip segment files:
+
+    audit-20250106T093000-000001.jsonl.gz
+
+`append` only enqueues the record; a background thread serializes,
+compresses and fsyncs records in batches. Each batch is one gzip member
+(concatenated members form a valid gzip file), so a crash can lose at
+most the batch being written and never corrupts earlier records.
+
+Several processes (e.g. uvicorn workers) may share the directory:
+segments are created exclusively, so each file has a single writer.
+"""
+
+import atexit
+import glob
+import gzip
+import json
+import os
+import queue
+import threading
+import time
+import zlib
+from dataclasses import asdict, is_dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+
+SEGMENT_PATTERN = 'audit-*.jsonl.gz'
+SEGMENT_TIME_FORMAT = '%Y%m%dT%H%M%S'
+
+Timestamp = Union[str, datetime, None]
+
+
+def _default(value: Any) -> Any:
+    if is_dataclass(value):
+        return asdict(value)
+    return str(value)
+
+
+def _iso(value: Timestamp) -> Optional[str]:
+    if value is None or isinstance(value, str):
+        return value
+    return value.isoformat()
+
+
+class AuditLog:
+    """
+    Rotating writer for audit segments
+
+    A segment is closed once it reaches `max_segment_bytes` (compressed)
+    or is older than `max_segment_age` seconds. Buffered records are
+    written at least every `flush_interval` seconds, or as soon as
+    `batch_size` records are waiting.
+    """
+
+    def __init__(
+        self,
+        directory: str = 'audit_logs',
+        max_segment_bytes: int = 64 * 1024 * 1024,
+        max_segment_age: float = 24 * 3600,
+        flush_interval: float = 1.0,
+        batch_size: int = 256,
+        compresslevel: int = 6
+    ):
+        self.directory = directory
+        self.max_segment_bytes = max_segment_bytes
+        self.max_segment_age = max_segment_age
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.compresslevel = compresslevel
+        os.makedirs(directory, exist_ok=True)
+
+        self.records_written = 0
+        self.batches_written = 0
+        self.write_errors = 0
+
+        self._queue: 'queue.Queue[Optional[Dict[str, Any]]]' = queue.Queue()
+        self._file = None
+        self._segment_started = 0.0
+        self._sequence = max((sequence for _, sequence, _ in _segments(directory)), default=0)
+        self._closed = False
+        self._writer = threading.Thread(target=self._run, name='ethica-audit-writer', daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    def append(self, record: Dict[str, Any]):
+        """
+        Queue one record (never blocks on I/O)
+
+        Values may be dataclasses; they are serialized on the writer thread.
+        """
+        if self._closed:
+            raise RuntimeError("Audit log is closed")
+        record.setdefault('timestamp', datetime.utcnow().isoformat())
+        self._queue.put(record)
+
+    def flush(self, timeout: Optional[float] = None):
+        """Block until every record queued so far is on disk"""
+        done = threading.Event()
+        self._queue.put({'__flush__': done})
+        done.wait(timeout)
+
+    def close(self):
+        """Write outstanding records and stop the writer thread"""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._writer.join()
+        atexit.unregister(self.close)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'records_written': self.records_written,
+            'batches_written': self.batches_written,
+            'write_errors': self.write_errors,
+            'pending': self._queue.qsize()
+        }
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            batch: List[Dict[str, Any]] = []
+            waiters: List[threading.Event] = []
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                if '__flush__' in item:
+                    waiters.append(item['__flush__'])
+                    break
+                batch.append(item)
+
+            if batch:
+                self._write(batch)
+            for waiter in waiters:
+                waiter.set()
+
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _write(self, batch: List[Dict[str, Any]]):
+        lines = []
+        for record in batch:
+            try:
+                lines.append(json.dumps(record, ensure_ascii=False, default=_default))
+            except (TypeError, ValueError) as e:
+                self.write_errors += 1
+                print(f"⚠️  Audit record for {record.get('scenario_id')} not serializable: {e}")
+        if not lines:
+            return
+
+        member = gzip.compress(('\n'.join(lines) + '\n').encode('utf-8'), self.compresslevel)
+        try:
+            segment = self._segment(batch[0]['timestamp'])
+            segment.write(member)
+            segment.flush()
+            os.fsync(segment.fileno())
+        except OSError as e:
+            self.write_errors += len(lines)
+            print(f"⚠️  Audit log write failed ({len(lines)} records lost): {e}")
+            return
+        self.records_written += len(lines)
+        self.batches_written += 1
+
+    def _segment(self, first_timestamp: str):
+        """
+        Current segment file, rotated by size and age
+
+        A new segment is named after the timestamp of its first record,
+        which lets the reader skip segments by name. The file is created
+        exclusively; if another process took the name, the next sequence
+        number is tried.
+        """
+        now = time.time()
+        if self._file is not None and (
+            self._file.tell() >= self.max_segment_bytes
+            or now - self._segment_started >= self.max_segment_age
+        ):
+            self._file.close()
+            self._file = None
+
+        if self._file is None:
+            try:
+                started = datetime.fromisoformat(first_timestamp).strftime(SEGMENT_TIME_FORMAT)
+            except (TypeError, ValueError):
+                started = datetime.utcfromtimestamp(now).strftime(SEGMENT_TIME_FORMAT)
+            while self._file is None:
+                self._sequence += 1
+                path = os.path.join(self.directory, f"audit-{started}-{self._sequence:06d}.jsonl.gz")
+                try:
+                    self._file = open(path, 'xb')
+                except FileExistsError:
+                    continue
+            self._segment_started = now
+        return self._file
+
+
+def _segments(directory: str) -> List[Tuple[datetime, int, str]]:
+    """(start time, sequence, path) of every segment file, oldest first"""
+    segments = []
+    for path in glob.glob(os.path.join(directory, SEGMENT_PATTERN)):
+        _, started, sequence = os.path.basename(path).split('.')[0].split('-')
+        segments.append((datetime.strptime(started, SEGMENT_TIME_FORMAT), int(sequence), path))
+    return sorted(segments)
+
+
+def read_audit_log(
+    directory: str = 'audit_logs',
+    since: Timestamp = None,
+    until: Timestamp = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream audit records with since <= timestamp < until
+
+    Segments entirely outside the range are skipped by their file name;
+    the others are decompressed incrementally, one line at a time. A
+    partially written last batch (crash or concurrent writer) is skipped.
+    """
+    since, until = _iso(since), _iso(until)
+    segments = _segments(directory)
+    for i, (started, _, path) in enumerate(segments):
+        if until is not None and started.isoformat() >= until:
+            break
+        if since is not None and i + 1 < len(segments):
+            # Names have one-second resolution: the next segment's first
+            # record is earlier than its start time plus one second
+            if (segments[i + 1][0] + timedelta(seconds=1)).isoformat() <= since:
+                continue
+
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            try:
+                for line in f:
+                    if not line.endswith('\n'):
+                        break
+                    record = json.loads(line)
+                    timestamp = record.get('timestamp', '')
+                    if since is not None and timestamp < since:
+                        continue
+                    if until is not None and timestamp >= until:
+                        continue
+                    yield record
+            except (EOFError, zlib.error, gzip.BadGzipFile):
+                continue
@@ -0,0 +1,224 @@
+"""
+Ethica.AI Framework - Checkpoints
+Stage outputs of unfinished analyses, so they can be resumed
+
+Every stage finished by `EthicaFramework.analyze` is saved under the
+analysis' scenario_id. `analyze(scenario, resume=scenario_id)` loads
+them and only runs the stages that are missing, so a failure in module 9
+does not cost the eight LLM-backed stages before it. Checkpoints are
+deleted once the analysis completes.
+
+Module outputs are flat dataclasses; they are stored as JSON together
+with their qualified class name and rebuilt on load.
+"""
+
+import importlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import asdict, dataclass, field, is_dataclass
+from typing import Any, Dict, Optional, Tuple
+
+
+@dataclass
+class Checkpoint:
+    """Saved state of one unfinished analysis"""
+    scenario_id: str
+    scenario: Dict[str, Any]
+    timestamp: str  # Start of the original analysis
+    outputs: Dict[str, Any] = field(default_factory=dict)  # stage name -> module output
+
+
+def encode_output(output: Any) -> Tuple[str, str]:
+    """(type name, JSON) of a stage output"""
+    if is_dataclass(output):
+        cls = type(output)
+        return f"{cls.__module__}.{cls.__qualname__}", json.dumps(asdict(output), ensure_ascii=False)
+    return '', json.dumps(output, ensure_ascii=False)
+
+
+def decode_output(type_name: str, data: str) -> Any:
+    """Inverse of `encode_output`"""
+    value = json.loads(data)
+    if not type_name:
+        return value
+    module, _, name = type_name.rpartition('.')
+    cls = getattr(importlib.import_module(module), name)
+    if not is_dataclass(cls):
+        raise TypeError(f"Checkpointed type {type_name} is not a dataclass")
+    return cls(**value)
+
+
+class CheckpointStore:
+    """
+    Checkpoint store interface
+
+    `begin` records the scenario of a new analysis (a no-op when resuming),
+    `save` adds one finished stage, `load` returns everything saved under
+    a scenario_id, `delete` drops it.
+    """
+
+    def begin(self, scenario_id: str, scenario: Dict[str, Any], timestamp: str):
+        raise NotImplementedError
+
+    def save(self, scenario_id: str, stage: str, output: Any):
+        raise NotImplementedError
+
+    def load(self, scenario_id: str) -> Optional[Checkpoint]:
+        raise NotImplementedError
+
+    def delete(self, scenario_id: str):
+        raise NotImplementedError
+
+    def purge(self, older_than: float) -> int:
+        """Delete checkpoints not updated for `older_than` seconds"""
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class MemoryCheckpointStore(CheckpointStore):
+    """Checkpoints in process memory (resume after an exception, not a crash)"""
+
+    def __init__(self):
+        self._checkpoints: Dict[str, Checkpoint] = {}
+        self._updated: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def begin(self, scenario_id: str, scenario: Dict[str, Any], timestamp: str):
+        with self._lock:
+            if scenario_id not in self._checkpoints:
+                self._checkpoints[scenario_id] = Checkpoint(scenario_id, scenario, timestamp)
+            self._updated[scenario_id] = time.time()
+
+    def save(self, scenario_id: str, stage: str, output: Any):
+        with self._lock:
+            checkpoint = self._checkpoints.get(scenario_id)
+            if checkpoint is not None:
+                checkpoint.outputs[stage] = output
+                self._updated[scenario_id] = time.time()
+
+    def load(self, scenario_id: str) -> Optional[Checkpoint]:
+        with self._lock:
+            checkpoint = self._checkpoints.get(scenario_id)
+            if checkpoint is None:
+                return None
+            return Checkpoint(
+                checkpoint.scenario_id, checkpoint.scenario, checkpoint.timestamp,
+                dict(checkpoint.outputs)
+            )
+
+    def delete(self, scenario_id: str):
+        with self._lock:
+            self._checkpoints.pop(scenario_id, None)
+            self._updated.pop(scenario_id, None)
+
+    def purge(self, older_than: float) -> int:
+        cutoff = time.time() - older_than
+        with self._lock:
+            stale = [sid for sid, updated in self._updated.items() if updated < cutoff]
+            for scenario_id in stale:
+                del self._checkpoints[scenario_id]
+                del self._updated[scenario_id]
+        return len(stale)
+
+
+class SQLiteCheckpointStore(CheckpointStore):
+    """
+    Checkpoints in a SQLite file
+
+    Shared by every process using the same file, so a job claimed again
+    after its worker died resumes where that worker stopped.
+    """
+
+    def __init__(self, path: str = 'ethica_checkpoints.sqlite3'):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        # One small write per stage; losing the last one on power loss
+        # only means that stage runs again
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute('PRAGMA foreign_keys=ON')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS analyses ('
+            ' scenario_id TEXT PRIMARY KEY,'
+            ' scenario TEXT NOT NULL,'
+            ' timestamp TEXT NOT NULL,'
+            ' updated_at REAL NOT NULL)'
+        )
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS stages ('
+            ' scenario_id TEXT NOT NULL REFERENCES analyses ON DELETE CASCADE,'
+            ' stage TEXT NOT NULL,'
+            ' type TEXT NOT NULL,'
+            ' output TEXT NOT NULL,'
+            ' PRIMARY KEY (scenario_id, stage))'
+        )
+        self._conn.execute('CREATE INDEX IF NOT EXISTS analyses_updated ON analyses (updated_at)')
+        self._conn.commit()
+
+    def begin(self, scenario_id: str, scenario: Dict[str, Any], timestamp: str):
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR IGNORE INTO analyses (scenario_id, scenario, timestamp, updated_at)'
+                ' VALUES (?, ?, ?, ?)',
+                (scenario_id, json.dumps(scenario, ensure_ascii=False), timestamp, time.time())
+            )
+            self._conn.commit()
+
+    def save(self, scenario_id: str, stage: str, output: Any):
+        type_name, data = encode_output(output)
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO stages (scenario_id, stage, type, output) VALUES (?, ?, ?, ?)',
+                (scenario_id, stage, type_name, data)
+            )
+            self._conn.execute(
+                'UPDATE analyses SET updated_at = ? WHERE scenario_id = ?', (time.time(), scenario_id)
+            )
+            self._conn.commit()
+
+    def load(self, scenario_id: str) -> Optional[Checkpoint]:
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT scenario, timestamp FROM analyses WHERE scenario_id = ?', (scenario_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            stages = self._conn.execute(
+                'SELECT stage, type, output FROM stages WHERE scenario_id = ?', (scenario_id,)
+            ).fetchall()
+        outputs = {stage: decode_output(type_name, data) for stage, type_name, data in stages}
+        return Checkpoint(scenario_id, json.loads(row[0]), row[1], outputs)
+
+    def delete(self, scenario_id: str):
+        with self._lock:
+            self._conn.execute('DELETE FROM analyses WHERE scenario_id = ?', (scenario_id,))
+            self._conn.commit()
+
+    def purge(self, older_than: float) -> int:
+        with self._lock:
+            cursor = self._conn.execute(
+                'DELETE FROM analyses WHERE updated_at < ?', (time.time() - older_than,)
+            )
+            self._conn.commit()
+            return cursor.rowcount
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def checkpoints_from_env() -> Optional[CheckpointStore]:
+    """SQLite checkpoints at ETHICA_CHECKPOINT_PATH (else none)"""
+    path = os.getenv('ETHICA_CHECKPOINT_PATH')
+    return SQLiteCheckpointStore(path) if path else None
+
+
+def checkpoint_ttl() -> float:
+    """Seconds an unfinished analysis stays resumable (ETHICA_CHECKPOINT_TTL, default one day)"""
+    return float(os.getenv('ETHICA_CHECKPOINT_TTL', 24 * 3600))
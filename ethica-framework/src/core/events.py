@@ -0,0 +1,31 @@
+"""
+Ethica.AI Framework - Analysis Events
+Progress notifications emitted while an analysis runs
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+
+STAGE_STARTED = 'stage_started'
+STAGE_COMPLETED = 'stage_completed'
+ANALYSIS_COMPLETED = 'analysis_completed'
+
+
+@dataclass
+class AnalysisEvent:
+    """
+    One progress notification
+
+    For STAGE_COMPLETED, `result` is the module output (ImpactScore,
+    InsightAnalysis, ...); for ANALYSIS_COMPLETED it is the AnalysisResult.
+    """
+    type: str
+    scenario_id: str
+    stage: Optional[str] = None
+    step: int = 0  # 1 to 10, 0 for analysis-level events
+    total_steps: int = 10
+    result: Any = None
+
+
+EventCallback = Callable[[AnalysisEvent], None]
@@ -8,10 +8,39 @@ Licensed under MIT License
 
 import os
 import json
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+import asyncio
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Any, Callable, Iterable, Iterator, AsyncIterator
+from dataclasses import dataclass, asdict, field, replace
 from datetime import datetime
 
+from .pipeline import Stage, StageGraph
+from .metrics import FrameworkMetrics
+from .results import ResultStore, store_from_env
+from .audit import AuditLog
+from .checkpoints import CheckpointStore, checkpoints_from_env
+from .incremental import memoized, reuse_scope
+from .events import AnalysisEvent, EventCallback, STAGE_STARTED, STAGE_COMPLETED, ANALYSIS_COMPLETED
+from providers import (
+    LLMProvider, ResponseCache, MemoryCache, SQLiteCache, TieredCache, TokenBucket,
+    SingleFlight, Transport, Cassette, RecordingTransport, ReplayTransport,
+    RetryPolicy, HedgePolicy, CircuitBreakers, DeadlineExceeded, deadline_scope
+)
+from providers.fake_server import synthetic_response
+from modules.pre_screen import PreScreen, ScreenVerdict, PASS, REJECT
+from providers.telemetry import Telemetry, TelemetryCollector, traced, traced_async
+
+
+# Names supplied to the stage graph by `analyze` itself
+PIPELINE_INPUTS = ('scenario', 'impact_score')
+TOTAL_STEPS = 10
+
+STRATEGIC_LAYER = "STRATEGIC LAYER: Analyzing intent..."
+OPERATIONAL_LAYER = "OPERATIONAL LAYER: Analyzing forces..."
+TACTICAL_LAYER = "TACTICAL LAYER: Analyzing structure..."
+EXECUTION_LAYER = "EXECUTION LAYER: Synthesizing decision..."
+
 
 @dataclass
 class ImpactScore:
@@ -141,6 +170,29 @@ class AnalysisResult:
     implementation: ImplementationPlan
     integration: IntegrationResult
     decision: Decision
+    
+    # Per-stage timings, tokens and cost (when telemetry is enabled)
+    telemetry: Optional[Dict[str, Any]] = None
+    
+    # Set when the deadline ran out: the listed stages did not finish and
+    # their results are None
+    incomplete: bool = False
+    pending_stages: List[str] = field(default_factory=list)
+    
+    # Stages whose inputs matched an earlier run and whose stored output
+    # was reused instead of calling the model again
+    reused_stages: List[str] = field(default_factory=list)
+    
+    # Local pre-screen verdict (None when the pre-screen is disabled)
+    screening: Optional[ScreenVerdict] = None
+
+
+@dataclass
+class BatchItem:
+    """One scenario outcome from a batch analysis"""
+    index: int  # Position in the submitted batch
+    result: Optional[AnalysisResult] = None
+    error: Optional[Exception] = None
 
 
 class EthicaFramework:
@@ -161,7 +213,23 @@ class EthicaFramework:
         deepseek_api_key: Optional[str] = None,
         impact_threshold: float = 0.60,
         enable_audit_trail: bool = False,
-        organization_id: Optional[str] = None
+        organization_id: Optional[str] = None,
+        cache: Optional[ResponseCache] = None,
+        rate_limits: Optional[Dict[str, float]] = None,
+        deduplicate_requests: bool = True,
+        transport: Optional[Transport] = None,
+        enable_telemetry: bool = False,
+        telemetry_exporter: Optional[Callable[[Telemetry], None]] = None,
+        metrics: Optional[FrameworkMetrics] = None,
+        result_store: Optional[ResultStore] = None,
+        audit_log: Optional[AuditLog] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        analysis_deadline: Optional[float] = None,
+        circuit_breakers: Optional[CircuitBreakers] = None,
+        checkpoints: Optional[CheckpointStore] = None,
+        stage_cache: Optional[ResponseCache] = None,
+        pre_screen: Optional[PreScreen] = None
     ):
         """
         Initialize Ethica Framework
@@ -171,8 +239,53 @@ class EthicaFramework:
             mistral_api_key: Mistral AI API key (for Model A - neutral arbiter)
             deepseek_api_key: DeepSeek API key (for Model C - collective focus)
             impact_threshold: Minimum impact score for approval (default 0.60)
-            enable_audit_trail: Enable detailed logging
+            enable_audit_trail: Append every analysis (scenario, prompts, raw
+                responses, parsed outputs, timings) to a compressed audit log
+                in ETHICA_AUDIT_DIR (default ./audit_logs)
             organization_id: Organization identifier for multi-tenant setup
+            cache: Response cache shared by all provider calls
+                (default: memory + SQLite at ETHICA_CACHE_PATH if set, else none)
+            rate_limits: Requests per second per provider, e.g.
+                {'gemini': 10, 'mistral': 2, 'deepseek': 5}
+                (default: ETHICA_RATE_LIMIT_<PROVIDER> variables, else unlimited)
+            deduplicate_requests: Collapse identical concurrent provider
+                calls into one upstream request
+            transport: Carrier for every provider call, e.g. a
+                RecordingTransport or ReplayTransport for offline runs
+                (default: from ETHICA_TRANSPORT, else live SDK calls)
+            enable_telemetry: Record wall time, tokens, retries and cache
+                status of every stage and provider call in
+                `AnalysisResult.telemetry` (also enabled by ETHICA_TELEMETRY=1)
+            telemetry_exporter: Called with the Telemetry of each finished
+                analysis, e.g. to ship spans to a metrics backend
+                (implies enable_telemetry)
+            metrics: Prometheus metrics updated by every analysis
+                (in-flight count, stage and provider latency, errors, retries)
+            result_store: Persists every completed AnalysisResult for
+                later queries (default: SQLite at ETHICA_RESULTS_PATH if set)
+            audit_log: Audit log to write to (implies enable_audit_trail)
+            retry_policy: Retries of transient provider errors (429, 5xx,
+                timeouts) with decorrelated-jitter backoff
+                (default: ETHICA_RETRY_ATTEMPTS attempts, else 4)
+            hedge_policy: Race a second request against provider calls
+                slower than their p95 latency
+                (default: enabled by ETHICA_HEDGE=1, else off)
+            analysis_deadline: Seconds an analysis may take; retries and
+                hedges never run past it
+                (default: ETHICA_ANALYSIS_DEADLINE, else unlimited)
+            circuit_breakers: Breakers that stop calling a failing or slow
+                provider endpoint so its fallback answers at once
+                (default: on unless ETHICA_CIRCUIT_BREAKER=0)
+            checkpoints: Saves each finished stage so a failed analysis
+                can be resumed with `analyze(..., resume=scenario_id)`
+                (default: SQLite at ETHICA_CHECKPOINT_PATH if set)
+            stage_cache: Stage outputs by input fingerprint; rerunning an
+                edited scenario only recomputes the stages whose inputs
+                changed (default: off; with ETHICA_INCREMENTAL=1, the
+                response cache if configured, else in memory)
+            pre_screen: Local keyword screen run before the Purpose
+                Validator; rejected scenarios cost no provider call
+                (default: enabled by ETHICA_PRE_SCREEN=1, else off)
         """
         # API keys
         self.gemini_api_key = gemini_api_key or os.getenv('GEMINI_API_KEY')
@@ -181,8 +294,21 @@ class EthicaFramework:
         
         # Configuration
         self.impact_threshold = impact_threshold
-        self.enable_audit_trail = enable_audit_trail
+        self.enable_audit_trail = enable_audit_trail or audit_log is not None
+        if audit_log is None and enable_audit_trail:
+            audit_log = AuditLog(os.getenv('ETHICA_AUDIT_DIR', 'audit_logs'))
+        self.audit_log = audit_log
         self.organization_id = organization_id
+        self.cache = cache if cache is not None else self._cache_from_env()
+        self.telemetry_exporter = telemetry_exporter
+        self.metrics = metrics
+        self.result_store = result_store if result_store is not None else store_from_env()
+        self.checkpoints = checkpoints if checkpoints is not None else checkpoints_from_env()
+        self.enable_telemetry = (
+            enable_telemetry
+            or telemetry_exporter is not None
+            or os.getenv('ETHICA_TELEMETRY', '').lower() in ('1', 'true', 'yes')
+        )
         
         # Initialize modules
         from modules.purpose_validator import PurposeValidator
@@ -197,7 +323,7 @@ class EthicaFramework:
         from modules.decision_orchestrator import DecisionOrchestrator
         
         self.purpose_validator = PurposeValidator(self.gemini_api_key)
-        self.insight_generator = InsightGenerator(self.mistral_api_key)
+        self.insight_generator = InsightGenerator(self.mistral_api_key, self.gemini_api_key)
         self.context_analyzer = ContextAnalyzer(
             self.gemini_api_key,
             self.deepseek_api_key
@@ -209,8 +335,310 @@ class EthicaFramework:
         self.implementation_planner = ImplementationPlanner(self.gemini_api_key)
         self.integration_engine = IntegrationEngine(self.gemini_api_key)
         self.decision_orchestrator = DecisionOrchestrator(self.gemini_api_key)
+        
+        if self.cache is not None:
+            for provider in self.providers():
+                provider.cache = self.cache
+        
+        # One token bucket per provider, shared by every module using it
+        self.rate_limiters = {
+            name: TokenBucket(rate)
+            for name, rate in (rate_limits or self._rate_limits_from_env()).items()
+        }
+        for provider in self.providers():
+            provider.rate_limiter = self.rate_limiters.get(provider.name)
+        
+        # Identical in-flight requests (e.g. the same preset scenario picked
+        # by several users at once) share a single upstream call
+        self.single_flight = SingleFlight() if deduplicate_requests else None
+        for provider in self.providers():
+            provider.single_flight = self.single_flight
+        
+        self.transport = transport if transport is not None else self._transport_from_env()
+        for provider in self.providers():
+            provider.transport = self.transport
+        
+        # One brownout in one provider should not fail the whole analysis
+        self.retry_policy = retry_policy if retry_policy is not None else self._retry_policy_from_env()
+        self.hedge_policy = hedge_policy if hedge_policy is not None else self._hedge_policy_from_env()
+        for provider in self.providers():
+            provider.retry_policy = self.retry_policy
+            provider.hedge_policy = self.hedge_policy
+        
+        self.circuit_breakers = (
+            circuit_breakers if circuit_breakers is not None else self._circuit_breakers_from_env()
+        )
+        for provider in self.providers():
+            provider.breaker = self.circuit_breakers.get(provider) if self.circuit_breakers else None
+        
+        if analysis_deadline is None and os.getenv('ETHICA_ANALYSIS_DEADLINE'):
+            analysis_deadline = float(os.getenv('ETHICA_ANALYSIS_DEADLINE'))
+        self.analysis_deadline = analysis_deadline
+        
+        # Abusive or junk submissions are turned away before any LLM call
+        self.pre_screen = pre_screen if pre_screen is not None else self._pre_screen_from_env()
+        
+        # A rerun after editing the scenario reuses every stage whose
+        # inputs did not change
+        self.stage_cache = stage_cache if stage_cache is not None else self._stage_cache_from_env()
+        
+        # [1] Purpose Validator gates the rest of the graph (early rejection)
+        self._purpose_stage = self._wrap(Stage(
+            'impact_score', self.purpose_validator.validate,
+            inputs=('scenario',),
+            label='Purpose Validator',
+            step=1,
+            layer=STRATEGIC_LAYER,
+            run_async=self.purpose_validator.validate_async
+        ))
+        self._stage_graph = StageGraph(
+            [self._wrap(stage) for stage in self._build_stages()],
+            provided=PIPELINE_INPUTS
+        )
+    
+    @property
+    def modules(self) -> List[Any]:
+        """The ten analysis modules, in pipeline order"""
+        return [
+            self.purpose_validator,
+            self.insight_generator,
+            self.context_analyzer,
+            self.opportunity_identifier,
+            self.risk_assessor,
+            self.conflict_resolver,
+            self.sustainability_evaluator,
+            self.implementation_planner,
+            self.integration_engine,
+            self.decision_orchestrator
+        ]
+    
+    def providers(self) -> List[LLMProvider]:
+        """Every provider client used by the modules"""
+        return [
+            value
+            for module in self.modules
+            for value in vars(module).values()
+            if isinstance(value, LLMProvider)
+        ]
+    
+    def close(self):
+        """Release provider clients and HTTP sessions; flush the audit log"""
+        for provider in self.providers():
+            provider.close()
+        if self.audit_log is not None:
+            self.audit_log.close()
+    
+    async def aclose(self):
+        """Async counterpart of `close` (for application shutdown hooks)"""
+        for provider in self.providers():
+            await provider.aclose()
+        if self.audit_log is not None:
+            await asyncio.get_running_loop().run_in_executor(None, self.audit_log.close)
+    
+    @staticmethod
+    def _rate_limits_from_env() -> Dict[str, float]:
+        """ETHICA_RATE_LIMIT_GEMINI / _MISTRAL / _DEEPSEEK (requests per second)"""
+        limits = {}
+        for name in ('gemini', 'mistral', 'deepseek'):
+            value = os.getenv(f'ETHICA_RATE_LIMIT_{name.upper()}')
+            if value:
+                limits[name] = float(value)
+        return limits
+    
+    @staticmethod
+    def _retry_policy_from_env() -> RetryPolicy:
+        """ETHICA_RETRY_ATTEMPTS attempts per call (1 disables retries)"""
+        return RetryPolicy(max_attempts=int(os.getenv('ETHICA_RETRY_ATTEMPTS', 4)))
+    
+    @staticmethod
+    def _hedge_policy_from_env() -> Optional[HedgePolicy]:
+        """
+        Hedging if ETHICA_HEDGE=1; ETHICA_HEDGE_DELAY fixes the delay
+        (seconds) instead of the provider's p95 latency
+        """
+        if os.getenv('ETHICA_HEDGE', '').lower() not in ('1', 'true', 'yes'):
+            return None
+        delay = os.getenv('ETHICA_HEDGE_DELAY')
+        return HedgePolicy(delay=float(delay) if delay else None)
+    
+    @staticmethod
+    def _circuit_breakers_from_env() -> Optional[CircuitBreakers]:
+        """
+        Circuit breakers unless ETHICA_CIRCUIT_BREAKER=0; a breaker opens
+        when half of the recent calls (each judged after its retries)
+        failed or took longer than ETHICA_BREAKER_SLOW_CALL seconds
+        (default 15), and probes again after ETHICA_BREAKER_OPEN_SECONDS
+        (default 30)
+        """
+        if os.getenv('ETHICA_CIRCUIT_BREAKER', '1').lower() in ('0', 'false', 'no'):
+            return None
+        return CircuitBreakers(
+            slow_call_seconds=float(os.getenv('ETHICA_BREAKER_SLOW_CALL', 15)),
+            open_seconds=float(os.getenv('ETHICA_BREAKER_OPEN_SECONDS', 30))
+        )
+    
+    @staticmethod
+    def _pre_screen_from_env() -> Optional[PreScreen]:
+        """
+        Pre-screen if ETHICA_PRE_SCREEN=1; ETHICA_SCREEN_REJECT and
+        ETHICA_SCREEN_FLAG set the risk thresholds (default 0.9 and 0.5)
+        """
+        if os.getenv('ETHICA_PRE_SCREEN', '').lower() not in ('1', 'true', 'yes'):
+            return None
+        return PreScreen(
+            reject_threshold=float(os.getenv('ETHICA_SCREEN_REJECT', 0.9)),
+            flag_threshold=float(os.getenv('ETHICA_SCREEN_FLAG', 0.5))
+        )
+    
+    def _stage_cache_from_env(self) -> Optional[ResponseCache]:
+        """
+        Stage reuse only with ETHICA_INCREMENTAL=1 (a rerun of the same
+        scenario would otherwise return stored outputs unnoticed). Stage
+        outputs go next to the provider responses if a response cache is
+        configured, else in memory
+        """
+        if os.getenv('ETHICA_INCREMENTAL', '0').lower() not in ('1', 'true', 'yes'):
+            return None
+        if self.cache is not None:
+            return self.cache
+        return MemoryCache(ttl=float(os.getenv('ETHICA_CACHE_TTL', 3600)))
+    
+    @staticmethod
+    def _cache_from_env() -> Optional[ResponseCache]:
+        """Tiered response cache if ETHICA_CACHE_PATH is configured"""
+        path = os.getenv('ETHICA_CACHE_PATH')
+        if not path:
+            return None
+        ttl = float(os.getenv('ETHICA_CACHE_TTL', 7 * 24 * 3600))
+        return TieredCache(
+            MemoryCache(ttl=ttl),
+            SQLiteCache(path, ttl=ttl)
+        )
+    
+    @staticmethod
+    def _transport_from_env() -> Optional[Transport]:
+        """
+        ETHICA_TRANSPORT selects how provider calls are carried:
+        
+        - live (default): SDK / HTTP calls
+        - record: live calls saved to ETHICA_CASSETTE_PATH
+        - replay: responses served from ETHICA_CASSETTE_PATH only
+        - synthetic: cassette if configured, else responses generated
+          from each prompt's JSON template (no keys or network needed)
+        
+        Replays sleep ETHICA_REPLAY_LATENCY seconds per call ('recorded'
+        reuses the recorded latency), varied by +/- ETHICA_REPLAY_JITTER.
+        """
+        mode = os.getenv('ETHICA_TRANSPORT', 'live').lower()
+        if mode == 'live':
+            return None
+        
+        path = os.getenv('ETHICA_CASSETTE_PATH')
+        if mode == 'record':
+            if not path:
+                raise ValueError("ETHICA_TRANSPORT=record requires ETHICA_CASSETTE_PATH")
+            return RecordingTransport(Cassette(path))
+        if mode not in ('replay', 'synthetic'):
+            raise ValueError(f"Unknown ETHICA_TRANSPORT: {mode}")
+        if mode == 'replay' and not path:
+            raise ValueError("ETHICA_TRANSPORT=replay requires ETHICA_CASSETTE_PATH")
+        
+        latency = os.getenv('ETHICA_REPLAY_LATENCY', '0')
+        return ReplayTransport(
+            Cassette(path) if path else None,
+            latency=None if latency == 'recorded' else float(latency),
+            jitter=float(os.getenv('ETHICA_REPLAY_JITTER', 0)),
+            responder=synthetic_response if mode == 'synthetic' else None
+        )
     
-    def analyze(self, scenario: Dict[str, str]) -> AnalysisResult:
+    def _build_stages(self) -> List[Stage]:
+        """Declare modules 2-10 and the outputs each one depends on"""
+        return [
+            Stage(
+                'insight_analysis', self.insight_generator.generate,
+                inputs=('scenario', 'impact_score'),
+                label='Insight Generator (Mistral AI)',
+                step=2,
+                layer=STRATEGIC_LAYER,
+                run_async=self.insight_generator.generate_async
+            ),
+            Stage(
+                'perspective_comparison', self.context_analyzer.analyze,
+                inputs=('scenario', 'insight_analysis'),
+                label='Context Analyzer (Multi-perspective)',
+                step=3,
+                layer=STRATEGIC_LAYER,
+                run_async=self.context_analyzer.analyze_async
+            ),
+            Stage(
+                'opportunity_assessment', self.opportunity_identifier.identify,
+                inputs=('scenario', 'perspective_comparison'),
+                label='Opportunity Identifier',
+                step=4,
+                layer=OPERATIONAL_LAYER,
+                run_async=self.opportunity_identifier.identify_async
+            ),
+            Stage(
+                'risk_assessment', self.risk_assessor.assess,
+                inputs=('scenario', 'perspective_comparison'),
+                label='Risk Assessor',
+                step=5,
+                layer=OPERATIONAL_LAYER,
+                run_async=self.risk_assessor.assess_async
+            ),
+            Stage(
+                'conflict_resolution', self.conflict_resolver.resolve,
+                inputs=('opportunity_assessment', 'risk_assessment'),
+                label='Conflict Resolver',
+                step=6,
+                layer=OPERATIONAL_LAYER,
+                run_async=self.conflict_resolver.resolve_async
+            ),
+            Stage(
+                'sustainability', self.sustainability_evaluator.evaluate,
+                inputs=('scenario', 'conflict_resolution'),
+                label='Sustainability Evaluator',
+                step=7,
+                layer=TACTICAL_LAYER,
+                run_async=self.sustainability_evaluator.evaluate_async
+            ),
+            Stage(
+                'implementation', self.implementation_planner.plan,
+                inputs=('scenario', 'conflict_resolution'),
+                label='Implementation Planner',
+                step=8,
+                layer=TACTICAL_LAYER,
+                run_async=self.implementation_planner.plan_async
+            ),
+            Stage(
+                'integration', self.integration_engine.integrate,
+                inputs=(
+                    'impact_score', 'insight_analysis', 'perspective_comparison',
+                    'opportunity_assessment', 'risk_assessment',
+                    'conflict_resolution', 'sustainability', 'implementation'
+                ),
+                label='Integration Engine',
+                step=9,
+                layer=EXECUTION_LAYER,
+                run_async=self.integration_engine.integrate_async
+            ),
+            Stage(
+                'decision', self.decision_orchestrator.orchestrate,
+                inputs=('integration',),
+                label='Decision Orchestrator',
+                step=10,
+                layer=EXECUTION_LAYER,
+                run_async=self.decision_orchestrator.orchestrate_async
+            ),
+        ]
+    
+    def analyze(
+        self,
+        scenario: Optional[Dict[str, str]],
+        on_event: Optional[EventCallback] = None,
+        deadline: Optional[float] = None,
+        resume: Optional[str] = None
+    ) -> AnalysisResult:
         """
         Analyze ethical scenario through 10-module pipeline
         
@@ -219,102 +647,478 @@ class EthicaFramework:
                 - action: str (proposed action)
                 - context: str (detailed context)
                 - stakeholders: List[str] (optional)
+            on_event: Optional callback receiving an AnalysisEvent when each
+                module starts and finishes, and when the analysis completes
+            deadline: Seconds this analysis may take (the framework's
+                `analysis_deadline` still applies if shorter). Every
+                provider call is bounded by the time left; once it is
+                gone no further module is started.
+            resume: scenario_id of an earlier analysis that failed or ran
+                out of time. Its checkpointed stages are reused and only
+                the missing ones run (`scenario` may then be None). With
+                no checkpoint under that id, a new analysis starts with it.
         
         Returns:
-            AnalysisResult with complete analysis
+            AnalysisResult with complete analysis, or a partial one with
+            `incomplete=True` if the deadline ran out
         """
-        scenario_id = self._generate_scenario_id()
-        timestamp = datetime.utcnow().isoformat()
+        scenario_id, scenario, restored, timestamp = self._begin(scenario, resume)
+        collector = self._start_telemetry(scenario_id)
+        try:
+            with collector.activate() if collector else nullcontext(), reuse_scope() as reused, \
+                    deadline_scope(self.analysis_deadline), deadline_scope(deadline):
+                screening = self._screen(scenario, scenario_id, on_event)
+                if screening is not None and screening.verdict == REJECT:
+                    result = self._reject_screened(scenario_id, timestamp, screening)
+                else:
+                    result = self._analyze(scenario, scenario_id, on_event, restored, timestamp)
+            result.reused_stages = self._in_pipeline_order(reused)
+            result.screening = screening
+        except BaseException as e:
+            self._finish_telemetry(collector, scenario, None, e)
+            self._keep_checkpoint(scenario_id)
+            raise
+        self._finish_telemetry(collector, scenario, result)
+        self._end(result)
+        if self.result_store is not None:
+            self.result_store.save(result, self.organization_id)
         
-        # STRATEGIC LAYER
-        print("🔷 STRATEGIC LAYER: Analyzing intent...")
+        self._emit(on_event, AnalysisEvent(ANALYSIS_COMPLETED, scenario_id, result=result))
+        return result
+    
+    def _analyze(
+        self,
+        scenario: Dict[str, str],
+        scenario_id: str,
+        on_event: Optional[EventCallback],
+        restored: Dict[str, Any],
+        timestamp: str
+    ) -> AnalysisResult:
+        """Pipeline body of `analyze`"""
+        on_start, on_complete = self._progress_hooks(scenario_id, on_event, restored)
         
+        # STRATEGIC LAYER
         # [1] Purpose Validator
-        print("  [1/10] Purpose Validator...")
-        impact_score = self.purpose_validator.validate(scenario)
+        purpose = self._purpose_stage
+        impact_score = restored.get(purpose.name)
+        if impact_score is None:
+            on_start(purpose)
+            try:
+                impact_score = purpose.run(scenario=scenario)
+            except DeadlineExceeded:
+                return self._deadline_result(scenario_id, timestamp, {})
+            on_complete(purpose, impact_score)
         
         if not impact_score.manifestation_valid:
             # Early rejection
-            decision = Decision(
-                approved=False,
-                approval_type="REJECTED",
-                confidence=1.0,
-                actions=[],
-                conditions=[],
-                reasoning=f"Failed purpose validation. Impact score: {impact_score.score:.1%}"
+            result = self._reject(scenario_id, timestamp, impact_score)
+        else:
+            # [2-10] Remaining modules run as a dependency graph: independent
+            # stages (Opportunities/Risks, Sustainability/Implementation)
+            # are executed concurrently as soon as their inputs are ready
+            outputs = self._stage_graph.run(
+                {**restored, 'scenario': scenario, 'impact_score': impact_score},
+                on_stage_start=on_start,
+                on_stage_complete=on_complete
             )
+            if self._stage_graph.missing(outputs):
+                return self._deadline_result(scenario_id, timestamp, outputs)
             
-            return self._build_early_rejection_result(
-                scenario_id, timestamp, impact_score, decision
+            print("\n✅ Analysis complete!")
+            result = self._build_result(scenario_id, timestamp, outputs)
+
+        return result
+    
+    async def analyze_async(
+        self,
+        scenario: Optional[Dict[str, str]],
+        on_event: Optional[EventCallback] = None,
+        deadline: Optional[float] = None,
+        resume: Optional[str] = None
+    ) -> AnalysisResult:
+        """
+        Coroutine variant of `analyze`
+        
+        Uses the providers' async clients, so a single event loop can
+        serve many analyses concurrently. Produces the same AnalysisResult.
+        Cancelling the coroutine cancels every provider call in flight.
+        Checkpoint reads and writes run in the default executor, off the
+        event loop.
+        """
+        loop = asyncio.get_running_loop()
+        scenario_id, scenario, restored, timestamp = await loop.run_in_executor(
+            None, self._begin, scenario, resume
+        )
+        collector = self._start_telemetry(scenario_id)
+        saves: List[asyncio.Future] = []
+        try:
+            with collector.activate() if collector else nullcontext(), reuse_scope() as reused, \
+                    deadline_scope(self.analysis_deadline), deadline_scope(deadline):
+                screening = self._screen(scenario, scenario_id, on_event)
+                if screening is not None and screening.verdict == REJECT:
+                    result = self._reject_screened(scenario_id, timestamp, screening)
+                else:
+                    result = await self._analyze_async(
+                        scenario, scenario_id, on_event, restored, timestamp, saves
+                    )
+            result.reused_stages = self._in_pipeline_order(reused)
+            result.screening = screening
+            # Every stage is saved before the checkpoint is dropped
+            await asyncio.gather(*saves)
+        except BaseException as e:
+            self._finish_telemetry(collector, scenario, None, e)
+            self._keep_checkpoint(scenario_id)
+            raise
+        self._finish_telemetry(collector, scenario, result)
+        await loop.run_in_executor(None, self._end, result)
+        if self.result_store is not None:
+            await loop.run_in_executor(
+                None, self.result_store.save, result, self.organization_id
             )
         
-        # [2] Insight Generator (Mistral AI - Neutral)
-        print("  [2/10] Insight Generator (Mistral AI)...")
-        insight_analysis = self.insight_generator.generate(scenario, impact_score)
+        self._emit(on_event, AnalysisEvent(ANALYSIS_COMPLETED, scenario_id, result=result))
+        return result
+    
+    async def _analyze_async(
+        self,
+        scenario: Dict[str, str],
+        scenario_id: str,
+        on_event: Optional[EventCallback],
+        restored: Dict[str, Any],
+        timestamp: str,
+        saves: List[asyncio.Future]
+    ) -> AnalysisResult:
+        """Pipeline body of `analyze_async`"""
+        on_start, on_complete = self._progress_hooks(scenario_id, on_event, restored, saves)
         
-        # [3] Context Analyzer (Multi-provider)
-        print("  [3/10] Context Analyzer (Multi-perspective)...")
-        perspective_comparison = self.context_analyzer.analyze(
-            scenario, insight_analysis
-        )
+        purpose = self._purpose_stage
+        impact_score = restored.get(purpose.name)
+        if impact_score is None:
+            on_start(purpose)
+            try:
+                impact_score = await purpose.run_async(scenario=scenario)
+            except DeadlineExceeded:
+                return self._deadline_result(scenario_id, timestamp, {})
+            on_complete(purpose, impact_score)
         
-        # OPERATIONAL LAYER
-        print("\n🔷 OPERATIONAL LAYER: Analyzing forces...")
+        if not impact_score.manifestation_valid:
+            result = self._reject(scenario_id, timestamp, impact_score)
+        else:
+            outputs = await self._stage_graph.run_async(
+                {**restored, 'scenario': scenario, 'impact_score': impact_score},
+                on_stage_start=on_start,
+                on_stage_complete=on_complete
+            )
+            if self._stage_graph.missing(outputs):
+                return self._deadline_result(scenario_id, timestamp, outputs)
+            
+            print("\n✅ Analysis complete!")
+            result = self._build_result(scenario_id, timestamp, outputs)
         
-        # [4] Opportunity Identifier
-        print("  [4/10] Opportunity Identifier...")
-        opportunity_assessment = self.opportunity_identifier.identify(
-            scenario, perspective_comparison
-        )
+        return result
+    
+    def analyze_batch(
+        self,
+        scenarios: Iterable[Dict[str, str]],
+        max_concurrency: int = 4,
+        deadline: Optional[float] = None
+    ) -> Iterator[BatchItem]:
+        """
+        Analyze many scenarios concurrently
         
-        # [5] Risk Assessor
-        print("  [5/10] Risk Assessor...")
-        risk_assessment = self.risk_assessor.assess(
-            scenario, perspective_comparison
-        )
+        Args:
+            scenarios: Scenarios to analyze
+            max_concurrency: Maximum analyses in flight
+            deadline: Seconds each analysis may take once started
         
-        # [6] Conflict Resolver
-        print("  [6/10] Conflict Resolver...")
-        conflict_resolution = self.conflict_resolver.resolve(
-            opportunity_assessment, risk_assessment
-        )
+        Yields:
+            BatchItem per scenario in completion order; a failed scenario
+            yields an item with `error` set instead of aborting the batch
+        """
+        pool = ThreadPoolExecutor(max_workers=max_concurrency)
+        futures = {
+            pool.submit(self.analyze, scenario, None, deadline): index
+            for index, scenario in enumerate(scenarios)
+        }
+        try:
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    yield BatchItem(index, result=future.result())
+                except Exception as e:
+                    yield BatchItem(index, error=e)
+        finally:
+            for future in futures:
+                future.cancel()
+            pool.shutdown(wait=False)
+    
+    async def analyze_batch_async(
+        self,
+        scenarios: Iterable[Dict[str, str]],
+        max_concurrency: int = 16,
+        deadline: Optional[float] = None
+    ) -> AsyncIterator[BatchItem]:
+        """
+        Async variant of `analyze_batch`
         
-        # TACTICAL LAYER
-        print("\n🔷 TACTICAL LAYER: Analyzing structure...")
+        Yields:
+            BatchItem per scenario in completion order
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
         
-        # [7] Sustainability Evaluator
-        print("  [7/10] Sustainability Evaluator...")
-        sustainability = self.sustainability_evaluator.evaluate(
-            scenario, conflict_resolution
-        )
+        async def run(index: int, scenario: Dict[str, str]) -> BatchItem:
+            async with semaphore:
+                try:
+                    return BatchItem(
+                        index, result=await self.analyze_async(scenario, deadline=deadline)
+                    )
+                except Exception as e:
+                    return BatchItem(index, error=e)
         
-        # [8] Implementation Planner
-        print("  [8/10] Implementation Planner...")
-        implementation = self.implementation_planner.plan(
-            scenario, conflict_resolution
+        tasks = [
+            asyncio.ensure_future(run(index, scenario))
+            for index, scenario in enumerate(scenarios)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    def _wrap(self, stage: Stage) -> Stage:
+        """Stage as run by the pipeline: reused when possible, always traced"""
+        if self.stage_cache is not None:
+            # Same inputs under other models would not give the same output
+            models = sorted({(provider.name, provider.model) for provider in self.providers()})
+            stage = memoized(stage, self.stage_cache, salt=json.dumps(models))
+        return self._traced(stage)
+    
+    @staticmethod
+    def _traced(stage: Stage) -> Stage:
+        """Wrap a stage so its runs are recorded as telemetry spans"""
+        return replace(
+            stage,
+            run=traced(stage.name, stage.run),
+            run_async=traced_async(stage.name, stage.run_async) if stage.run_async else None
         )
+    
+    def _start_telemetry(self, scenario_id: str) -> Optional[TelemetryCollector]:
+        """Span collector for one analysis (None when nothing consumes spans)"""
+        if not self.enable_telemetry and self.metrics is None and self.audit_log is None:
+            return None
+        if self.metrics is not None:
+            self.metrics.analysis_started()
+        return TelemetryCollector(scenario_id, capture_payloads=self.audit_log is not None)
+    
+    def _finish_telemetry(
+        self,
+        collector: Optional[TelemetryCollector],
+        scenario: Dict[str, str],
+        result: Optional[AnalysisResult],
+        error: Optional[BaseException] = None
+    ):
+        """
+        Feed the collected spans to the metrics, the result, the exporter
+        and the audit log (`result` is None when the analysis raised)
+        """
+        if collector is None:
+            return
+        telemetry = collector.finish()
+        if result is not None and self.enable_telemetry:
+            # Set before the audit record, which serializes the result later
+            result.telemetry = telemetry.to_dict()
+        if self.audit_log is not None:
+            # Serialized on the audit writer thread, off the request path
+            self.audit_log.append({
+                'scenario_id': collector.scenario_id,
+                'organization_id': self.organization_id,
+                'scenario': scenario,
+                'error': repr(error) if error is not None else None,
+                'telemetry': telemetry,
+                'result': result
+            })
+        if self.metrics is not None:
+            outcome = result.decision.approval_type.lower() if result is not None else 'error'
+            self.metrics.analysis_finished(telemetry, outcome)
+        if result is not None and self.enable_telemetry and self.telemetry_exporter is not None:
+            self.telemetry_exporter(telemetry)
+    
+    def _progress_hooks(
+        self,
+        scenario_id: str,
+        on_event: Optional[EventCallback],
+        restored: Dict[str, Any],
+        saves: Optional[List[asyncio.Future]] = None
+    ):
+        """
+        Stage callbacks that print progress (one header per layer),
+        forward start/completion events to `on_event` and checkpoint each
+        finished stage. Stages restored from a checkpoint are announced
+        (and reported as completed) right away.
+
+        With `saves` (async analyses), checkpoints are written in the
+        default executor and their futures appended to it.
+        """
+        printed_layers = set()
         
-        # EXECUTION LAYER
-        print("\n🔷 EXECUTION LAYER: Synthesizing decision...")
+        def header(stage: Stage):
+            if stage.layer not in printed_layers:
+                prefix = "\n" if printed_layers else ""
+                printed_layers.add(stage.layer)
+                print(f"{prefix}🔷 {stage.layer}")
         
-        # [9] Integration Engine
-        print("  [9/10] Integration Engine...")
-        integration = self.integration_engine.integrate(
-            impact_score=impact_score,
-            insight_analysis=insight_analysis,
-            perspective_comparison=perspective_comparison,
-            opportunity_assessment=opportunity_assessment,
-            risk_assessment=risk_assessment,
-            conflict_resolution=conflict_resolution,
-            sustainability=sustainability,
-            implementation=implementation
+        def on_start(stage: Stage):
+            header(stage)
+            print(f"  [{stage.step}/{TOTAL_STEPS}] {stage.label}...")
+            self._emit(on_event, AnalysisEvent(
+                STAGE_STARTED, scenario_id, stage=stage.name, step=stage.step
+            ))
+        
+        def on_complete(stage: Stage, output: Any):
+            if self.checkpoints is not None:
+                if saves is None:
+                    self.checkpoints.save(scenario_id, stage.name, output)
+                else:
+                    saves.append(asyncio.get_running_loop().run_in_executor(
+                        None, self.checkpoints.save, scenario_id, stage.name, output
+                    ))
+            self._emit(on_event, AnalysisEvent(
+                STAGE_COMPLETED, scenario_id, stage=stage.name, step=stage.step,
+                result=output
+            ))
+        
+        for stage in [self._purpose_stage] + self._stage_graph.stages:
+            if stage.name in restored:
+                header(stage)
+                print(f"  [{stage.step}/{TOTAL_STEPS}] {stage.label} (from checkpoint)")
+                self._emit(on_event, AnalysisEvent(
+                    STAGE_COMPLETED, scenario_id, stage=stage.name, step=stage.step,
+                    result=restored[stage.name]
+                ))
+        
+        return on_start, on_complete
+    
+    def _in_pipeline_order(self, names: List[str]) -> List[str]:
+        stages = [self._purpose_stage] + self._stage_graph.stages
+        return [stage.name for stage in stages if stage.name in names]
+    
+    def _begin(self, scenario: Optional[Dict[str, str]], resume: Optional[str]):
+        """
+        scenario_id, scenario, restored stage outputs and start time of a
+        new or resumed analysis
+        """
+        checkpoint = None
+        if resume is not None and self.checkpoints is not None:
+            checkpoint = self.checkpoints.load(resume)
+        if checkpoint is not None:
+            if scenario is not None and scenario != checkpoint.scenario:
+                raise ValueError(f"Checkpoint {resume} belongs to a different scenario")
+            print(f"♻️  Resuming {resume}: {len(checkpoint.outputs)} stages from checkpoint")
+            return resume, checkpoint.scenario, checkpoint.outputs, checkpoint.timestamp
+        
+        if scenario is None:
+            raise ValueError(f"No checkpoint for {resume}; a scenario is required")
+        scenario_id = resume or self._generate_scenario_id()
+        timestamp = datetime.utcnow().isoformat()
+        if self.checkpoints is not None:
+            self.checkpoints.begin(scenario_id, scenario, timestamp)
+        return scenario_id, scenario, {}, timestamp
+    
+    def _end(self, result: AnalysisResult):
+        """Drop the checkpoints of a finished analysis (kept if incomplete)"""
+        if self.checkpoints is None:
+            return
+        if result.incomplete:
+            self._keep_checkpoint(result.scenario_id)
+        else:
+            self.checkpoints.delete(result.scenario_id)
+    
+    def _keep_checkpoint(self, scenario_id: str):
+        if self.checkpoints is not None:
+            print(f"💾 Checkpoint kept; resume with analyze(..., resume='{scenario_id}')")
+    
+    @staticmethod
+    def _emit(on_event: Optional[EventCallback], event: AnalysisEvent):
+        if on_event is not None:
+            on_event(event)
+    
+    def _screen(
+        self,
+        scenario: Dict[str, str],
+        scenario_id: str,
+        on_event: Optional[EventCallback]
+    ) -> Optional[ScreenVerdict]:
+        """Run the local pre-screen (None when it is disabled)"""
+        if self.pre_screen is None:
+            return None
+        verdict = self.pre_screen.screen(scenario)
+        if self.metrics is not None:
+            self.metrics.screened(verdict.verdict)
+        if verdict.verdict != PASS:
+            print(f"🛡️  Pre-screen: {verdict.reasoning}")
+        self._emit(on_event, AnalysisEvent(
+            STAGE_COMPLETED, scenario_id, stage='screening', step=0, result=verdict
+        ))
+        return verdict
+    
+    def _reject_screened(
+        self,
+        scenario_id: str,
+        timestamp: str,
+        verdict: ScreenVerdict
+    ) -> AnalysisResult:
+        """Early rejection by the pre-screen; no module ran"""
+        decision = Decision(
+            approved=False,
+            approval_type="REJECTED",
+            confidence=verdict.risk,
+            actions=[],
+            conditions=[],
+            reasoning=f"Rejected by pre-screen. {verdict.reasoning}"
         )
         
-        # [10] Decision Orchestrator
-        print("  [10/10] Decision Orchestrator...")
-        decision = self.decision_orchestrator.orchestrate(integration)
+        return self._build_early_rejection_result(
+            scenario_id, timestamp, None, decision
+        )
+    
+    def _reject(
+        self,
+        scenario_id: str,
+        timestamp: str,
+        impact_score: ImpactScore
+    ) -> AnalysisResult:
+        """Early rejection after failed purpose validation"""
+        decision = Decision(
+            approved=False,
+            approval_type="REJECTED",
+            confidence=1.0,
+            actions=[],
+            conditions=[],
+            reasoning=f"Failed purpose validation. Impact score: {impact_score.score:.1%}"
+        )
         
-        print("\n✅ Analysis complete!")
+        return self._build_early_rejection_result(
+            scenario_id, timestamp, impact_score, decision
+        )
+    
+    def _build_result(
+        self,
+        scenario_id: str,
+        timestamp: str,
+        outputs: Dict[str, Any]
+    ) -> AnalysisResult:
+        """Build result from the stage graph outputs"""
+        impact_score = outputs['impact_score']
+        insight_analysis = outputs['insight_analysis']
+        perspective_comparison = outputs['perspective_comparison']
+        opportunity_assessment = outputs['opportunity_assessment']
+        risk_assessment = outputs['risk_assessment']
+        conflict_resolution = outputs['conflict_resolution']
+        sustainability = outputs['sustainability']
+        implementation = outputs['implementation']
+        integration = outputs['integration']
+        decision = outputs['decision']
         
         # Build result
         return AnalysisResult(
@@ -350,6 +1154,65 @@ class EthicaFramework:
             decision=decision
         )
     
+    def _deadline_result(
+        self,
+        scenario_id: str,
+        timestamp: str,
+        outputs: Dict[str, Any]
+    ) -> AnalysisResult:
+        """Partial result with the stages that finished before the deadline"""
+        pending = [] if 'impact_score' in outputs else [self._purpose_stage.name]
+        pending += self._stage_graph.missing(outputs)
+        print(f"\n⏱️  Analysis deadline reached; not finished: {', '.join(pending)}")
+        
+        def value(name: str, attr: str, default: Any = 0.0) -> Any:
+            output = outputs.get(name)
+            return getattr(output, attr) if output is not None else default
+        
+        decision = Decision(
+            approved=False,
+            approval_type="INCOMPLETE",
+            confidence=0.0,
+            actions=[],
+            conditions=[],
+            reasoning=f"Analysis deadline reached before {', '.join(pending)} finished"
+        )
+        
+        return AnalysisResult(
+            scenario_id=scenario_id,
+            timestamp=timestamp,
+            strategic={
+                'impact_score': value('impact_score', 'score'),
+                'confidence': value('insight_analysis', 'confidence'),
+                'integration_score': value('perspective_comparison', 'integration_score')
+            },
+            operational={
+                'opportunities': len(value('opportunity_assessment', 'opportunities', [])),
+                'risks': len(value('risk_assessment', 'risks', [])),
+                'harmony_score': value('conflict_resolution', 'harmony_score')
+            },
+            tactical={
+                'sustainability': value('sustainability', 'sustainability_score'),
+                'precision': value('implementation', 'precision_score')
+            },
+            execution={
+                'readiness': value('integration', 'readiness_score'),
+                'approved': False
+            },
+            impact_score=outputs.get('impact_score'),
+            insight_analysis=outputs.get('insight_analysis'),
+            perspective_comparison=outputs.get('perspective_comparison'),
+            opportunity_assessment=outputs.get('opportunity_assessment'),
+            risk_assessment=outputs.get('risk_assessment'),
+            conflict_resolution=outputs.get('conflict_resolution'),
+            sustainability=outputs.get('sustainability'),
+            implementation=outputs.get('implementation'),
+            integration=outputs.get('integration'),
+            decision=decision,
+            incomplete=True,
+            pending_stages=pending
+        )
+    
     def export_json(self, result: AnalysisResult, filepath: str):
         """Export result to JSON"""
         with open(filepath, 'w', encoding='utf-8') as f:
@@ -365,10 +1228,10 @@ class EthicaFramework:
         self,
         scenario_id: str,
         timestamp: str,
-        impact_score: ImpactScore,
+        impact_score: Optional[ImpactScore],
         decision: Decision
     ) -> AnalysisResult:
-        """Build result for early rejection"""
+        """Build result for early rejection (no impact score if pre-screened)"""
         # Create empty results for modules that didn't run
         from modules.insight_generator import InsightAnalysis as EmptyInsight
         from modules.context_analyzer import PerspectiveComparison as EmptyPerspective
@@ -378,7 +1241,11 @@ class EthicaFramework:
         return AnalysisResult(
             scenario_id=scenario_id,
             timestamp=timestamp,
-            strategic={'impact_score': impact_score.score, 'confidence': 0.0, 'integration_score': 0.0},
+            strategic={
+                'impact_score': impact_score.score if impact_score is not None else 0.0,
+                'confidence': 0.0,
+                'integration_score': 0.0
+            },
             operational={'opportunities': 0, 'risks': 0, 'harmony_score': 0.0},
             tactical={'sustainability': 0.0, 'precision': 0.0},
             execution={'readiness': 0.0, 'approved': False},
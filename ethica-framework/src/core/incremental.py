@@ -0,0 +1,116 @@
+"""
+Ethica.AI Framework - Incremental re-analysis
+Reuse stage outputs whose inputs have not changed
+
+Every stage output is stored under a fingerprint of the inputs the
+stage actually received: its upstream outputs plus the scenario fields
+the module prompts read. When a scenario is analyzed again after an
+edit, each stage whose fingerprint is unchanged returns its stored
+output without calling a provider; only the stages downstream of what
+changed run again. Editing `stakeholders`, for instance, reuses all ten.
+"""
+
+import functools
+import hashlib
+import json
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, is_dataclass, replace
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional
+
+from providers.cache import ResponseCache
+
+from .checkpoints import decode_output, encode_output
+from .pipeline import Stage
+
+
+# Scenario fields that reach any module prompt; the others (stakeholders,
+# metadata) cannot change a stage's output
+SCENARIO_FIELDS = ('action', 'context')
+
+_reused: ContextVar[Optional[List[str]]] = ContextVar('ethica_reused_stages', default=None)
+
+
+def fingerprint(stage: str, inputs: Dict[str, Any], salt: str = '') -> str:
+    """Stable key for one stage run with these inputs"""
+    values = {}
+    for name, value in inputs.items():
+        if name == 'scenario':
+            value = {key: value.get(key) for key in SCENARIO_FIELDS}
+        elif is_dataclass(value):
+            value = asdict(value)
+        values[name] = value
+    payload = json.dumps(
+        {'stage': stage, 'inputs': values, 'salt': salt},
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str
+    )
+    return 'stage:' + hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+@contextmanager
+def reuse_scope() -> Iterator[List[str]]:
+    """Collect the names of the stages reused during one analysis"""
+    reused: List[str] = []
+    token = _reused.set(reused)
+    try:
+        yield reused
+    finally:
+        _reused.reset(token)
+
+
+def memoized(stage: Stage, cache: ResponseCache, salt: str = '') -> Stage:
+    """
+    Wrap a stage so it returns the stored output for inputs it has
+    already seen, and stores the output of every new run
+    """
+    return replace(
+        stage,
+        run=_memoized(stage.name, stage.run, cache, salt),
+        run_async=_memoized_async(stage.name, stage.run_async, cache, salt) if stage.run_async else None
+    )
+
+
+def _restore(name: str, stored: Optional[str]) -> Optional[Any]:
+    """Decode a stored output and note the stage as reused"""
+    if stored is None:
+        return None
+    type_name, data = json.loads(stored)
+    output = decode_output(type_name, data)
+    reused = _reused.get()
+    if reused is not None:
+        reused.append(name)
+    return output
+
+
+def _encode(output: Any) -> str:
+    return json.dumps(encode_output(output))
+
+
+def _memoized(
+    name: str, fn: Callable[..., Any], cache: ResponseCache, salt: str
+) -> Callable[..., Any]:
+    @functools.wraps(fn)
+    def wrapper(**inputs):
+        key = fingerprint(name, inputs, salt)
+        output = _restore(name, cache.get(key))
+        if output is None:
+            output = fn(**inputs)
+            cache.set(key, _encode(output))
+        return output
+    return wrapper
+
+
+def _memoized_async(
+    name: str, fn: Callable[..., Awaitable[Any]], cache: ResponseCache, salt: str
+) -> Callable[..., Awaitable[Any]]:
+    @functools.wraps(fn)
+    async def wrapper(**inputs):
+        key = fingerprint(name, inputs, salt)
+        output = _restore(name, await cache.get_async(key))
+        if output is None:
+            output = await fn(**inputs)
+            await cache.set_async(key, _encode(output))
+        return output
+    return wrapper
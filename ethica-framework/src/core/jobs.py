@@ -0,0 +1,494 @@
+"""
+Ethica.AI Framework - Job Queue
+Background analyses: submit now, poll (or receive a webhook) later
+
+The queue backend is pluggable (`JobQueue`); `SQLiteJobQueue` lets the
+HTTP front end and any number of worker processes share one queue file:
+
+    python -m core.jobs --db ethica_jobs.sqlite3 --workers 4
+"""
+
+import ipaddress
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import urllib.parse
+import urllib.request
+import uuid
+from dataclasses import dataclass, asdict, field, is_dataclass
+from typing import Any, Dict, List, Optional
+
+from .events import AnalysisEvent, STAGE_COMPLETED
+
+
+QUEUED = 'queued'
+RUNNING = 'running'
+COMPLETED = 'completed'
+FAILED = 'failed'
+
+
+@dataclass
+class Job:
+    """One submitted analysis"""
+    id: str
+    scenario: Dict[str, Any]
+    status: str = QUEUED
+    created_at: float = 0.0
+    updated_at: float = 0.0
+    webhook_url: Optional[str] = None
+    progress: Dict[str, Any] = field(default_factory=dict)  # stage name -> module output
+    result: Optional[Dict[str, Any]] = None  # asdict(AnalysisResult)
+    error: Optional[str] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (COMPLETED, FAILED)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class JobQueue:
+    """
+    Queue interface
+
+    `claim` hands the oldest queued job to exactly one worker and marks
+    it running; running jobs not updated for `stale_after` seconds (a
+    worker died) are handed out again.
+    """
+
+    def __init__(self, stale_after: float = 600.0):
+        self.stale_after = stale_after
+
+    def submit(self, scenario: Dict[str, Any], webhook_url: Optional[str] = None) -> Job:
+        raise NotImplementedError
+
+    def get(self, job_id: str) -> Optional[Job]:
+        raise NotImplementedError
+
+    def claim(self) -> Optional[Job]:
+        raise NotImplementedError
+
+    def update_progress(self, job_id: str, stage: str, output: Any):
+        raise NotImplementedError
+
+    def complete(self, job_id: str, result: Dict[str, Any]):
+        raise NotImplementedError
+
+    def fail(self, job_id: str, error: str):
+        raise NotImplementedError
+
+    def depth(self) -> int:
+        """Number of jobs waiting for a worker"""
+        raise NotImplementedError
+
+    @staticmethod
+    def _new_job(scenario: Dict[str, Any], webhook_url: Optional[str]) -> Job:
+        now = time.time()
+        return Job(uuid.uuid4().hex, scenario, created_at=now, updated_at=now, webhook_url=webhook_url)
+
+
+class MemoryJobQueue(JobQueue):
+    """In-process queue (jobs are lost on restart)"""
+
+    def __init__(self, stale_after: float = 600.0):
+        super().__init__(stale_after)
+        self._jobs: Dict[str, Job] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, scenario: Dict[str, Any], webhook_url: Optional[str] = None) -> Job:
+        job = self._new_job(scenario, webhook_url)
+        with self._lock:
+            self._jobs[job.id] = job
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self._jobs.get(job_id)
+
+    def claim(self) -> Optional[Job]:
+        now = time.time()
+        with self._lock:
+            for job in self._jobs.values():  # insertion order = submission order
+                stale = job.status == RUNNING and now - job.updated_at > self.stale_after
+                if job.status == QUEUED or stale:
+                    job.status, job.updated_at = RUNNING, now
+                    return job
+        return None
+
+    def update_progress(self, job_id: str, stage: str, output: Any):
+        with self._lock:
+            job = self._jobs[job_id]
+            job.progress[stage] = output
+            job.updated_at = time.time()
+
+    def complete(self, job_id: str, result: Dict[str, Any]):
+        self._finish(job_id, COMPLETED, result=result)
+
+    def fail(self, job_id: str, error: str):
+        self._finish(job_id, FAILED, error=error)
+
+    def _finish(self, job_id: str, status: str, result=None, error=None):
+        with self._lock:
+            job = self._jobs[job_id]
+            job.status, job.result, job.error = status, result, error
+            job.updated_at = time.time()
+
+    def depth(self) -> int:
+        return sum(job.status == QUEUED for job in self._jobs.values())
+
+
+class SQLiteJobQueue(JobQueue):
+    """
+    Queue stored in a SQLite file, shared across processes
+
+    Claims run in an IMMEDIATE transaction, so concurrent workers never
+    pick the same job.
+    """
+
+    def __init__(self, path: str = 'ethica_jobs.sqlite3', stale_after: float = 600.0):
+        super().__init__(stale_after)
+        self.path = path
+        self._lock = threading.Lock()
+        # Autocommit mode: transactions are opened explicitly in `claim`
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS jobs ('
+            ' id TEXT PRIMARY KEY,'
+            ' scenario TEXT NOT NULL,'
+            ' status TEXT NOT NULL,'
+            ' created_at REAL NOT NULL,'
+            ' updated_at REAL NOT NULL,'
+            ' webhook_url TEXT,'
+            ' progress TEXT NOT NULL,'
+            ' result TEXT,'
+            ' error TEXT)'
+        )
+        self._conn.execute(
+            'CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, created_at)'
+        )
+
+    def submit(self, scenario: Dict[str, Any], webhook_url: Optional[str] = None) -> Job:
+        job = self._new_job(scenario, webhook_url)
+        with self._lock:
+            self._conn.execute(
+                'INSERT INTO jobs (id, scenario, status, created_at, updated_at, webhook_url, progress)'
+                ' VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (job.id, _dumps(scenario), job.status, job.created_at, job.updated_at, webhook_url, '{}')
+            )
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT id, scenario, status, created_at, updated_at, webhook_url,'
+                ' progress, result, error FROM jobs WHERE id = ?', (job_id,)
+            ).fetchone()
+        return self._job(row) if row else None
+
+    def claim(self) -> Optional[Job]:
+        now = time.time()
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                row = self._conn.execute(
+                    'SELECT id FROM jobs WHERE status = ? OR (status = ? AND updated_at < ?)'
+                    ' ORDER BY created_at LIMIT 1',
+                    (QUEUED, RUNNING, now - self.stale_after)
+                ).fetchone()
+                if row is not None:
+                    self._conn.execute(
+                        'UPDATE jobs SET status = ?, updated_at = ? WHERE id = ?',
+                        (RUNNING, now, row[0])
+                    )
+                self._conn.execute('COMMIT')
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+        return self.get(row[0]) if row else None
+
+    def update_progress(self, job_id: str, stage: str, output: Any):
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET progress = json_set(progress, '$.' || ?, json(?)), updated_at = ?"
+                ' WHERE id = ?',
+                (stage, _dumps(output), time.time(), job_id)
+            )
+
+    def complete(self, job_id: str, result: Dict[str, Any]):
+        self._finish(job_id, COMPLETED, result=_dumps(result))
+
+    def fail(self, job_id: str, error: str):
+        self._finish(job_id, FAILED, error=error)
+
+    def _finish(self, job_id: str, status: str, result=None, error=None):
+        with self._lock:
+            self._conn.execute(
+                'UPDATE jobs SET status = ?, result = ?, error = ?, updated_at = ? WHERE id = ?',
+                (status, result, error, time.time(), job_id)
+            )
+
+    def depth(self) -> int:
+        with self._lock:
+            return self._conn.execute(
+                'SELECT COUNT(*) FROM jobs WHERE status = ?', (QUEUED,)
+            ).fetchone()[0]
+
+    def purge_finished(self, older_than: float) -> int:
+        """Delete finished jobs last updated more than `older_than` seconds ago"""
+        with self._lock:
+            cursor = self._conn.execute(
+                'DELETE FROM jobs WHERE status IN (?, ?) AND updated_at < ?',
+                (COMPLETED, FAILED, time.time() - older_than)
+            )
+            return cursor.rowcount
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _job(row) -> Job:
+        return Job(
+            id=row[0],
+            scenario=json.loads(row[1]),
+            status=row[2],
+            created_at=row[3],
+            updated_at=row[4],
+            webhook_url=row[5],
+            progress=json.loads(row[6]),
+            result=json.loads(row[7]) if row[7] is not None else None,
+            error=row[8]
+        )
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, default=str)
+
+
+def check_webhook_url(url: str) -> str:
+    """
+    Refuse webhook targets the server must not POST to (SSRF)
+
+    Only http(s) URLs. With ETHICA_WEBHOOK_ALLOWLIST (comma-separated
+    host names) the host must be listed; otherwise every address it
+    resolves to must be public - no loopback, private, link-local
+    (169.254.169.254), shared or reserved ranges.
+
+    Raises:
+        ValueError: The URL is not an allowed webhook target
+    """
+    parts = urllib.parse.urlsplit(url)
+    if parts.scheme not in ('http', 'https') or not parts.hostname:
+        raise ValueError("webhook_url must be an http(s) URL with a host")
+    host = parts.hostname.lower()
+
+    allowlist = {
+        h.strip().lower() for h in os.getenv('ETHICA_WEBHOOK_ALLOWLIST', '').split(',') if h.strip()
+    }
+    if allowlist:
+        if host not in allowlist:
+            raise ValueError(f"Webhook host {host} is not in ETHICA_WEBHOOK_ALLOWLIST")
+        return url
+
+    try:
+        port = parts.port or (443 if parts.scheme == 'https' else 80)
+        infos = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+    except (socket.gaierror, ValueError) as e:
+        raise ValueError(f"Webhook host {host} cannot be resolved: {e}") from e
+    for info in infos:
+        address = ipaddress.ip_address(info[4][0].split('%')[0])
+        if address.version == 6 and address.ipv4_mapped is not None:
+            address = address.ipv4_mapped
+        if not address.is_global or address.is_multicast:
+            raise ValueError(f"Webhook host {host} resolves to non-public address {address}")
+    return url
+
+
+class _NoRedirect(urllib.request.HTTPRedirectHandler):
+    """A redirect could point the webhook at an internal address"""
+
+    def redirect_request(self, req, fp, code, msg, headers, newurl):
+        return None
+
+
+_webhook_opener = urllib.request.build_opener(_NoRedirect)
+
+
+class JobWorker:
+    """
+    Bounded pool of threads running queued analyses
+
+    Each thread claims one job at a time, runs `framework.analyze` and
+    stores module outputs as they complete (partial results), then the
+    final result or error. Jobs with a `webhook_url` get the finished job
+    POSTed to that URL, if `check_webhook_url` still accepts it when the
+    job ends; redirects are not followed.
+
+    Queue errors (e.g. SQLite "database is locked") never end a thread:
+    they are logged, a failed claim is retried with exponential backoff
+    up to `max_backoff` seconds, and a job whose outcome could not be
+    stored is reclaimed once it goes stale.
+    """
+
+    def __init__(
+        self,
+        framework,
+        queue: JobQueue,
+        workers: int = 2,
+        poll_interval: float = 1.0,
+        webhook_timeout: float = 10.0,
+        max_backoff: float = 30.0
+    ):
+        self.framework = framework
+        self.queue = queue
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.webhook_timeout = webhook_timeout
+        self.max_backoff = max_backoff
+        self._threads: List[threading.Thread] = []
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._busy = 0
+        self._lock = threading.Lock()
+
+    @property
+    def busy(self) -> int:
+        """Workers currently running an analysis"""
+        return self._busy
+
+    def start(self):
+        self._stop.clear()
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._loop, name=f'ethica-job-worker-{i}', daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: Optional[float] = None):
+        """Stop claiming new jobs and wait for running ones"""
+        self._stop.set()
+        self._wake.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads.clear()
+
+    def notify(self):
+        """Wake idle workers (call after submitting in the same process)"""
+        self._wake.set()
+
+    def _loop(self):
+        failures = 0
+        while not self._stop.is_set():
+            try:
+                job = self.queue.claim()
+            except Exception as e:
+                failures += 1
+                delay = min(self.poll_interval * 2 ** failures, self.max_backoff)
+                print(f"⚠️  Job claim failed, retrying in {delay:g}s: {e}")
+                self._stop.wait(delay)
+                continue
+            failures = 0
+            if job is None:
+                self._wake.wait(self.poll_interval)
+                self._wake.clear()
+                continue
+            with self._lock:
+                self._busy += 1
+            try:
+                self.run(job)
+            except Exception as e:
+                # Left running; another claim picks it up once it is stale
+                print(f"⚠️  Job {job.id} could not be stored: {e}")
+            finally:
+                with self._lock:
+                    self._busy -= 1
+
+    def run(self, job: Job):
+        """
+        Run one claimed job to completion
+
+        The analysis is keyed by the job, so a job reclaimed after its
+        worker died resumes from that worker's checkpoints (if the
+        framework has a checkpoint store shared by both).
+        """
+        def on_event(event: AnalysisEvent):
+            if event.type == STAGE_COMPLETED:
+                output = asdict(event.result) if is_dataclass(event.result) else event.result
+                try:
+                    self.queue.update_progress(job.id, event.stage, output)
+                except Exception as e:
+                    # Partial results are best effort; the analysis goes on
+                    print(f"⚠️  Progress of job {job.id} not stored: {e}")
+
+        try:
+            result = self.framework.analyze(
+                job.scenario, on_event=on_event, resume=f"ETH-{job.id[:8]}"
+            )
+        except Exception as e:
+            self.queue.fail(job.id, f"{type(e).__name__}: {e}")
+        else:
+            try:
+                output = asdict(result)
+            except Exception as e:
+                self.queue.fail(job.id, f"Result could not be stored: {type(e).__name__}: {e}")
+            else:
+                self.queue.complete(job.id, output)
+
+        if job.webhook_url:
+            self._send_webhook(job.webhook_url, job.id)
+
+    def _send_webhook(self, url: str, job_id: str):
+        try:
+            # Checked again here: the host may resolve elsewhere by now
+            check_webhook_url(url)
+            job = self.queue.get(job_id)
+            request = urllib.request.Request(
+                url,
+                data=_dumps(job.to_dict()).encode('utf-8'),
+                headers={'Content-Type': 'application/json'},
+                method='POST'
+            )
+            with _webhook_opener.open(request, timeout=self.webhook_timeout):
+                pass
+        except Exception as e:
+            print(f"⚠️  Webhook for job {job_id} failed: {e}")
+
+
+def queue_from_env() -> JobQueue:
+    """SQLite queue at ETHICA_JOBS_PATH (default ethica_jobs.sqlite3)"""
+    return SQLiteJobQueue(os.getenv('ETHICA_JOBS_PATH', 'ethica_jobs.sqlite3'))
+
+
+def main():
+    """Run queue workers in their own process (API keys from the environment)"""
+    import argparse
+    from .checkpoints import SQLiteCheckpointStore, checkpoint_ttl
+    from .framework import EthicaFramework
+
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument('--db', default=os.getenv('ETHICA_JOBS_PATH', 'ethica_jobs.sqlite3'))
+    parser.add_argument('--workers', type=int, default=int(os.getenv('ETHICA_JOB_WORKERS', 2)))
+    parser.add_argument(
+        '--checkpoints', default=os.getenv('ETHICA_CHECKPOINT_PATH', 'ethica_checkpoints.sqlite3')
+    )
+    args = parser.parse_args()
+
+    checkpoints = SQLiteCheckpointStore(args.checkpoints)
+    framework = EthicaFramework(checkpoints=checkpoints)
+    worker = JobWorker(framework, SQLiteJobQueue(args.db), workers=args.workers)
+    worker.start()
+    print(f"Ethica job workers: {args.workers} on {args.db}")
+    try:
+        while True:
+            # Checkpoints of jobs nobody will reclaim
+            checkpoints.purge(checkpoint_ttl())
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        worker.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,297 @@
+"""
+Ethica.AI Framework - Metrics
+Prometheus-compatible counters, gauges and histograms (text exposition format)
+"""
+
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from providers.telemetry import Telemetry
+
+
+# Provider calls take seconds; a full analysis up to a few minutes
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0)
+ANALYSIS_BUCKETS = (1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0, 300.0)
+
+# Decision.approval_type values (anything else is counted as 'other');
+# 'incomplete' marks analyses cut short by their deadline
+OUTCOMES = ('unconditional', 'conditional', 'rejected', 'incomplete')
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+LabelValues = Tuple[str, ...]
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ''
+    pairs = []
+    for name, value in zip(names, values):
+        escaped = str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        pairs.append(f'{name}="{escaped}"')
+    return '{' + ','.join(pairs) + '}'
+
+
+def _format_value(value: float) -> str:
+    return '+Inf' if value == float('inf') else repr(float(value))
+
+
+class _Metric:
+    """Base class: one metric family with a fixed set of label names"""
+
+    type = ''
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.label_names = tuple(labels)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.label_names):
+            raise ValueError(f"{self.name} expects labels {self.label_names}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.label_names)
+
+    def render(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.type}"] + self._samples()
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonically increasing value"""
+
+    type = 'counter'
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()):
+        super().__init__(name, help, labels)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str):
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.label_names, key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+
+class Gauge(Counter):
+    """Value that can go up and down"""
+
+    type = 'gauge'
+
+    def inc(self, amount: float = 1.0, **labels: str):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str):
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: str):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram(_Metric):
+    """Observations counted into cumulative `le` buckets"""
+
+    type = 'histogram'
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS
+    ):
+        super().__init__(name, help, labels)
+        self.buckets = tuple(sorted(buckets)) + (float('inf'),)
+        self._series: Dict[LabelValues, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, **labels: str):
+        key = self._key(labels)
+        with self._lock:
+            counts, total = self._series.setdefault(key, ([0] * len(self.buckets), [0.0]))
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+                    break
+            total[0] += value
+
+    def count(self, **labels: str) -> int:
+        series = self._series.get(self._key(labels))
+        return sum(series[0]) if series else 0
+
+    def _samples(self) -> List[str]:
+        lines = []
+        with self._lock:
+            items = sorted((key, (list(c), t[0])) for key, (c, t) in self._series.items())
+        for key, (counts, total) in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                labels = _format_labels(
+                    self.label_names + ('le',), key + (_format_value(bound),)
+                )
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.label_names, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Named metric families rendered together"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric {metric.name} is already registered")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help: str, labels: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, help, labels))
+
+    def gauge(self, name: str, help: str, labels: Sequence[str] = ()) -> Gauge:
+        return self.register(Gauge(name, help, labels))
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS
+    ) -> Histogram:
+        return self.register(Histogram(name, help, labels, buckets))
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+
+class FrameworkMetrics:
+    """
+    Analysis-level metrics fed by EthicaFramework
+
+    Pass an instance as `EthicaFramework(metrics=...)`; every analysis then
+    updates the in-flight gauge and, once finished, the counters and
+    histograms below from its telemetry spans.
+    """
+
+    def __init__(self, registry: Optional[MetricsRegistry] = None):
+        self.registry = registry if registry is not None else MetricsRegistry()
+        r = self.registry
+
+        self.analyses = r.counter(
+            'ethica_analyses_total',
+            'Finished analyses by outcome (unconditional, conditional, rejected, incomplete, other, error)',
+            ('outcome',)
+        )
+        self.analyses_in_flight = r.gauge(
+            'ethica_analyses_in_flight', 'Analyses currently running'
+        )
+        self.screen_verdicts = r.counter(
+            'ethica_screen_verdicts_total',
+            'Local pre-screen verdicts (pass, flag, reject); rejected scenarios never reach a provider',
+            ('verdict',)
+        )
+        self.analysis_duration = r.histogram(
+            'ethica_analysis_duration_seconds', 'End-to-end analysis wall time',
+            buckets=ANALYSIS_BUCKETS
+        )
+        self.stage_duration = r.histogram(
+            'ethica_stage_duration_seconds', 'Wall time of each analysis module', ('stage',)
+        )
+        self.stage_errors = r.counter(
+            'ethica_stage_errors_total', 'Analysis modules that raised', ('stage',)
+        )
+        self.provider_requests = r.counter(
+            'ethica_provider_requests_total',
+            'Provider calls by how they were served (upstream, cache_hit, collapsed)',
+            ('provider', 'served')
+        )
+        self.provider_duration = r.histogram(
+            'ethica_provider_request_duration_seconds',
+            'Wall time of upstream provider calls', ('provider',)
+        )
+        self.provider_errors = r.counter(
+            'ethica_provider_errors_total', 'Provider calls that failed', ('provider',)
+        )
+        self.provider_retries = r.counter(
+            'ethica_provider_retries_total', 'Provider call retries', ('provider',)
+        )
+        self.provider_tokens = r.counter(
+            'ethica_provider_tokens_total', 'Tokens reported by providers',
+            ('provider', 'kind')
+        )
+        self.provider_cost = r.counter(
+            'ethica_provider_cost_usd_total', 'Estimated provider cost in USD', ('provider',)
+        )
+
+    def analysis_started(self):
+        self.analyses_in_flight.inc()
+
+    def screened(self, verdict: str):
+        self.screen_verdicts.inc(verdict=verdict.lower())
+
+    def analysis_finished(self, telemetry: Telemetry, outcome: str):
+        """Record one finished analysis (outcome 'error' if it raised)"""
+        if outcome not in OUTCOMES and outcome != 'error':
+            outcome = 'other'
+        self.analyses_in_flight.dec()
+        self.analyses.inc(outcome=outcome)
+        self.analysis_duration.observe(telemetry.wall_time)
+
+        for stage in telemetry.stages:
+            self.stage_duration.observe(stage.wall_time, stage=stage.name)
+            if stage.error is not None:
+                self.stage_errors.inc(stage=stage.name)
+
+            for call in stage.calls:
+                provider = call.provider
+                if call.cache_hit:
+                    served = 'cache_hit'
+                elif call.collapsed:
+                    served = 'collapsed'
+                else:
+                    served = 'upstream'
+                    self.provider_duration.observe(call.wall_time, provider=provider)
+                self.provider_requests.inc(provider=provider, served=served)
+
+                if call.error is not None:
+                    self.provider_errors.inc(provider=provider)
+                if call.retries:
+                    self.provider_retries.inc(call.retries, provider=provider)
+                if call.prompt_tokens:
+                    self.provider_tokens.inc(call.prompt_tokens, provider=provider, kind='prompt')
+                if call.completion_tokens:
+                    self.provider_tokens.inc(call.completion_tokens, provider=provider, kind='completion')
+                if call.cost_usd:
+                    self.provider_cost.inc(call.cost_usd, provider=provider)
+
+    def render(self) -> str:
+        return self.registry.render()
@@ -0,0 +1,230 @@
+"""
+Ethica.AI Framework - Stage Pipeline
+Declarative dependency graph for the analysis modules
+"""
+
+import asyncio
+import contextvars
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+from providers.deadline import DeadlineExceeded, expired, remaining
+
+
+@dataclass(frozen=True)
+class Stage:
+    """
+    One node of the analysis graph
+
+    `run` is called with one keyword argument per entry in `inputs`;
+    its return value is published under `name` for downstream stages.
+    `run_async` is the coroutine equivalent used by `StageGraph.run_async`.
+    """
+    name: str
+    run: Callable[..., Any]
+    inputs: Tuple[str, ...] = ()
+    label: str = ''
+    layer: str = ''
+    step: int = 0
+    run_async: Optional[Callable[..., Awaitable[Any]]] = None
+
+
+class StageGraph:
+    """
+    Executes stages as soon as all of their inputs are available
+
+    Stages that do not depend on each other (e.g. Opportunity Identifier
+    and Risk Assessor) run concurrently on a thread pool. Results are
+    keyed by stage name, so the outcome does not depend on completion order.
+
+    Under an analysis deadline (`providers.deadline`) no stage is started
+    once the deadline has passed, stages still running are abandoned, and
+    a stage failing with DeadlineExceeded is treated as not finished. The
+    returned dict then lacks those stages (see `missing`).
+    """
+
+    def __init__(self, stages: Sequence[Stage], provided: Sequence[str] = ()):
+        """
+        Args:
+            stages: Stage definitions (any order)
+            provided: Names supplied by the caller instead of a stage
+        """
+        self.stages: List[Stage] = list(stages)
+        self.provided = tuple(provided)
+        self._validate()
+
+    def _validate(self):
+        """Reject unknown inputs, duplicate names and cycles"""
+        names = [stage.name for stage in self.stages]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Duplicate stage names in {names}")
+
+        known = set(names) | set(self.provided)
+        for stage in self.stages:
+            missing = [i for i in stage.inputs if i not in known]
+            if missing:
+                raise ValueError(f"Stage '{stage.name}' has unknown inputs: {missing}")
+
+        # Kahn's algorithm - every stage must become ready eventually
+        available = set(self.provided)
+        remaining = list(self.stages)
+        while remaining:
+            ready = [s for s in remaining if all(i in available for i in s.inputs)]
+            if not ready:
+                raise ValueError(
+                    f"Cyclic dependencies between stages: {[s.name for s in remaining]}"
+                )
+            for stage in ready:
+                available.add(stage.name)
+                remaining.remove(stage)
+
+    @property
+    def width(self) -> int:
+        """Maximum number of stages that can be in flight at once"""
+        available = set(self.provided)
+        remaining = list(self.stages)
+        width = 1
+        while remaining:
+            ready = [s for s in remaining if all(i in available for i in s.inputs)]
+            width = max(width, len(ready))
+            for stage in ready:
+                available.add(stage.name)
+                remaining.remove(stage)
+        return width
+
+    def missing(self, results: Dict[str, Any]) -> List[str]:
+        """Names of the stages absent from `results`, in declaration order"""
+        return [stage.name for stage in self.stages if stage.name not in results]
+
+    def run(
+        self,
+        values: Dict[str, Any],
+        on_stage_start: Optional[Callable[[Stage], None]] = None,
+        on_stage_complete: Optional[Callable[[Stage, Any], None]] = None,
+        max_workers: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Run every stage, starting each one as soon as its inputs are ready
+
+        Args:
+            values: Initial values for the `provided` names, plus the
+                outputs of stages that must not run again (resume)
+            on_stage_start: Optional callback invoked before a stage is launched
+            on_stage_complete: Optional callback invoked with each stage's result
+            max_workers: Thread pool size (default: graph width)
+
+        Returns:
+            Dict with the initial values plus one entry per finished stage
+
+        Raises:
+            The first exception raised by any stage; stages not yet
+            started are not launched.
+        """
+        results = dict(values)
+        pending = [s for s in self.stages if s.name not in results]
+        running = {}
+
+        pool = ThreadPoolExecutor(max_workers=max_workers or self.width)
+        try:
+            while pending or running:
+                ready = [s for s in pending if all(i in results for i in s.inputs)]
+                for stage in ready if not expired() else ():
+                    pending.remove(stage)
+                    if on_stage_start:
+                        on_stage_start(stage)
+                    kwargs = {i: results[i] for i in stage.inputs}
+                    # Worker threads see the caller's context variables (telemetry)
+                    context = contextvars.copy_context()
+                    running[pool.submit(context.run, stage.run, **kwargs)] = stage
+                if not running:
+                    break  # Out of time, or every stage left needs an unfinished one
+
+                left = remaining()
+                done, _ = wait(
+                    running,
+                    timeout=max(left, 0) if left is not None else None,
+                    return_when=FIRST_COMPLETED
+                )
+                if not done:
+                    break  # Deadline passed: abandon the stages still running
+                for future in done:
+                    stage = running.pop(future)
+                    error = future.exception()
+                    if isinstance(error, DeadlineExceeded):
+                        continue
+                    if error is not None:
+                        for other in running:
+                            other.cancel()
+                        raise error
+                    results[stage.name] = future.result()
+                    if on_stage_complete:
+                        on_stage_complete(stage, results[stage.name])
+        finally:
+            # Abandoned stages finish in the background, bounded by their
+            # provider timeouts
+            pool.shutdown(wait=not running)
+
+        return results
+
+    async def run_async(
+        self,
+        values: Dict[str, Any],
+        on_stage_start: Optional[Callable[[Stage], None]] = None,
+        on_stage_complete: Optional[Callable[[Stage, Any], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Coroutine equivalent of `run` using each stage's `run_async`
+
+        Independent stages are awaited concurrently on the running event
+        loop instead of a thread pool.
+
+        Raises:
+            The first exception raised by any stage (CancelledError if a
+            stage task was cancelled); the stages still running are
+            cancelled.
+        """
+        results = dict(values)
+        pending = [s for s in self.stages if s.name not in results]
+        running = {}
+
+        try:
+            while pending or running:
+                ready = [s for s in pending if all(i in results for i in s.inputs)]
+                for stage in ready if not expired() else ():
+                    if stage.run_async is None:
+                        raise TypeError(f"Stage '{stage.name}' has no async implementation")
+                    pending.remove(stage)
+                    if on_stage_start:
+                        on_stage_start(stage)
+                    kwargs = {i: results[i] for i in stage.inputs}
+                    task = asyncio.ensure_future(stage.run_async(**kwargs))
+                    running[task] = stage
+                if not running:
+                    break
+
+                left = remaining()
+                done, _ = await asyncio.wait(
+                    running,
+                    timeout=max(left, 0) if left is not None else None,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    break
+                for task in done:
+                    stage = running.pop(task)
+                    if task.cancelled():
+                        raise asyncio.CancelledError(f"Stage '{stage.name}' was cancelled")
+                    error = task.exception()
+                    if isinstance(error, DeadlineExceeded):
+                        continue
+                    if error is not None:
+                        raise error
+                    results[stage.name] = task.result()
+                    if on_stage_complete:
+                        on_stage_complete(stage, results[stage.name])
+        finally:
+            for task in running:
+                task.cancel()
+
+        return results
@@ -0,0 +1,253 @@
+"""
+Ethica.AI Framework - Result Store
+Persistent, indexed storage for AnalysisResults
+"""
+
+import base64
+import json
+import os
+import sqlite3
+import threading
+from dataclasses import asdict, dataclass, is_dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# Columns that can be filtered on; each is backed by an index
+SUMMARY_COLUMNS = (
+    'scenario_id', 'timestamp', 'organization_id', 'approval_type', 'approved',
+    'impact_score', 'readiness', 'confidence'
+)
+
+
+@dataclass
+class ResultPage:
+    """One page of query results, newest first"""
+    items: List[Dict[str, Any]]
+    next_cursor: Optional[str] = None  # Pass back as `cursor` for the next page
+
+
+class ResultStore:
+    """
+    Result store interface
+
+    `save` accepts an AnalysisResult (or its `asdict` form). `query`
+    returns summaries ordered by timestamp, newest first, with keyset
+    pagination so every page costs the same regardless of depth.
+    """
+
+    def save(self, result: Any, organization_id: Optional[str] = None):
+        raise NotImplementedError
+
+    def get(self, scenario_id: str) -> Optional[Dict[str, Any]]:
+        raise NotImplementedError
+
+    def query(
+        self,
+        organization_id: Optional[str] = None,
+        approval_type: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        min_impact_score: Optional[float] = None,
+        max_impact_score: Optional[float] = None,
+        min_readiness: Optional[float] = None,
+        max_readiness: Optional[float] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        include_data: bool = False
+    ) -> ResultPage:
+        raise NotImplementedError
+
+    def count(self, **filters: Any) -> int:
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+    @staticmethod
+    def _summary(data: Dict[str, Any], organization_id: Optional[str]) -> Dict[str, Any]:
+        decision = data.get('decision') or {}
+        return {
+            'scenario_id': data['scenario_id'],
+            'timestamp': data['timestamp'],
+            'organization_id': organization_id,
+            'approval_type': decision.get('approval_type'),
+            'approved': bool(decision.get('approved')),
+            'impact_score': (data.get('strategic') or {}).get('impact_score'),
+            'readiness': (data.get('execution') or {}).get('readiness'),
+            'confidence': decision.get('confidence')
+        }
+
+
+def _encode_cursor(timestamp: str, scenario_id: str) -> str:
+    return base64.urlsafe_b64encode(f"{timestamp}|{scenario_id}".encode('utf-8')).decode('ascii')
+
+
+def _decode_cursor(cursor: str) -> Tuple[str, str]:
+    try:
+        timestamp, scenario_id = base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8').split('|', 1)
+    except ValueError:
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return timestamp, scenario_id
+
+
+class SQLiteResultStore(ResultStore):
+    """
+    Results in a SQLite file
+
+    Summary fields live in indexed columns; the full result is kept as a
+    JSON document and only decoded when requested.
+    """
+
+    def __init__(self, path: str = 'ethica_results.sqlite3'):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS results ('
+            ' scenario_id TEXT PRIMARY KEY,'
+            ' timestamp TEXT NOT NULL,'
+            ' organization_id TEXT,'
+            ' approval_type TEXT,'
+            ' approved INTEGER NOT NULL,'
+            ' impact_score REAL,'
+            ' readiness REAL,'
+            ' confidence REAL,'
+            ' data TEXT NOT NULL)'
+        )
+        # Every list query orders by (timestamp, scenario_id); the composite
+        # indexes serve the common "filter + newest first" combinations
+        for name, columns in (
+            ('results_timestamp', 'timestamp, scenario_id'),
+            ('results_org', 'organization_id, timestamp, scenario_id'),
+            ('results_approval', 'approval_type, timestamp, scenario_id'),
+            ('results_org_approval', 'organization_id, approval_type, timestamp, scenario_id'),
+            ('results_impact', 'impact_score'),
+            ('results_readiness', 'readiness')
+        ):
+            self._conn.execute(f'CREATE INDEX IF NOT EXISTS {name} ON results ({columns})')
+        self._conn.commit()
+
+    def save(self, result: Any, organization_id: Optional[str] = None):
+        data = asdict(result) if is_dataclass(result) else result
+        summary = self._summary(data, organization_id)
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO results'
+                ' (scenario_id, timestamp, organization_id, approval_type, approved,'
+                '  impact_score, readiness, confidence, data)'
+                ' VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                tuple(summary[c] for c in SUMMARY_COLUMNS)
+                + (json.dumps(data, ensure_ascii=False, default=str),)
+            )
+            self._conn.commit()
+
+    def import_json(self, filepath: str, organization_id: Optional[str] = None):
+        """Store a file written by `EthicaFramework.export_json`"""
+        with open(filepath, encoding='utf-8') as f:
+            self.save(json.load(f), organization_id)
+
+    def get(self, scenario_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT data FROM results WHERE scenario_id = ?', (scenario_id,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def query(
+        self,
+        organization_id: Optional[str] = None,
+        approval_type: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        min_impact_score: Optional[float] = None,
+        max_impact_score: Optional[float] = None,
+        min_readiness: Optional[float] = None,
+        max_readiness: Optional[float] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        include_data: bool = False
+    ) -> ResultPage:
+        """
+        Filtered results, newest first
+
+        Args:
+            since / until: ISO timestamps (inclusive / exclusive)
+            limit: Page size
+            cursor: `next_cursor` of the previous page
+            include_data: Add the full result under 'data'
+        """
+        where, params = self._where(
+            organization_id, approval_type, since, until,
+            min_impact_score, max_impact_score, min_readiness, max_readiness
+        )
+        if cursor:
+            timestamp, scenario_id = _decode_cursor(cursor)
+            where.append('(timestamp, scenario_id) < (?, ?)')
+            params += [timestamp, scenario_id]
+
+        columns = ', '.join(SUMMARY_COLUMNS + (('data',) if include_data else ()))
+        sql = f'SELECT {columns} FROM results'
+        if where:
+            sql += ' WHERE ' + ' AND '.join(where)
+        sql += ' ORDER BY timestamp DESC, scenario_id DESC LIMIT ?'
+
+        with self._lock:
+            rows = self._conn.execute(sql, params + [limit + 1]).fetchall()
+
+        items = []
+        for row in rows[:limit]:
+            item = dict(zip(SUMMARY_COLUMNS, row))
+            item['approved'] = bool(item['approved'])
+            if include_data:
+                item['data'] = json.loads(row[-1])
+            items.append(item)
+
+        next_cursor = None
+        if len(rows) > limit:
+            last = items[-1]
+            next_cursor = _encode_cursor(last['timestamp'], last['scenario_id'])
+        return ResultPage(items, next_cursor)
+
+    def count(self, **filters: Any) -> int:
+        where, params = self._where(**filters)
+        sql = 'SELECT COUNT(*) FROM results'
+        if where:
+            sql += ' WHERE ' + ' AND '.join(where)
+        with self._lock:
+            return self._conn.execute(sql, params).fetchone()[0]
+
+    @staticmethod
+    def _where(
+        organization_id: Optional[str] = None,
+        approval_type: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        min_impact_score: Optional[float] = None,
+        max_impact_score: Optional[float] = None,
+        min_readiness: Optional[float] = None,
+        max_readiness: Optional[float] = None
+    ) -> Tuple[List[str], List[Any]]:
+        conditions = (
+            ('organization_id = ?', organization_id),
+            ('approval_type = ?', approval_type.upper() if approval_type else None),
+            ('timestamp >= ?', since),
+            ('timestamp < ?', until),
+            ('impact_score >= ?', min_impact_score),
+            ('impact_score <= ?', max_impact_score),
+            ('readiness >= ?', min_readiness),
+            ('readiness <= ?', max_readiness)
+        )
+        where = [clause for clause, value in conditions if value is not None]
+        params = [value for _, value in conditions if value is not None]
+        return where, params
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def store_from_env(default_path: Optional[str] = None) -> Optional[ResultStore]:
+    """SQLite store at ETHICA_RESULTS_PATH (else `default_path`, else none)"""
+    path = os.getenv('ETHICA_RESULTS_PATH') or default_path
+    return SQLiteResultStore(path) if path else None
@@ -3,6 +3,7 @@ Ethica.AI Modules
 All 10 analysis modules
 """
 
+from .pre_screen import PreScreen, ScreenRule, ScreenVerdict
 from .purpose_validator import PurposeValidator, ImpactScore
 from .insight_generator import InsightGenerator, InsightAnalysis
 from .context_analyzer import ContextAnalyzer, PerspectiveComparison
@@ -15,6 +16,9 @@ from .integration_engine import IntegrationEngine, IntegrationResult
 from .decision_orchestrator import DecisionOrchestrator, Decision
 
 __all__ = [
+    'PreScreen',
+    'ScreenRule',
+    'ScreenVerdict',
     'PurposeValidator',
     'ImpactScore',
     'InsightGenerator',
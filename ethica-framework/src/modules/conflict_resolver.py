@@ -5,10 +5,11 @@ Resolves conflicts between opportunities and risks (replaces Tiferet/Beauty)
 
 import os
 import json
-import google.generativeai as genai
 from typing import Dict, List
 from dataclasses import dataclass
 
+from providers import GeminiProvider
+
 
 @dataclass
 class ConflictResolution:
@@ -29,9 +30,13 @@ class ConflictResolver:
     4. Creates aesthetic coherence
     """
 
+    GENERATION_CONFIG = {
+        'temperature': 0.6,
+        'response_mime_type': "application/json"
+    }
+
     def __init__(self, api_key: str):
-        genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel('gemini-2.0-flash-exp')
+        self.llm = GeminiProvider(api_key)
 
     def resolve(
         self,
@@ -49,16 +54,20 @@ class ConflictResolver:
             ConflictResolution with balanced approach
         """
         prompt = self._build_prompt(opportunity_assessment, risk_assessment)
+        return self.llm.complete(prompt, parse=self._parse_response, **self.GENERATION_CONFIG)
 
-        response = self.model.generate_content(
-            prompt,
-            generation_config=genai.GenerationConfig(
-                temperature=0.6,
-                response_mime_type="application/json"
-            )
-        )
+    async def resolve_async(
+        self,
+        opportunity_assessment: 'OpportunityAssessment',
+        risk_assessment: 'RiskAssessment'
+    ) -> ConflictResolution:
+        """Async variant of `resolve`"""
+        prompt = self._build_prompt(opportunity_assessment, risk_assessment)
+        return await self.llm.complete_async(prompt, parse=self._parse_response, **self.GENERATION_CONFIG)
 
-        result = json.loads(response.text)
+    def _parse_response(self, text: str) -> ConflictResolution:
+        """Parse the model's JSON response"""
+        result = json.loads(text)
 
         return ConflictResolution(
             conflicts_resolved=result.get('conflicts_resolved', []),
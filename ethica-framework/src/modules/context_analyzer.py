@@ -5,10 +5,16 @@ Multi-perspective analysis with synthesis (replaces Binah-Σ)
 
 import os
 import json
-import google.generativeai as genai
+import contextvars
+import time
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
 from typing import Dict, List, Set
 from dataclasses import dataclass
 
+from providers import GeminiProvider, DeepSeekProvider, Failover, DeadlineExceeded
+from providers.deadline import bounded, expired
+
 
 @dataclass
 class PerspectiveComparison:
@@ -33,17 +39,36 @@ class ContextAnalyzer:
     - Synthesis: Meta-cognitive integration
     
     Automatically detects biases and generates emergent insights
+    
+    The contextual, individual and collective analyses are independent and
+    run concurrently; each branch must finish within `branch_timeout`
+    seconds. DeepSeek gets `deepseek_timeout` seconds before the collective
+    branch falls back to Gemini; while DeepSeek's circuit is open the
+    branch goes straight to Gemini.
     """
     
-    def __init__(self, gemini_api_key: str, deepseek_api_key: str):
+    DEEPSEEK_OPTIONS = {'temperature': 0.7}
+    SYNTHESIS_CONFIG = {'response_mime_type': "application/json"}
+    
+    def __init__(
+        self,
+        gemini_api_key: str,
+        deepseek_api_key: str,
+        branch_timeout: float = 120.0,
+        deepseek_timeout: float = 20.0
+    ):
         # Configure Gemini (Model B - Individual focus)
-        genai.configure(api_key=gemini_api_key)
-        self.gemini = genai.GenerativeModel('gemini-2.0-flash-exp')
+        self.gemini = GeminiProvider(gemini_api_key)
         
         # Configure DeepSeek (Model C - Collective focus)
-        # Note: Using requests library for DeepSeek API
-        self.deepseek_api_key = deepseek_api_key
-        self.deepseek_url = "https://api.deepseek.com/chat/completions"
+        self.deepseek = DeepSeekProvider(deepseek_api_key, timeout=deepseek_timeout)
+        
+        self.branch_timeout = branch_timeout
+        self.deepseek_timeout = deepseek_timeout
+        self.collective = Failover(
+            (self.deepseek, self.DEEPSEEK_OPTIONS, deepseek_timeout),
+            (self.gemini, {}, None)
+        )
     
     def analyze(
         self,
@@ -60,18 +85,96 @@ class ContextAnalyzer:
         Returns:
             PerspectiveComparison with synthesis
         """
-        # 1. Contextual analysis (baseline)
-        contextual = self._contextual_analysis(scenario)
+        # 1-3 are independent of each other: issue them concurrently
+        pool = ThreadPoolExecutor(max_workers=3)
+        
+        def submit(fn, *args):
+            # Branch threads keep the caller's context variables (telemetry)
+            return pool.submit(contextvars.copy_context().run, fn, *args)
         
-        # 2. Individual-focused perspective (Model B)
-        individual = self._individual_perspective(scenario, insight_analysis)
+        try:
+            branches = {
+                # 1. Contextual analysis (baseline)
+                'contextual': submit(self._contextual_analysis, scenario),
+                # 2. Individual-focused perspective (Model B)
+                'individual': submit(
+                    self._individual_perspective, scenario, insight_analysis
+                ),
+                # 3. Collective-focused perspective (Model C)
+                'collective': submit(
+                    self._collective_perspective, scenario, insight_analysis
+                )
+            }
+            
+            deadline = time.monotonic() + bounded(self.branch_timeout)
+            results = {}
+            for name, future in branches.items():
+                remaining = max(0.0, deadline - time.monotonic())
+                try:
+                    results[name] = future.result(timeout=remaining)
+                except FutureTimeout:
+                    if expired():
+                        raise DeadlineExceeded("Analysis deadline exceeded")
+                    raise TimeoutError(
+                        f"Context Analyzer branch '{name}' exceeded {self.branch_timeout}s"
+                    )
+        finally:
+            # Do not wait for a timed-out branch
+            pool.shutdown(wait=False)
         
-        # 3. Collective-focused perspective (Model C)
-        collective = self._collective_perspective(scenario, insight_analysis)
+        contextual = results['contextual']
+        individual = results['individual']
+        collective = results['collective']
         
-        # 4. Meta-cognitive synthesis
+        # 4. Meta-cognitive synthesis (needs both perspectives)
         synthesis_result = self._synthesize(individual, collective)
         
+        return self._build_comparison(
+            contextual, individual, collective, synthesis_result
+        )
+    
+    async def analyze_async(
+        self,
+        scenario: Dict[str, str],
+        insight_analysis: 'InsightAnalysis'
+    ) -> PerspectiveComparison:
+        """Async variant of `analyze`"""
+        contextual, individual, collective = await asyncio.gather(
+            self._branch(
+                'contextual', self._contextual_analysis_async(scenario)
+            ),
+            self._branch(
+                'individual', self._individual_perspective_async(scenario, insight_analysis)
+            ),
+            self._branch(
+                'collective', self._collective_perspective_async(scenario, insight_analysis)
+            )
+        )
+        synthesis_result = await self._synthesize_async(individual, collective)
+        
+        return self._build_comparison(
+            contextual, individual, collective, synthesis_result
+        )
+    
+    async def _branch(self, name: str, coroutine) -> str:
+        """Await one analysis branch under the per-branch timeout"""
+        try:
+            return await asyncio.wait_for(coroutine, bounded(self.branch_timeout))
+        except asyncio.TimeoutError:
+            if expired():
+                raise DeadlineExceeded("Analysis deadline exceeded")
+            raise TimeoutError(
+                f"Context Analyzer branch '{name}' exceeded {self.branch_timeout}s"
+            )
+    
+    def _build_comparison(
+        self,
+        contextual: str,
+        individual: str,
+        collective: str,
+        synthesis_result: Dict
+    ) -> PerspectiveComparison:
+        """Assemble the final comparison"""
         return PerspectiveComparison(
             contextual_analysis=contextual,
             individual_perspective=individual,
@@ -85,7 +188,13 @@ class ContextAnalyzer:
     
     def _contextual_analysis(self, scenario: Dict[str, str]) -> str:
         """Baseline contextual analysis"""
-        prompt = f"""
+        return self.gemini.complete(self._contextual_prompt(scenario))
+    
+    async def _contextual_analysis_async(self, scenario: Dict[str, str]) -> str:
+        return await self.gemini.complete_async(self._contextual_prompt(scenario))
+    
+    def _contextual_prompt(self, scenario: Dict[str, str]) -> str:
+        return f"""
 Provide contextual analysis of this scenario.
 
 Consider:
@@ -101,8 +210,6 @@ Scenario:
 Context:
 {scenario.get('context', '')}
 """
-        response = self.gemini.generate_content(prompt)
-        return response.text
     
     def _individual_perspective(
         self,
@@ -118,7 +225,23 @@ Context:
         - Utilitarian cost-benefit
         - Kantian categorical imperative
         """
-        prompt = f"""
+        prompt = self._individual_prompt(scenario, insight_analysis)
+        return self.gemini.complete(prompt)
+    
+    async def _individual_perspective_async(
+        self,
+        scenario: Dict[str, str],
+        insight_analysis: 'InsightAnalysis'
+    ) -> str:
+        prompt = self._individual_prompt(scenario, insight_analysis)
+        return await self.gemini.complete_async(prompt)
+    
+    def _individual_prompt(
+        self,
+        scenario: Dict[str, str],
+        insight_analysis: 'InsightAnalysis'
+    ) -> str:
+        return f"""
 Analyze this scenario from INDIVIDUAL-FOCUSED ethical frameworks:
 
 FRAMEWORKS TO APPLY:
@@ -146,8 +269,6 @@ Provide analysis focusing on:
 3. What are the deontological duties to individuals?
 4. Does this respect the social contract between individuals?
 """
-        response = self.gemini.generate_content(prompt)
-        return response.text
     
     def _collective_perspective(
         self,
@@ -163,10 +284,25 @@ Provide analysis focusing on:
         - Contextual flexibility
         - Relational ontology
         """
-        # Using DeepSeek API
-        import requests
+        prompt = self._collective_prompt(scenario, insight_analysis)
         
-        prompt = f"""
+        # Fallback to Gemini if DeepSeek fails
+        return self.collective.complete(prompt)
+    
+    async def _collective_perspective_async(
+        self,
+        scenario: Dict[str, str],
+        insight_analysis: 'InsightAnalysis'
+    ) -> str:
+        prompt = self._collective_prompt(scenario, insight_analysis)
+        return await self.collective.complete_async(prompt)
+    
+    def _collective_prompt(
+        self,
+        scenario: Dict[str, str],
+        insight_analysis: 'InsightAnalysis'
+    ) -> str:
+        return f"""
 Analyze this scenario from COLLECTIVE-FOCUSED ethical frameworks:
 
 FRAMEWORKS TO APPLY:
@@ -194,34 +330,6 @@ Provide analysis focusing on:
 3. How does this cultivate societal virtue?
 4. What are the relational implications (not just individual)?
 """
-        
-        headers = {
-            "Authorization": f"Bearer {self.deepseek_api_key}",
-            "Content-Type": "application/json"
-        }
-        
-        data = {
-            "model": "deepseek-chat",
-            "messages": [
-                {"role": "user", "content": prompt}
-            ],
-            "temperature": 0.7
-        }
-        
-        try:
-            response = requests.post(
-                self.deepseek_url,
-                headers=headers,
-                json=data,
-                timeout=60
-            )
-            result = response.json()
-            return result['choices'][0]['message']['content']
-        except Exception as e:
-            # Fallback to Gemini if DeepSeek fails
-            print(f"⚠️  DeepSeek unavailable, using Gemini fallback: {e}")
-            response = self.gemini.generate_content(prompt)
-            return response.text
     
     def _synthesize(
         self,
@@ -237,17 +345,46 @@ Provide analysis focusing on:
         - Biases (assumptions one side makes that other doesn't)
         - Synthesis (emergent wisdom)
         """
+        comparison = self._compare_keywords(individual, collective)
+        return self.gemini.complete(
+            self._synthesis_prompt(*comparison),
+            parse=lambda text: self._synthesis_result(comparison, text),
+            **self.SYNTHESIS_CONFIG
+        )
+    
+    async def _synthesize_async(
+        self,
+        individual: str,
+        collective: str
+    ) -> Dict:
+        comparison = self._compare_keywords(individual, collective)
+        return await self.gemini.complete_async(
+            self._synthesis_prompt(*comparison),
+            parse=lambda text: self._synthesis_result(comparison, text),
+            **self.SYNTHESIS_CONFIG
+        )
+    
+    def _compare_keywords(self, individual: str, collective: str) -> tuple:
+        """Split keywords into (convergence, individual-only, collective-only)"""
         # Extract keywords
         individual_keywords = self._extract_keywords(individual)
         collective_keywords = self._extract_keywords(collective)
         
         # Find convergence and divergence
-        convergence = list(set(individual_keywords) & set(collective_keywords))
-        individual_unique = list(set(individual_keywords) - set(collective_keywords))
-        collective_unique = list(set(collective_keywords) - set(individual_keywords))
+        convergence = sorted(set(individual_keywords) & set(collective_keywords))
+        individual_unique = sorted(set(individual_keywords) - set(collective_keywords))
+        collective_unique = sorted(set(collective_keywords) - set(individual_keywords))
         
+        return convergence, individual_unique, collective_unique
+    
+    def _synthesis_prompt(
+        self,
+        convergence: List[str],
+        individual_unique: List[str],
+        collective_unique: List[str]
+    ) -> str:
         # Generate meta-synthesis
-        synthesis_prompt = f"""
+        return f"""
 Meta-cognitive synthesis of two perspectives:
 
 INDIVIDUAL-FOCUSED PERSPECTIVE emphasized:
@@ -287,15 +424,10 @@ Respond with JSON:
     "quality": <0.0 to 1.0 integration quality score>
 }}
 """
-        
-        response = self.gemini.generate_content(
-            synthesis_prompt,
-            generation_config=genai.GenerationConfig(
-                response_mime_type="application/json"
-            )
-        )
-        
-        result = json.loads(response.text)
+    
+    def _synthesis_result(self, comparison: tuple, text: str) -> Dict:
+        convergence, individual_unique, collective_unique = comparison
+        result = json.loads(text)
         
         return {
             'convergence': convergence[:10],
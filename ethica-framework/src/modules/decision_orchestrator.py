@@ -5,10 +5,11 @@ Makes final decision based on integrated analysis (replaces Malchut/Kingdom)
 
 import os
 import json
-import google.generativeai as genai
 from typing import List
 from dataclasses import dataclass
 
+from providers import GeminiProvider
+
 
 @dataclass
 class Decision:
@@ -36,9 +37,13 @@ class DecisionOrchestrator:
     - Implementation feasibility
     """
 
+    GENERATION_CONFIG = {
+        'temperature': 0.2,
+        'response_mime_type': "application/json"
+    }
+
     def __init__(self, api_key: str):
-        genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel('gemini-2.0-flash-exp')
+        self.llm = GeminiProvider(api_key)
 
     def orchestrate(self, integration: 'IntegrationResult') -> Decision:
         """
@@ -51,16 +56,16 @@ class DecisionOrchestrator:
             Decision with approval/rejection and conditions
         """
         prompt = self._build_prompt(integration)
+        return self.llm.complete(prompt, parse=self._parse_response, **self.GENERATION_CONFIG)
 
-        response = self.model.generate_content(
-            prompt,
-            generation_config=genai.GenerationConfig(
-                temperature=0.2,
-                response_mime_type="application/json"
-            )
-        )
+    async def orchestrate_async(self, integration: 'IntegrationResult') -> Decision:
+        """Async variant of `orchestrate`"""
+        prompt = self._build_prompt(integration)
+        return await self.llm.complete_async(prompt, parse=self._parse_response, **self.GENERATION_CONFIG)
 
-        result = json.loads(response.text)
+    def _parse_response(self, text: str) -> Decision:
+        """Parse the model's JSON response"""
+        result = json.loads(text)
 
         # Determine approval
         approval_type = result.get('approval_type', 'REJECTED')
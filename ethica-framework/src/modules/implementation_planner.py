@@ -5,10 +5,11 @@ Plans concrete implementation steps with precision (replaces Hod/Glory)
 
 import os
 import json
-import google.generativeai as genai
 from typing import Dict, List
 from dataclasses import dataclass
 
+from providers import GeminiProvider
+
 
 @dataclass
 class ImplementationPlan:
@@ -29,9 +30,13 @@ class ImplementationPlanner:
     4. Known unknowns (epistemic humility)
     """
 
+    GENERATION_CONFIG = {
+        'temperature': 0.4,
+        'response_mime_type': "application/json"
+    }
+
     def __init__(self, api_key: str):
-        genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel('gemini-2.0-flash-exp')
+        self.llm = GeminiProvider(api_key)
 
     def plan(
         self,
@@ -49,16 +54,20 @@ class ImplementationPlanner:
             ImplementationPlan with phased approach
         """
         prompt = self._build_prompt(scenario, conflict_resolution)
+        return self.llm.complete(prompt, parse=self._parse_response, **self.GENERATION_CONFIG)
 
-        response = self.model.generate_content(
-            prompt,
-            generation_config=genai.GenerationConfig(
-                temperature=0.4,
-                response_mime_type="application/json"
-            )
-        )
+    async def plan_async(
+        self,
+        scenario: Dict[str, str],
+        conflict_resolution: 'ConflictResolution'
+    ) -> ImplementationPlan:
+        """Async variant of `plan`"""
+        prompt = self._build_prompt(scenario, conflict_resolution)
+        return await self.llm.complete_async(prompt, parse=self._parse_response, **self.GENERATION_CONFIG)
 
-        result = json.loads(response.text)
+    def _parse_response(self, text: str) -> ImplementationPlan:
+        """Parse the model's JSON response"""
+        result = json.loads(text)
 
         return ImplementationPlan(
             phases=result.get('phases', []),
@@ -5,10 +5,11 @@ Deep insight generation via Mistral AI (replaces Chochmah/Wisdom)
 
 import os
 import json
-from mistralai import Mistral
-from typing import Dict, List
+from typing import Dict, List, Optional
 from dataclasses import dataclass
 
+from providers import MistralProvider, GeminiProvider, Failover
+
 
 @dataclass
 class InsightAnalysis:
@@ -28,11 +29,27 @@ class InsightGenerator:
     2. Identify non-obvious implications
     3. Acknowledge uncertainties with epistemic humility
     4. Provide confidence assessment
+    
+    If `fallback_api_key` is given, Gemini answers when Mistral fails or
+    its circuit is open.
     """
     
-    def __init__(self, api_key: str):
-        self.client = Mistral(api_key=api_key)
-        self.model = "mistral-large-latest"
+    COMPLETION_OPTIONS = {
+        'response_format': {"type": "json_object"},
+        'temperature': 0.7
+    }
+    FALLBACK_OPTIONS = {
+        'response_mime_type': "application/json",
+        'temperature': 0.7
+    }
+    
+    def __init__(self, api_key: str, fallback_api_key: Optional[str] = None):
+        self.llm = MistralProvider(api_key)
+        self.fallback = GeminiProvider(fallback_api_key) if fallback_api_key else None
+        routes = [(self.llm, self.COMPLETION_OPTIONS, None)]
+        if self.fallback is not None:
+            routes.append((self.fallback, self.FALLBACK_OPTIONS, None))
+        self.route = Failover(*routes)
     
     def generate(
         self,
@@ -50,20 +67,20 @@ class InsightGenerator:
             InsightAnalysis with insights and confidence
         """
         prompt = self._build_prompt(scenario, impact_score)
-        
-        response = self.client.chat.complete(
-            model=self.model,
-            messages=[
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            response_format={"type": "json_object"},
-            temperature=0.7
-        )
-        
-        result = json.loads(response.choices[0].message.content)
+        return self.route.complete(prompt, parse=self._parse_response)
+    
+    async def generate_async(
+        self,
+        scenario: Dict[str, str],
+        impact_score: 'ImpactScore'
+    ) -> InsightAnalysis:
+        """Async variant of `generate`"""
+        prompt = self._build_prompt(scenario, impact_score)
+        return await self.route.complete_async(prompt, parse=self._parse_response)
+    
+    def _parse_response(self, text: str) -> InsightAnalysis:
+        """Parse the model's JSON response"""
+        result = json.loads(text)
         
         return InsightAnalysis(
             understanding=result.get('understanding', ''),
@@ -5,10 +5,11 @@ Integrates all analyses into unified assessment (replaces Yesod/Foundation)
 
 import os
 import json
-import google.generativeai as genai
 from typing import Dict, Any
 from dataclasses import dataclass
 
+from providers import GeminiProvider
+
 
 @dataclass
 class IntegrationResult:
@@ -34,9 +35,13 @@ class IntegrationEngine:
     - Go/no-go recommendation
     """
 
+    GENERATION_CONFIG = {
+        'temperature': 0.3,
+        'response_mime_type': "application/json"
+    }
+
     def __init__(self, api_key: str):
-        genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel('gemini-2.0-flash-exp')
+        self.llm = GeminiProvider(api_key)
 
     def integrate(
         self,
@@ -68,16 +73,35 @@ class IntegrationEngine:
             sustainability,
             implementation
         )
+        return self.llm.complete(prompt, parse=self._parse_response, **self.GENERATION_CONFIG)
 
-        response = self.model.generate_content(
-            prompt,
-            generation_config=genai.GenerationConfig(
-                temperature=0.3,
-                response_mime_type="application/json"
-            )
+    async def integrate_async(
+        self,
+        impact_score: Any,
+        insight_analysis: Any,
+        perspective_comparison: Any,
+        opportunity_assessment: Any,
+        risk_assessment: Any,
+        conflict_resolution: Any,
+        sustainability: Any,
+        implementation: Any
+    ) -> IntegrationResult:
+        """Async variant of `integrate`"""
+        prompt = self._build_prompt(
+            impact_score,
+            insight_analysis,
+            perspective_comparison,
+            opportunity_assessment,
+            risk_assessment,
+            conflict_resolution,
+            sustainability,
+            implementation
         )
+        return await self.llm.complete_async(prompt, parse=self._parse_response, **self.GENERATION_CONFIG)
 
-        result = json.loads(response.text)
+    def _parse_response(self, text: str) -> IntegrationResult:
+        """Parse the model's JSON response"""
+        result = json.loads(text)
 
         readiness = result.get('readiness_score', 0.5)
         complexity = result.get('integration_complexity', 0.5)
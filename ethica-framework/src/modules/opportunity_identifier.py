@@ -5,10 +5,11 @@ Identifies positive opportunities and beneficiaries (replaces Chesed/Kindness)
 
 import os
 import json
-import google.generativeai as genai
 from typing import Dict, List
 from dataclasses import dataclass
 
+from providers import GeminiProvider
+
 
 @dataclass
 class OpportunityAssessment:
@@ -30,9 +31,13 @@ class OpportunityIdentifier:
     4. What is the compassion quotient?
     """
 
+    GENERATION_CONFIG = {
+        'temperature': 0.7,
+        'response_mime_type': "application/json"
+    }
+
     def __init__(self, api_key: str):
-        genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel('gemini-2.0-flash-exp')
+        self.llm = GeminiProvider(api_key)
 
     def identify(
         self,
@@ -50,16 +55,20 @@ class OpportunityIdentifier:
             OpportunityAssessment with identified opportunities
         """
         prompt = self._build_prompt(scenario, perspective_comparison)
+        return self.llm.complete(prompt, parse=self._parse_response, **self.GENERATION_CONFIG)
 
-        response = self.model.generate_content(
-            prompt,
-            generation_config=genai.GenerationConfig(
-                temperature=0.7,
-                response_mime_type="application/json"
-            )
-        )
+    async def identify_async(
+        self,
+        scenario: Dict[str, str],
+        perspective_comparison: 'PerspectiveComparison'
+    ) -> OpportunityAssessment:
+        """Async variant of `identify`"""
+        prompt = self._build_prompt(scenario, perspective_comparison)
+        return await self.llm.complete_async(prompt, parse=self._parse_response, **self.GENERATION_CONFIG)
 
-        result = json.loads(response.text)
+    def _parse_response(self, text: str) -> OpportunityAssessment:
+        """Parse the model's JSON response"""
+        result = json.loads(text)
 
         return OpportunityAssessment(
             opportunities=result.get('opportunities', []),
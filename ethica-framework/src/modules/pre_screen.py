@@ -0,0 +1,204 @@
+"""
+Pre-Screen Module
+Local keyword screen ahead of the Purpose Validator (no LLM call)
+
+Obviously disqualifying or junk submissions are rejected before any
+provider is called; borderline ones are flagged and analyzed as usual.
+"""
+
+import re
+import time
+import unicodedata
+from typing import Dict, List, Optional, Sequence, Tuple
+from dataclasses import dataclass, field
+
+
+PASS = 'PASS'
+FLAG = 'FLAG'
+REJECT = 'REJECT'
+
+
+@dataclass
+class ScreenRule:
+    """
+    Red-flag terms sharing one risk weight
+
+    A term ending in '*' matches any word starting with it
+    ('manipulat*' matches 'manipulate' and 'manipulation').
+    """
+    name: str
+    category: str
+    terms: Tuple[str, ...]
+    weight: float  # 0.0 to 1.0, risk contributed when any term matches
+
+
+@dataclass
+class ScreenVerdict:
+    """Pre-screen result"""
+    verdict: str  # PASS, FLAG, REJECT
+    risk: float  # 0.0 to 1.0
+    matches: List[Dict[str, str]] = field(default_factory=list)  # rule, category, term
+    reasoning: str = ''
+    elapsed_us: float = 0.0
+
+
+# English and Spanish red flags (the Spanish ones follow Keter's heuristics).
+# A single rule never reaches the default reject threshold on its own.
+DEFAULT_RULES: Tuple[ScreenRule, ...] = (
+    ScreenRule('covert_surveillance', 'surveillance', (
+        'mass surveillance', 'covert surveillance', 'secretly monitor*', 'secretly track*',
+        'secretly record*', 'spy on', 'without their knowledge', 'vigilancia masiva', 'espiar'
+    ), 0.7),
+    ScreenRule('surveillance', 'surveillance', (
+        'surveillance', 'facial recognition', 'keystroke logging', 'track location*',
+        'vigilancia', 'reconocimiento facial'
+    ), 0.4),
+    ScreenRule('workplace_monitoring', 'surveillance', (
+        'monitor employee*', 'track employee*', 'monitor worker*', 'track worker*',
+        'employee tracking', 'productivity tracking', 'monitorear empleados'
+    ), 0.5),
+    ScreenRule('consent_bypass', 'autonomy', (
+        'without consent', 'without their consent', 'bypass consent', 'cannot opt out',
+        'no opt-out', 'sin consentimiento'
+    ), 0.6),
+    ScreenRule('coercion', 'autonomy', (
+        'coerce*', 'blackmail*', 'intimidat*', 'forzar', 'obligar', 'coaccionar'
+    ), 0.6),
+    ScreenRule('manipulation', 'truthfulness', (
+        'manipulat*', 'deceiv*', 'mislead*', 'disinformation', 'fake review*',
+        'falsify*', 'hide from regulators', 'manipular', 'enganar', 'mentira', 'ocultar'
+    ), 0.5),
+    ScreenRule('discrimination', 'justice', (
+        'racial profiling', 'based on race', 'based on ethnicity', 'based on religion',
+        'exclude minorities', 'discriminat*'
+    ), 0.6),
+    ScreenRule('violence', 'harm', (
+        'weaponize', 'weaponizing', 'kill', 'killing', 'torture', 'torturing',
+        'bioweapon', 'bioweapons', 'venganza', 'cruel'
+    ), 0.6),
+)
+
+
+def normalize(text: str) -> str:
+    """Lowercase without accents, so 'Engaño' matches 'engano'"""
+    text = text.lower()
+    if text.isascii():
+        return text
+    decomposed = unicodedata.normalize('NFKD', text)
+    return ''.join(c for c in decomposed if not unicodedata.combining(c))
+
+
+class PreScreen:
+    """
+    Deterministic screen of a scenario in microseconds
+
+    All rule terms are compiled into one regular expression (one named
+    group per rule), so the scenario text is scanned once. Matched rules
+    combine as independent signals: risk = 1 - prod(1 - weight). Junk
+    input (empty, too short, mostly symbols, repeated characters) adds
+    its own signals; of those, only an empty action rejects on its own.
+
+    Verdict: REJECT at `reject_threshold`, FLAG at `flag_threshold`,
+    otherwise PASS.
+    """
+
+    def __init__(
+        self,
+        rules: Sequence[ScreenRule] = DEFAULT_RULES,
+        reject_threshold: float = 0.9,
+        flag_threshold: float = 0.5,
+        min_words: int = 3
+    ):
+        if not 0 < flag_threshold <= reject_threshold <= 1:
+            raise ValueError("Expected 0 < flag_threshold <= reject_threshold <= 1")
+        self.rules = list(rules)
+        self.reject_threshold = reject_threshold
+        self.flag_threshold = flag_threshold
+        self.min_words = min_words
+        self._pattern = self._compile(self.rules)
+
+    @staticmethod
+    def _compile(rules: Sequence[ScreenRule]) -> Optional['re.Pattern']:
+        groups = []
+        for i, rule in enumerate(rules):
+            terms = []
+            # Longest first, so 'secretly monitor' wins over a shorter term
+            for term in sorted(rule.terms, key=len, reverse=True):
+                term = normalize(term)
+                if term.endswith('*'):
+                    terms.append(re.escape(term[:-1]) + r'\w*')
+                else:
+                    terms.append(re.escape(term))
+            groups.append(f"(?P<r{i}>{'|'.join(terms)})")
+        if not groups:
+            return None
+        return re.compile(r'\b(?:' + '|'.join(groups) + r')\b')
+
+    def screen(self, scenario: Dict[str, str]) -> ScreenVerdict:
+        """
+        Screen scenario's action and context
+
+        Args:
+            scenario: Dict with 'action' and 'context'
+
+        Returns:
+            ScreenVerdict with the matched rules and the combined risk
+        """
+        start = time.perf_counter()
+        action = scenario.get('action') or ''
+        text = normalize(f"{action}\n{scenario.get('context') or ''}")
+
+        signals: Dict[str, Tuple[float, Dict[str, str]]] = {}
+        if self._pattern is not None:
+            for match in self._pattern.finditer(text):
+                rule = self.rules[int(match.lastgroup[1:])]
+                if rule.name not in signals:
+                    signals[rule.name] = (rule.weight, {
+                        'rule': rule.name, 'category': rule.category, 'term': match.group()
+                    })
+        for name, weight, reason in self._junk_signals(action, text):
+            signals[name] = (weight, {'rule': name, 'category': 'junk', 'term': reason})
+
+        safe = 1.0
+        for weight, _ in signals.values():
+            safe *= 1.0 - weight
+        risk = 1.0 - safe
+
+        if risk >= self.reject_threshold:
+            verdict = REJECT
+        elif risk >= self.flag_threshold:
+            verdict = FLAG
+        else:
+            verdict = PASS
+
+        matches = [m for _, m in signals.values()]
+        return ScreenVerdict(
+            verdict=verdict,
+            risk=risk,
+            matches=matches,
+            reasoning=self._reasoning(verdict, risk, matches),
+            elapsed_us=(time.perf_counter() - start) * 1e6
+        )
+
+    def _junk_signals(self, action: str, text: str) -> List[Tuple[str, float, str]]:
+        signals = []
+        if not action.strip():
+            signals.append(('empty_action', 1.0, 'no action given'))
+            return signals
+        if len(text.split()) < self.min_words:
+            signals.append(('too_short', 0.5, f"fewer than {self.min_words} words"))
+        letters = sum(c.isalpha() for c in text)
+        visible = sum(not c.isspace() for c in text)
+        if visible and letters / visible < 0.5:
+            # Flags alone (tables, version numbers); rejects with a second junk signal
+            signals.append(('not_text', 0.8, 'mostly symbols or digits'))
+        if re.search(r'(.)\1{9,}', text):
+            signals.append(('repeated_characters', 0.6, 'long run of one character'))
+        return signals
+
+    @staticmethod
+    def _reasoning(verdict: str, risk: float, matches: List[Dict[str, str]]) -> str:
+        if not matches:
+            return "No red flags"
+        found = ', '.join(f"{m['category']}: '{m['term']}'" for m in matches)
+        return f"{verdict} at risk {risk:.0%} ({found})"
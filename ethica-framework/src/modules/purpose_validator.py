@@ -5,10 +5,11 @@ Validates alignment with positive global impact (replaces Keter/Crown)
 
 import os
 import json
-import google.generativeai as genai
 from typing import Dict, List
 from dataclasses import dataclass
 
+from providers import GeminiProvider
+
 
 @dataclass
 class ImpactScore:
@@ -38,9 +39,13 @@ class PurposeValidator:
     Threshold: ≥60% impact score for approval
     """
     
+    GENERATION_CONFIG = {
+        'temperature': 0.3,
+        'response_mime_type': "application/json"
+    }
+    
     def __init__(self, api_key: str):
-        genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel('gemini-2.0-flash-exp')
+        self.llm = GeminiProvider(api_key)
         self.threshold = 0.60
     
     def validate(self, scenario: Dict[str, str]) -> ImpactScore:
@@ -54,16 +59,16 @@ class PurposeValidator:
             ImpactScore with validation results
         """
         prompt = self._build_prompt(scenario)
-        
-        response = self.model.generate_content(
-            prompt,
-            generation_config=genai.GenerationConfig(
-                temperature=0.3,
-                response_mime_type="application/json"
-            )
-        )
-        
-        result = json.loads(response.text)
+        return self.llm.complete(prompt, parse=self._parse_response, **self.GENERATION_CONFIG)
+    
+    async def validate_async(self, scenario: Dict[str, str]) -> ImpactScore:
+        """Async variant of `validate`"""
+        prompt = self._build_prompt(scenario)
+        return await self.llm.complete_async(prompt, parse=self._parse_response, **self.GENERATION_CONFIG)
+    
+    def _parse_response(self, text: str) -> ImpactScore:
+        """Score the model's JSON response"""
+        result = json.loads(text)
         
         # Calculate impact score
         total = sum([
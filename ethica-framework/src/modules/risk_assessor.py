@@ -5,10 +5,11 @@ Assesses risks, constraints, and boundaries (replaces Gevurah/Strength)
 
 import os
 import json
-import google.generativeai as genai
 from typing import Dict, List
 from dataclasses import dataclass
 
+from providers import GeminiProvider
+
 
 @dataclass
 class RiskAssessment:
@@ -30,9 +31,13 @@ class RiskAssessor:
     4. How severe are the risks?
     """
 
+    GENERATION_CONFIG = {
+        'temperature': 0.5,
+        'response_mime_type': "application/json"
+    }
+
     def __init__(self, api_key: str):
-        genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel('gemini-2.0-flash-exp')
+        self.llm = GeminiProvider(api_key)
 
     def assess(
         self,
@@ -50,16 +55,20 @@ class RiskAssessor:
             RiskAssessment with identified risks
         """
         prompt = self._build_prompt(scenario, perspective_comparison)
+        return self.llm.complete(prompt, parse=self._parse_response, **self.GENERATION_CONFIG)
 
-        response = self.model.generate_content(
-            prompt,
-            generation_config=genai.GenerationConfig(
-                temperature=0.5,
-                response_mime_type="application/json"
-            )
-        )
+    async def assess_async(
+        self,
+        scenario: Dict[str, str],
+        perspective_comparison: 'PerspectiveComparison'
+    ) -> RiskAssessment:
+        """Async variant of `assess`"""
+        prompt = self._build_prompt(scenario, perspective_comparison)
+        return await self.llm.complete_async(prompt, parse=self._parse_response, **self.GENERATION_CONFIG)
 
-        result = json.loads(response.text)
+    def _parse_response(self, text: str) -> RiskAssessment:
+        """Parse the model's JSON response"""
+        result = json.loads(text)
 
         return RiskAssessment(
             risks=result.get('risks', []),
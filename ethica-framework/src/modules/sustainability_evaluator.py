@@ -5,10 +5,11 @@ Evaluates long-term sustainability and endurance (replaces Netzach/Eternity)
 
 import os
 import json
-import google.generativeai as genai
 from typing import Dict, List
 from dataclasses import dataclass
 
+from providers import GeminiProvider
+
 
 @dataclass
 class SustainabilityEvaluation:
@@ -30,9 +31,13 @@ class SustainabilityEvaluator:
     4. What is the long-term trajectory?
     """
 
+    GENERATION_CONFIG = {
+        'temperature': 0.5,
+        'response_mime_type': "application/json"
+    }
+
     def __init__(self, api_key: str):
-        genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel('gemini-2.0-flash-exp')
+        self.llm = GeminiProvider(api_key)
 
     def evaluate(
         self,
@@ -50,16 +55,20 @@ class SustainabilityEvaluator:
             SustainabilityEvaluation with sustainability assessment
         """
         prompt = self._build_prompt(scenario, conflict_resolution)
+        return self.llm.complete(prompt, parse=self._parse_response, **self.GENERATION_CONFIG)
 
-        response = self.model.generate_content(
-            prompt,
-            generation_config=genai.GenerationConfig(
-                temperature=0.5,
-                response_mime_type="application/json"
-            )
-        )
+    async def evaluate_async(
+        self,
+        scenario: Dict[str, str],
+        conflict_resolution: 'ConflictResolution'
+    ) -> SustainabilityEvaluation:
+        """Async variant of `evaluate`"""
+        prompt = self._build_prompt(scenario, conflict_resolution)
+        return await self.llm.complete_async(prompt, parse=self._parse_response, **self.GENERATION_CONFIG)
 
-        result = json.loads(response.text)
+    def _parse_response(self, text: str) -> SustainabilityEvaluation:
+        """Parse the model's JSON response"""
+        result = json.loads(text)
 
         return SustainabilityEvaluation(
             sustainability_score=result.get('sustainability_score', 0.5),
@@ -0,0 +1,51 @@
+"""
+Ethica.AI Providers
+LLM provider clients shared by all analysis modules
+"""
+
+from .base import LLMProvider
+from .cache import ResponseCache, MemoryCache, SQLiteCache, TieredCache, cache_key
+from .ratelimit import TokenBucket
+from .singleflight import SingleFlight
+from .retry import RetryPolicy, HedgePolicy, is_retryable
+from .deadline import DeadlineExceeded, deadline_scope
+from .breaker import CircuitBreaker, CircuitBreakers, CircuitOpen, Failover
+from .telemetry import Telemetry, TelemetryCollector
+from .transport import (
+    Transport, RecordingTransport, ReplayTransport, Cassette, CassetteMiss
+)
+from .gemini import GeminiProvider
+from .mistral import MistralProvider
+from .deepseek import DeepSeekProvider, DeepSeekClient, shared_client
+
+__all__ = [
+    'LLMProvider',
+    'ResponseCache',
+    'MemoryCache',
+    'SQLiteCache',
+    'TieredCache',
+    'cache_key',
+    'TokenBucket',
+    'SingleFlight',
+    'RetryPolicy',
+    'HedgePolicy',
+    'is_retryable',
+    'DeadlineExceeded',
+    'deadline_scope',
+    'CircuitBreaker',
+    'CircuitBreakers',
+    'CircuitOpen',
+    'Failover',
+    'Telemetry',
+    'TelemetryCollector',
+    'Transport',
+    'RecordingTransport',
+    'ReplayTransport',
+    'Cassette',
+    'CassetteMiss',
+    'GeminiProvider',
+    'MistralProvider',
+    'DeepSeekProvider',
+    'DeepSeekClient',
+    'shared_client'
+]
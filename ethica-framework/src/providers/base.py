@@ -0,0 +1,269 @@
+"""
+Provider Base
+Common interface for synchronous and asynchronous completions
+"""
+
+import asyncio
+import time
+from typing import Any, Callable, Optional
+
+from .breaker import CircuitBreaker
+from .cache import ResponseCache, cache_key
+from .deadline import DeadlineExceeded, check_deadline, expired, remaining
+from .ratelimit import TokenBucket
+from .retry import RetryPolicy, HedgePolicy, is_retryable
+from .singleflight import SingleFlight
+from .telemetry import CallSpan, provider_call, current_call
+from .transport import Transport
+
+# Turns response text into the caller's result; raises if it is malformed
+Parser = Callable[[str], Any]
+
+
+class LLMProvider:
+    """
+    Base class for LLM providers
+
+    Every module talks to its model through `complete` (blocking) or
+    `complete_async` (coroutine). Both take a prompt plus provider
+    options and return the raw response text, or `parse(text)` when a
+    `parse` function is given.
+
+    If `cache` is set, responses are looked up by
+    (provider, model, prompt, options) before any network call. A
+    response is stored only once `parse` accepts it, so a malformed
+    answer is asked for again instead of being served from the cache.
+    If `rate_limiter` is set, every network call first takes a token
+    from it (the bucket is usually shared by all clients of a provider).
+    If `single_flight` is set, identical requests that are already in
+    flight wait for that call instead of issuing their own.
+    If `transport` is set, it carries the request instead of the
+    provider's client (used to record and replay calls offline).
+    If `retry_policy` is set, transient failures (429, 5xx, timeouts)
+    are retried with backoff; if `hedge_policy` is set, a slow attempt
+    is raced against a second identical request.
+    If `breaker` is set, calls are refused with CircuitOpen while the
+    endpoint is failing or too slow, so callers can fail over at once;
+    the breaker sees one outcome per call, after its retries.
+    While telemetry is active every call is recorded as a CallSpan.
+    """
+
+    name = 'base'
+
+    def __init__(
+        self,
+        model: str,
+        cache: Optional[ResponseCache] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        single_flight: Optional[SingleFlight] = None,
+        transport: Optional[Transport] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        breaker: Optional[CircuitBreaker] = None
+    ):
+        self.model = model
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.single_flight = single_flight
+        self.transport = transport
+        self.retry_policy = retry_policy
+        self.hedge_policy = hedge_policy
+        self.breaker = breaker
+
+    @property
+    def endpoint(self) -> str:
+        """What a circuit breaker guards (the model, or the URL if the provider has one)"""
+        return getattr(self, 'url', None) or self.model
+
+    def complete(self, prompt: str, parse: Optional[Parser] = None, **options: Any) -> Any:
+        """Blocking completion"""
+        with provider_call(self, prompt) as call:
+            text = self._complete(call, prompt, options, parse)
+            if call is not None and call.prompt is not None:
+                call.response = text
+            return parse(text) if parse is not None else text
+
+    async def complete_async(
+        self, prompt: str, parse: Optional[Parser] = None, **options: Any
+    ) -> Any:
+        """Non-blocking completion for use inside an event loop"""
+        with provider_call(self, prompt) as call:
+            text = await self._complete_async(call, prompt, options, parse)
+            if call is not None and call.prompt is not None:
+                call.response = text
+            return parse(text) if parse is not None else text
+
+    def _complete(
+        self, call: Optional[CallSpan], prompt: str, options: dict, parse: Optional[Parser]
+    ) -> str:
+        key = self._request_key(prompt, options)
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                if call is not None:
+                    call.cache_hit = True
+                return cached
+
+        if self.single_flight is not None:
+            if call is not None:
+                call.collapsed = True  # Cleared if this call goes upstream
+            return self.single_flight.do(key, lambda: self._fetch(key, prompt, options, parse))
+        return self._fetch(key, prompt, options, parse)
+
+    async def _complete_async(
+        self, call: Optional[CallSpan], prompt: str, options: dict, parse: Optional[Parser]
+    ) -> str:
+        key = self._request_key(prompt, options)
+        if self.cache is not None:
+            cached = await self.cache.get_async(key)
+            if cached is not None:
+                if call is not None:
+                    call.cache_hit = True
+                return cached
+
+        if self.single_flight is not None:
+            if call is not None:
+                call.collapsed = True
+            return await self.single_flight.do_async(
+                key, lambda: self._fetch_async(key, prompt, options, parse)
+            )
+        return await self._fetch_async(key, prompt, options, parse)
+
+    def _fetch(
+        self, key: Optional[str], prompt: str, options: dict, parse: Optional[Parser]
+    ) -> str:
+        """
+        Upstream call (with retries and hedging); stores the response in
+        the cache once `parse` (if any) accepts it
+        """
+        self._mark_upstream()
+        attempt = lambda: self._attempt(prompt, options)
+        if self.hedge_policy is not None:
+            unhedged = attempt
+            attempt = lambda: self.hedge_policy.run(self.name, unhedged)
+        if self.breaker is not None:
+            self.breaker.before_call()
+        start = time.monotonic()
+        try:
+            if self.retry_policy is not None:
+                text = self.retry_policy.run(attempt)
+            else:
+                text = attempt()
+        except Exception as e:
+            self._record_failure(e, start)
+            raise
+        if self.breaker is not None:
+            self.breaker.record(False, time.monotonic() - start)
+
+        if self.cache is not None:
+            if parse is not None:
+                parse(text)
+            self.cache.set(key, text)
+        return text
+
+    async def _fetch_async(
+        self, key: Optional[str], prompt: str, options: dict, parse: Optional[Parser]
+    ) -> str:
+        self._mark_upstream()
+        attempt = lambda: self._attempt_async(prompt, options)
+        if self.hedge_policy is not None:
+            unhedged = attempt
+            attempt = lambda: self.hedge_policy.run_async(self.name, unhedged)
+        if self.breaker is not None:
+            self.breaker.before_call()
+        start = time.monotonic()
+        try:
+            if self.retry_policy is not None:
+                text = await self.retry_policy.run_async(attempt)
+            else:
+                text = await attempt()
+        except asyncio.CancelledError:
+            if self.breaker is not None:
+                self.breaker.record(None, time.monotonic() - start)  # Abandoned by the caller
+            raise
+        except Exception as e:
+            self._record_failure(e, start)
+            raise
+        if self.breaker is not None:
+            self.breaker.record(False, time.monotonic() - start)
+
+        if self.cache is not None:
+            if parse is not None:
+                parse(text)
+            await self.cache.set_async(key, text)
+        return text
+
+    def _attempt(self, prompt: str, options: dict) -> str:
+        """One rate-limited request (the breaker judges the whole call, see _fetch)"""
+        check_deadline()
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+
+        try:
+            return self._request(prompt, options)
+        except Exception as e:
+            if expired():
+                # The client timeout was cut short by the analysis deadline
+                raise DeadlineExceeded("Analysis deadline exceeded") from e
+            raise
+
+    async def _attempt_async(self, prompt: str, options: dict) -> str:
+        check_deadline()
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async()
+
+        left = remaining()
+        try:
+            if left is None:
+                return await self._request_async(prompt, options)
+            # The request is abandoned as soon as the analysis runs out of time
+            return await asyncio.wait_for(self._request_async(prompt, options), max(left, 0))
+        except Exception as e:
+            if expired():
+                raise DeadlineExceeded("Analysis deadline exceeded") from e
+            raise
+
+    def _record_failure(self, error: Exception, start: float):
+        if self.breaker is None:
+            return
+        if expired():
+            # Cut off by the deadline: says nothing about the endpoint's health
+            self.breaker.record(None, time.monotonic() - start)
+        else:
+            # Only transient errors say the endpoint is unhealthy; a 400 does not
+            self.breaker.record(is_retryable(error), time.monotonic() - start)
+
+    def _request(self, prompt: str, options: dict) -> str:
+        if self.transport is not None:
+            return self.transport.send(self, prompt, options)
+        return self._send(prompt, options)
+
+    async def _request_async(self, prompt: str, options: dict) -> str:
+        if self.transport is not None:
+            return await self.transport.send_async(self, prompt, options)
+        return await self._send_async(prompt, options)
+
+    @staticmethod
+    def _mark_upstream():
+        call = current_call()
+        if call is not None:
+            call.collapsed = False
+
+    def close(self):
+        """Release network resources held by the client"""
+
+    async def aclose(self):
+        """Async counterpart of `close`"""
+        self.close()
+
+    def _request_key(self, prompt: str, options: dict) -> Optional[str]:
+        """Cache / single-flight key, or None if neither is enabled"""
+        if self.cache is None and self.single_flight is None:
+            return None
+        return cache_key(self.name, self.model, prompt, options)
+
+    def _send(self, prompt: str, options: dict) -> str:
+        raise NotImplementedError
+
+    async def _send_async(self, prompt: str, options: dict) -> str:
+        raise NotImplementedError
@@ -0,0 +1,230 @@
+"""
+Circuit Breakers and Failover
+Stop calling a degraded provider and route to the next one immediately
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional, Sequence, Tuple
+
+from .deadline import DeadlineExceeded, bounded, deadline_scope, expired
+
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitOpen(Exception):
+    """The provider's circuit is open; the call was not attempted"""
+
+
+class CircuitBreaker:
+    """
+    Per provider endpoint breaker
+
+    Tracks the outcome of the last `window` calls made within the last
+    `window_seconds`. A call is one provider request as the module sees
+    it: retries are inside it, so it only fails once they are exhausted
+    and a flaky endpoint that retries absorb does not trip the circuit.
+    Once at least `min_calls` are known, the circuit opens when the share
+    of failed calls reaches `failure_rate`, or the share of calls slower
+    than `slow_call_seconds` reaches `slow_call_rate`; a dead endpoint
+    opens it after `min_calls` calls. While open, calls fail with
+    CircuitOpen at no cost. After `open_seconds` the circuit is
+    half-open: up to `half_open_probes` calls go through; a success
+    closes it, a failure opens it again.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        window: int = 100,
+        min_calls: int = 5,
+        failure_rate: float = 0.5,
+        slow_call_seconds: Optional[float] = 15.0,
+        slow_call_rate: float = 0.5,
+        open_seconds: float = 30.0,
+        half_open_probes: int = 1,
+        window_seconds: float = 300.0
+    ):
+        self.name = name
+        self.min_calls = min_calls
+        self.window_seconds = window_seconds
+        self.failure_rate = failure_rate
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_call_rate = slow_call_rate
+        self.open_seconds = open_seconds
+        self.half_open_probes = half_open_probes
+
+        self.state = CLOSED
+        self.opened = 0  # Times the circuit has opened
+        self.rejected = 0  # Calls refused while open
+        self._calls: Deque[Tuple[float, bool, bool]] = deque(maxlen=window)  # (time, failed, slow)
+        self._opened_at = 0.0
+        self._probes = 0
+        self._lock = threading.Lock()
+
+    def before_call(self):
+        """Admit a call or raise CircuitOpen"""
+        with self._lock:
+            if self.state == OPEN:
+                if time.monotonic() - self._opened_at < self.open_seconds:
+                    self.rejected += 1
+                    raise CircuitOpen(f"{self.name} circuit is open")
+                self.state, self._probes = HALF_OPEN, 0
+
+            if self.state == HALF_OPEN:
+                if self._probes >= self.half_open_probes:
+                    self.rejected += 1
+                    raise CircuitOpen(f"{self.name} circuit is half-open (probe in flight)")
+                self._probes += 1
+
+    def record(self, failed: Optional[bool], seconds: float):
+        """
+        Outcome of an admitted call
+
+        `failed` is None for a call abandoned by the caller (cancelled):
+        it only counts if it was already slow.
+        """
+        slow = self.slow_call_seconds is not None and seconds >= self.slow_call_seconds
+        with self._lock:
+            if failed is None:
+                if not slow:
+                    if self.state == HALF_OPEN:
+                        self._probes -= 1
+                    return
+                failed = False
+
+            if self.state == HALF_OPEN:
+                self._probes -= 1
+                if failed or slow:
+                    self._open()
+                else:
+                    self.state = CLOSED
+                    self._calls.clear()
+                return
+
+            self._calls.append((time.monotonic(), failed, slow))
+            self._expire()
+            if self.state == CLOSED and len(self._calls) >= self.min_calls:
+                failures = sum(f for _, f, _ in self._calls) / len(self._calls)
+                slow_calls = sum(s for _, _, s in self._calls) / len(self._calls)
+                if failures >= self.failure_rate or slow_calls >= self.slow_call_rate:
+                    self._open()
+
+    def _expire(self):
+        cutoff = time.monotonic() - self.window_seconds
+        while self._calls and self._calls[0][0] < cutoff:
+            self._calls.popleft()
+
+    def _open(self):
+        self.state = OPEN
+        self._opened_at = time.monotonic()
+        self.opened += 1
+        self._calls.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            self._expire()
+            calls = list(self._calls)
+        return {
+            'state': self.state,
+            'opened': self.opened,
+            'rejected': self.rejected,
+            'recent_calls': len(calls),
+            'recent_failures': sum(f for _, f, _ in calls),
+            'recent_slow_calls': sum(s for _, _, s in calls)
+        }
+
+
+class CircuitBreakers:
+    """
+    One CircuitBreaker per (provider, endpoint)
+
+    Every client of the same endpoint shares its breaker, so a module
+    learns about an outage another module has already seen.
+    """
+
+    def __init__(self, **settings: Any):
+        """
+        Args:
+            settings: CircuitBreaker arguments used for every breaker
+        """
+        self.settings = settings
+        self._breakers: Dict[Tuple[str, str], CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, provider) -> CircuitBreaker:
+        key = (provider.name, provider.endpoint)
+        with self._lock:
+            breaker = self._breakers.get(key)
+            if breaker is None:
+                breaker = self._breakers[key] = CircuitBreaker(f"{key[0]} ({key[1]})", **self.settings)
+            return breaker
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return {breaker.name: breaker.stats() for breaker in breakers}
+
+
+class Failover:
+    """
+    Ordered provider chain
+
+    `routes` are (provider, options, timeout) tuples; the first provider
+    that answers wins. A provider whose circuit is open is skipped
+    without a network call. `timeout` (seconds, or None) bounds the whole
+    route, retries and backoff included: `complete_async` stops waiting
+    after it, and `complete` runs the route under a deadline of that
+    length, so no attempt or retry starts past it and the client timeout
+    is capped by what is left. Once the analysis deadline has passed
+    there is no point in trying the next provider. `parse` is passed to
+    each provider, so a malformed answer also moves on to the next one.
+    """
+
+    def __init__(self, *routes: Tuple[Any, Dict[str, Any], Optional[float]]):
+        if not routes:
+            raise ValueError("Failover needs at least one route")
+        self.routes: Sequence[Tuple[Any, Dict[str, Any], Optional[float]]] = routes
+
+    def complete(self, prompt: str, parse: Optional[Callable[[str], Any]] = None) -> Any:
+        for i, (provider, options, timeout) in enumerate(self.routes):
+            try:
+                with deadline_scope(timeout):
+                    return provider.complete(prompt, parse=parse, **options)
+            except Exception as e:
+                # Outside the route's scope: only the analysis deadline counts
+                if expired() and not isinstance(e, DeadlineExceeded):
+                    raise DeadlineExceeded("Analysis deadline exceeded") from e
+                if i == len(self.routes) - 1 or expired():
+                    raise
+                self._warn(provider, i, e)
+
+    async def complete_async(self, prompt: str, parse: Optional[Callable[[str], Any]] = None) -> Any:
+        for i, (provider, options, timeout) in enumerate(self.routes):
+            try:
+                call = provider.complete_async(prompt, parse=parse, **options)
+                timeout = bounded(timeout)
+                if timeout is not None:
+                    return await asyncio.wait_for(call, timeout)
+                return await call
+            except (Exception, asyncio.TimeoutError) as e:
+                if expired() and not isinstance(e, DeadlineExceeded):
+                    raise DeadlineExceeded("Analysis deadline exceeded") from e
+                if i == len(self.routes) - 1 or isinstance(e, DeadlineExceeded):
+                    raise
+                self._warn(provider, i, e)
+
+    def _warn(self, provider, i: int, error: Exception):
+        fallback = self.routes[i + 1][0]
+        if isinstance(error, CircuitOpen):
+            reason = "circuit open"
+        elif isinstance(error, asyncio.TimeoutError) and self.routes[i][2] is not None:
+            reason = f"no answer within {self.routes[i][2]:g}s"
+        else:
+            reason = error
+        print(f"⚠️  {provider.name.capitalize()} unavailable, using {fallback.name.capitalize()} fallback: {reason}")
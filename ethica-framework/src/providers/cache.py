@@ -0,0 +1,334 @@
+"""
+Response Cache
+Content-addressed cache for LLM responses (memory LRU + SQLite tiers)
+"""
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+def cache_key(provider: str, model: str, prompt: str, options: Dict[str, Any]) -> str:
+    """
+    Stable key for one completion request
+
+    Two requests share a key only if provider, model, prompt and every
+    generation option are identical.
+    """
+    payload = json.dumps(
+        {
+            'provider': provider,
+            'model': model,
+            'prompt': prompt,
+            'options': options
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class ResponseCache:
+    """
+    Cache interface
+
+    Implementations store response text by key and keep hit/miss
+    counters. `get` returns None on a miss or an expired entry.
+    `get_async` / `set_async` are for callers on an event loop; they
+    call `get` / `set` directly unless the tier does blocking I/O.
+    """
+
+    def __init__(self, ttl: Optional[float] = None):
+        """
+        Args:
+            ttl: Seconds an entry stays valid (None = no expiry)
+        """
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        raise NotImplementedError
+
+    def set(self, key: str, value: str):
+        raise NotImplementedError
+
+    def clear(self):
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    async def get_async(self, key: str) -> Optional[str]:
+        return self.get(key)
+
+    async def set_async(self, key: str, value: str):
+        self.set(key, value)
+
+    def _expired(self, created_at: float, now: float) -> bool:
+        return self.ttl is not None and now - created_at > self.ttl
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters"""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'size': len(self)
+        }
+
+
+class MemoryCache(ResponseCache):
+    """In-process LRU cache bounded by entry count"""
+
+    def __init__(self, max_entries: int = 1024, ttl: Optional[float] = 3600):
+        super().__init__(ttl)
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[str, tuple]' = OrderedDict()
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or self._expired(entry[1], now):
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def set(self, key: str, value: str):
+        with self._lock:
+            self._entries[key] = (value, time.time())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCache(ResponseCache):
+    """
+    On-disk cache shared across processes and restarts
+
+    Entries past `ttl` are ignored and purged; when the table grows past
+    `max_entries` the least recently used rows are deleted, down to
+    `low_water` of it so the next eviction is many inserts away.
+
+    Hits do not write: their access times are kept in memory and written
+    in one batch once `touch_batch` entries have been hit, before an
+    eviction and on `close`. The row count is kept in memory too and re-read from the
+    table only before evicting (other processes may share the file).
+    `get_async` / `set_async` run the queries in the loop's default
+    executor.
+    """
+
+    def __init__(
+        self,
+        path: str = 'ethica_cache.sqlite3',
+        max_entries: int = 100_000,
+        ttl: Optional[float] = 7 * 24 * 3600,
+        low_water: float = 0.9,
+        touch_batch: int = 256
+    ):
+        super().__init__(ttl)
+        self.path = path
+        self.max_entries = max_entries
+        self.low_water = low_water
+        self.touch_batch = touch_batch
+        self._touched: Dict[str, float] = {}
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS responses ('
+            ' key TEXT PRIMARY KEY,'
+            ' value TEXT NOT NULL,'
+            ' created_at REAL NOT NULL,'
+            ' accessed_at REAL NOT NULL)'
+        )
+        self._conn.execute(
+            'CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)'
+        )
+        self._conn.commit()
+        self._rows = self._count()
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT value, created_at FROM responses WHERE key = ?', (key,)
+            ).fetchone()
+            if row is None or self._expired(row[1], now):
+                if row is not None:
+                    self._touched.pop(key, None)
+                    self._rows -= self._conn.execute(
+                        'DELETE FROM responses WHERE key = ?', (key,)
+                    ).rowcount
+                    self._conn.commit()
+                self.misses += 1
+                return None
+            self._touched[key] = now
+            if len(self._touched) >= self.touch_batch:
+                self._flush_touched()
+                self._conn.commit()
+            self.hits += 1
+            return row[0]
+
+    def set(self, key: str, value: str):
+        now = time.time()
+        with self._lock:
+            exists = self._conn.execute(
+                'SELECT 1 FROM responses WHERE key = ?', (key,)
+            ).fetchone()
+            self._conn.execute(
+                'INSERT OR REPLACE INTO responses (key, value, created_at, accessed_at)'
+                ' VALUES (?, ?, ?, ?)',
+                (key, value, now, now)
+            )
+            self._touched.pop(key, None)
+            if exists is None:
+                self._rows += 1
+            if self._rows > self.max_entries:
+                self._evict()
+            self._conn.commit()
+
+    async def get_async(self, key: str) -> Optional[str]:
+        return await asyncio.get_running_loop().run_in_executor(None, self.get, key)
+
+    async def set_async(self, key: str, value: str):
+        await asyncio.get_running_loop().run_in_executor(None, self.set, key, value)
+
+    def _evict(self):
+        """Delete least recently used rows down to the low-water mark"""
+        self._flush_touched()
+        self._rows = self._count()
+        overflow = self._rows - int(self.max_entries * self.low_water)
+        if self._rows > self.max_entries and overflow > 0:
+            # Another process sharing the file may have deleted some already
+            deleted = self._conn.execute(
+                'DELETE FROM responses WHERE key IN ('
+                ' SELECT key FROM responses ORDER BY accessed_at LIMIT ?)',
+                (overflow,)
+            ).rowcount
+            self._rows -= deleted
+            self.evictions += deleted
+
+    def _flush_touched(self):
+        """Write the access times of recent hits (caller commits)"""
+        if self._touched:
+            self._conn.executemany(
+                'UPDATE responses SET accessed_at = ? WHERE key = ?',
+                [(accessed_at, key) for key, accessed_at in self._touched.items()]
+            )
+            self._touched.clear()
+
+    def purge_expired(self) -> int:
+        """Delete every expired row; returns number of rows removed"""
+        if self.ttl is None:
+            return 0
+        with self._lock:
+            cursor = self._conn.execute(
+                'DELETE FROM responses WHERE created_at < ?', (time.time() - self.ttl,)
+            )
+            self._conn.commit()
+            self._rows = self._count()
+            return cursor.rowcount
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute('DELETE FROM responses')
+            self._conn.commit()
+            self._touched.clear()
+            self._rows = 0
+
+    def _count(self) -> int:
+        return self._conn.execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._rows = self._count()
+            return self._rows
+
+    def close(self):
+        with self._lock:
+            self._flush_touched()
+            self._conn.commit()
+            self._conn.close()
+
+
+class TieredCache(ResponseCache):
+    """
+    Memory LRU in front of a persistent tier
+
+    Disk hits are promoted to memory so repeated lookups stay in-process.
+    """
+
+    def __init__(self, memory: MemoryCache, disk: ResponseCache):
+        super().__init__(ttl=None)
+        self.memory = memory
+        self.disk = disk
+
+    def get(self, key: str) -> Optional[str]:
+        value = self.memory.get(key)
+        if value is None:
+            value = self.disk.get(key)
+            if value is not None:
+                self.memory.set(key, value)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def set(self, key: str, value: str):
+        self.memory.set(key, value)
+        self.disk.set(key, value)
+
+    async def get_async(self, key: str) -> Optional[str]:
+        value = self.memory.get(key)
+        if value is None:
+            value = await self.disk.get_async(key)
+            if value is not None:
+                self.memory.set(key, value)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    async def set_async(self, key: str, value: str):
+        self.memory.set(key, value)
+        await self.disk.set_async(key, value)
+
+    def clear(self):
+        self.memory.clear()
+        self.disk.clear()
+
+    def __len__(self) -> int:
+        return len(self.disk)
+
+    def stats(self) -> Dict[str, Any]:
+        stats = super().stats()
+        stats['memory'] = self.memory.stats()
+        stats['disk'] = self.disk.stats()
+        return stats
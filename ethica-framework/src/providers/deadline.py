@@ -0,0 +1,73 @@
+"""
+Deadlines
+Time budget of the current analysis, visible to every provider call
+
+The deadline lives in a context variable, so it reaches provider calls
+made from stage worker threads (context copied on submit) and asyncio
+tasks without being passed through the module APIs.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+
+class DeadlineExceeded(TimeoutError):
+    """The analysis ran out of time"""
+
+
+_deadline: ContextVar[Optional[float]] = ContextVar('ethica_deadline', default=None)
+
+
+@contextmanager
+def deadline_scope(timeout: Optional[float]) -> Iterator[Optional[float]]:
+    """
+    Run the enclosed code with a deadline `timeout` seconds from now
+
+    Nested scopes can only shorten the deadline. None leaves the current
+    deadline (if any) unchanged.
+    """
+    current = _deadline.get()
+    if timeout is None:
+        yield current
+        return
+
+    deadline = time.monotonic() + timeout
+    if current is not None:
+        deadline = min(deadline, current)
+    token = _deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> Optional[float]:
+    """Seconds left before the deadline (None = no deadline)"""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def check_deadline():
+    """Raise DeadlineExceeded if the deadline has passed"""
+    left = remaining()
+    if left is not None and left <= 0:
+        raise DeadlineExceeded("Analysis deadline exceeded")
+
+
+def expired() -> bool:
+    """True once the deadline has passed"""
+    left = remaining()
+    return left is not None and left <= 0
+
+
+def bounded(timeout: Optional[float]) -> Optional[float]:
+    """`timeout` capped at the time left before the deadline"""
+    left = remaining()
+    if left is None:
+        return timeout
+    left = max(left, 0.001)
+    return left if timeout is None else min(timeout, left)
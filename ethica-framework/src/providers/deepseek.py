@@ -0,0 +1,218 @@
+"""
+DeepSeek Provider
+DeepSeek chat completions over HTTP (OpenAI-compatible API)
+"""
+
+import asyncio
+import os
+import threading
+import weakref
+from typing import Optional
+
+try:
+    import httpx
+except ImportError:  # only needed for live async calls
+    httpx = None
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+except ImportError:  # only needed for live blocking calls
+    requests = None
+
+from .base import LLMProvider
+from .deadline import bounded
+from .telemetry import record_usage
+
+
+DEEPSEEK_URL = "https://api.deepseek.com/chat/completions"
+
+
+class DeepSeekClient:
+    """
+    Connection-pooled HTTP client for the DeepSeek API
+
+    Keeps TCP+TLS connections alive between calls so only the first
+    request to api.deepseek.com pays for the handshake. One instance is
+    meant to be shared by every DeepSeekProvider in the process.
+
+    httpx pools are bound to the event loop that created them, so async
+    calls get one client per loop (the API loop, `analyze_batch_async`,
+    worker threads running their own loop); a client goes away with its
+    loop.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = 20,
+        connect_timeout: float = 5.0,
+        keepalive_expiry: float = 60.0
+    ):
+        """
+        Args:
+            pool_size: Maximum pooled (and concurrent) connections
+            connect_timeout: Seconds allowed to establish a connection
+            keepalive_expiry: Seconds an idle async connection is kept open
+        """
+        self.pool_size = pool_size
+        self.connect_timeout = connect_timeout
+        self.keepalive_expiry = keepalive_expiry
+
+        self._session = None
+        self._session_lock = threading.Lock()
+
+        # Event loop -> its httpx.AsyncClient (guarded by _session_lock)
+        self._async_clients: 'weakref.WeakKeyDictionary' = weakref.WeakKeyDictionary()
+
+    @property
+    def session(self):
+        """Blocking calls: requests session with a sized urllib3 pool"""
+        with self._session_lock:
+            if self._session is None:
+                if requests is None:
+                    raise ImportError("requests is required for live DeepSeek calls")
+                self._session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+                self._session.mount('https://', adapter)
+                self._session.mount('http://', adapter)
+            return self._session
+
+    def post(self, url: str, headers: dict, payload: dict, timeout: float) -> dict:
+        response = self.session.post(
+            url,
+            headers=headers,
+            json=payload,
+            timeout=(min(self.connect_timeout, timeout), timeout)
+        )
+        # 429/5xx must reach the retry policy and the breaker as HTTP errors
+        response.raise_for_status()
+        return response.json()
+
+    async def post_async(self, url: str, headers: dict, payload: dict, timeout: float) -> dict:
+        response = await self._client_for_loop().post(
+            url,
+            headers=headers,
+            json=payload,
+            timeout=httpx.Timeout(timeout, connect=min(self.connect_timeout, timeout))
+        )
+        response.raise_for_status()
+        return response.json()
+
+    def _client_for_loop(self):
+        if httpx is None:
+            raise ImportError("httpx is required for live async DeepSeek calls")
+        loop = asyncio.get_running_loop()
+        with self._session_lock:
+            client = self._async_clients.get(loop)
+            if client is None:
+                client = self._async_clients[loop] = httpx.AsyncClient(
+                    limits=httpx.Limits(
+                        max_connections=self.pool_size,
+                        max_keepalive_connections=self.pool_size,
+                        keepalive_expiry=self.keepalive_expiry
+                    )
+                )
+            return client
+
+    def close(self):
+        if self._session is not None:
+            self._session.close()
+
+    async def aclose(self):
+        """Close the blocking session and the running loop's async client"""
+        self.close()
+        with self._session_lock:
+            client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+
+_shared_client: Optional[DeepSeekClient] = None
+_shared_lock = threading.Lock()
+
+
+def shared_client() -> DeepSeekClient:
+    """
+    Process-wide DeepSeek client
+
+    Pool size and connect timeout come from ETHICA_DEEPSEEK_POOL_SIZE and
+    ETHICA_DEEPSEEK_CONNECT_TIMEOUT.
+    """
+    global _shared_client
+    with _shared_lock:
+        if _shared_client is None:
+            _shared_client = DeepSeekClient(
+                pool_size=int(os.getenv('ETHICA_DEEPSEEK_POOL_SIZE', 20)),
+                connect_timeout=float(os.getenv('ETHICA_DEEPSEEK_CONNECT_TIMEOUT', 5.0))
+            )
+        return _shared_client
+
+
+class DeepSeekProvider(LLMProvider):
+    """
+    DeepSeek client
+
+    Options are merged into the request body (temperature, max_tokens, ...).
+    Requests go through the shared connection pool unless a dedicated
+    `client` is given. ETHICA_DEEPSEEK_URL points the default endpoint
+    elsewhere (e.g. the local fake server).
+    """
+
+    name = 'deepseek'
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str = 'deepseek-chat',
+        url: Optional[str] = None,
+        timeout: float = 60,
+        client: Optional[DeepSeekClient] = None
+    ):
+        super().__init__(model)
+        self.api_key = api_key
+        self.url = url or os.getenv('ETHICA_DEEPSEEK_URL', DEEPSEEK_URL)
+        self.timeout = timeout
+        self.client = client or shared_client()
+        self._owns_client = client is not None
+
+    def _headers(self) -> dict:
+        return {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+
+    def _payload(self, prompt: str, options: dict) -> dict:
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "user", "content": prompt}
+            ],
+            **options
+        }
+
+    def _send(self, prompt: str, options: dict) -> str:
+        result = self.client.post(
+            self.url, self._headers(), self._payload(prompt, options), bounded(self.timeout)
+        )
+        return self._content(result)
+
+    async def _send_async(self, prompt: str, options: dict) -> str:
+        result = await self.client.post_async(
+            self.url, self._headers(), self._payload(prompt, options), bounded(self.timeout)
+        )
+        return self._content(result)
+
+    @staticmethod
+    def _content(result: dict) -> str:
+        usage = result.get('usage')
+        if usage:
+            record_usage(usage.get('prompt_tokens'), usage.get('completion_tokens'))
+        return result['choices'][0]['message']['content']
+
+    def close(self):
+        # The shared pool outlives individual providers
+        if self._owns_client:
+            self.client.close()
+
+    async def aclose(self):
+        if self._owns_client:
+            await self.client.aclose()
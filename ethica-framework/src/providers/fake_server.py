@@ -0,0 +1,207 @@
+"""
+Fake LLM Server
+Local stand-in for the DeepSeek / OpenAI chat-completions endpoint
+
+Usage:
+    python -m providers.fake_server --port 8089 --latency 0.3
+    ETHICA_DEEPSEEK_URL=http://127.0.0.1:8089/chat/completions python ...
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+from .cache import cache_key
+from .transport import Cassette
+
+
+# Numeric placeholders used by the module prompts, e.g. <0.0 to 1.0> or <-10 to +10>
+NUMERIC_PLACEHOLDER = re.compile(r'<\s*([-+]?\d+(?:\.\d+)?)\s*(?:to|-)\s*([-+]?\d+(?:\.\d+)?)[^>]*>')
+TEXT_PLACEHOLDER = re.compile(r'"(<[^"\n]*)"')
+CHOICE_VALUE = re.compile(r'"([A-Za-z_]+(?:\|[A-Za-z_]+)+)"')
+
+# Where numeric answers fall inside each placeholder's range. 0.7 clears
+# the pipeline's 60% gates, so synthetic runs exercise all ten stages.
+SYNTHETIC_POSITION = 0.7
+
+
+def synthetic_response(provider: str, prompt: str, options: Optional[dict] = None) -> str:
+    """
+    Plausible response derived from the prompt itself
+
+    Prompts that end with a JSON template get that template back with
+    every placeholder filled in (numbers at SYNTHETIC_POSITION of their
+    range, first alternative of A|B|C choices); free-text prompts get a
+    short deterministic paragraph.
+    """
+    marker = prompt.rfind('JSON:')
+    if marker != -1:
+        start = prompt.find('{', marker)
+        end = prompt.rfind('}')
+        if start != -1 and end > start:
+            template = prompt[start:end + 1]
+
+            def number(match):
+                low, high = float(match.group(1)), float(match.group(2))
+                value = low + (high - low) * SYNTHETIC_POSITION
+                return str(round(value)) if abs(high - low) > 1 else str(round(value, 2))
+
+            filled = TEXT_PLACEHOLDER.sub(
+                lambda m: json.dumps(m.group(1).replace('<', '').replace('>', '')), template
+            )
+            filled = NUMERIC_PLACEHOLDER.sub(number, filled)
+            filled = CHOICE_VALUE.sub(lambda m: '"' + m.group(1).split('|')[0] + '"', filled)
+            try:
+                return json.dumps(json.loads(filled))
+            except ValueError:
+                pass
+
+    digest = hashlib.sha256(prompt.encode('utf-8')).hexdigest()[:8]
+    return (
+        f"Synthetic {provider} analysis {digest}: the proposal affects individual "
+        "autonomy, community wellbeing, long-term sustainability and fairness "
+        "between stakeholders."
+    )
+
+
+class FakeChatServer:
+    """
+    Threaded HTTP server speaking the chat-completions shape
+
+    Answers POST .../chat/completions from `cassette` when the request was
+    recorded (as provider 'deepseek'), otherwise with `synthetic_response`,
+    after sleeping `latency` seconds.
+    """
+
+    def __init__(
+        self,
+        host: str = '127.0.0.1',
+        port: int = 0,
+        latency: float = 0.0,
+        cassette: Optional[Cassette] = None
+    ):
+        self.latency = latency
+        self.cassette = cassette
+        self.requests = 0
+        self._httpd = ThreadingHTTPServer((host, port), self._handler())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL (OpenAI clients append /chat/completions themselves)"""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def chat_url(self) -> str:
+        return f"{self.url}/chat/completions"
+
+    def respond(self, body: dict) -> dict:
+        messages = body.get('messages') or [{'content': ''}]
+        prompt = messages[-1].get('content', '')
+        model = body.get('model', 'deepseek-chat')
+        options = {k: v for k, v in body.items() if k not in ('model', 'messages', 'stream')}
+
+        entry = None
+        if self.cassette is not None:
+            entry = self.cassette.get(cache_key('deepseek', model, prompt, options))
+        text = entry['response'] if entry else synthetic_response('deepseek', prompt, options)
+
+        prompt_tokens = sum(len(str(m.get('content', '')).split()) for m in messages)
+        completion_tokens = len(text.split())
+        return {
+            'id': f"chatcmpl-{hashlib.sha256(text.encode('utf-8')).hexdigest()[:12]}",
+            'object': 'chat.completion',
+            'created': int(time.time()),
+            'model': model,
+            'choices': [{
+                'index': 0,
+                'message': {'role': 'assistant', 'content': text},
+                'finish_reason': 'stop'
+            }],
+            'usage': {
+                'prompt_tokens': prompt_tokens,
+                'completion_tokens': completion_tokens,
+                'total_tokens': prompt_tokens + completion_tokens
+            }
+        }
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_POST(self):
+                if not self.path.rstrip('/').endswith('/chat/completions'):
+                    self.send_error(404)
+                    return
+                length = int(self.headers.get('Content-Length', 0))
+                body = json.loads(self.rfile.read(length) or b'{}')
+                if server.latency > 0:
+                    time.sleep(server.latency)
+                payload = json.dumps(server.respond(body)).encode('utf-8')
+                server.requests += 1
+
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def serve_forever(self):
+        self._httpd.serve_forever()
+
+    def start(self) -> 'FakeChatServer':
+        """Serve on a background thread"""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> 'FakeChatServer':
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local fake chat-completions server")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8089)
+    parser.add_argument('--latency', type=float, default=0.0, help="Seconds per response")
+    parser.add_argument('--cassette', help="Replay recorded DeepSeek responses from this file")
+    args = parser.parse_args()
+
+    server = FakeChatServer(
+        args.host,
+        args.port,
+        latency=args.latency,
+        cassette=Cassette(args.cassette) if args.cassette else None
+    )
+    print(f"Fake chat-completions server on {server.chat_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""
+Gemini Provider
+Google Gemini via google-generativeai
+"""
+
+try:
+    import google.generativeai as genai
+except ImportError:  # only needed for live calls (replay runs offline)
+    genai = None
+
+from .base import LLMProvider
+from .deadline import remaining
+from .telemetry import record_usage
+
+
+# genai.configure is process-global; only reconfigure when the key changes
+_configured_key = None
+
+
+def _configure(api_key: str):
+    global _configured_key
+    if api_key != _configured_key:
+        genai.configure(api_key=api_key)
+        _configured_key = api_key
+
+
+class GeminiProvider(LLMProvider):
+    """
+    Google Gemini client
+
+    Options are passed through as `genai.GenerationConfig` fields
+    (temperature, response_mime_type, max_output_tokens, ...).
+    The SDK client is created on first live call.
+    """
+
+    name = 'gemini'
+
+    def __init__(self, api_key: str, model: str = 'gemini-2.0-flash-exp'):
+        super().__init__(model)
+        self.api_key = api_key
+        self._client = None
+
+    @property
+    def client(self):
+        if self._client is None:
+            if genai is None:
+                raise ImportError("google-generativeai is required for live Gemini calls")
+            _configure(self.api_key)
+            self._client = genai.GenerativeModel(self.model)
+        return self._client
+
+    def _generation_config(self, options: dict):
+        return genai.GenerationConfig(**options) if options else None
+
+    def _send(self, prompt: str, options: dict) -> str:
+        left = remaining()
+        response = self.client.generate_content(
+            prompt,
+            generation_config=self._generation_config(options),
+            # Blocking calls cannot be abandoned: bound them by the deadline
+            request_options={'timeout': max(left, 0.001)} if left is not None else None
+        )
+        self._record_usage(response)
+        return response.text
+
+    async def _send_async(self, prompt: str, options: dict) -> str:
+        response = await self.client.generate_content_async(
+            prompt,
+            generation_config=self._generation_config(options)
+        )
+        self._record_usage(response)
+        return response.text
+
+    @staticmethod
+    def _record_usage(response):
+        usage = getattr(response, 'usage_metadata', None)
+        if usage is not None:
+            record_usage(usage.prompt_token_count, usage.candidates_token_count)
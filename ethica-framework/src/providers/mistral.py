@@ -0,0 +1,74 @@
+"""
+Mistral Provider
+Mistral AI chat completions via mistralai
+"""
+
+try:
+    from mistralai import Mistral
+except ImportError:  # only needed for live calls (replay runs offline)
+    Mistral = None
+
+from .base import LLMProvider
+from .deadline import remaining
+from .telemetry import record_usage
+
+
+class MistralProvider(LLMProvider):
+    """
+    Mistral AI client
+
+    Options are passed through to `chat.complete`
+    (temperature, response_format, max_tokens, ...).
+    The SDK client is created on first live call.
+    """
+
+    name = 'mistral'
+
+    def __init__(self, api_key: str, model: str = 'mistral-large-latest'):
+        super().__init__(model)
+        self.api_key = api_key
+        self._client = None
+
+    @property
+    def client(self):
+        if self._client is None:
+            if Mistral is None:
+                raise ImportError("mistralai is required for live Mistral calls")
+            self._client = Mistral(api_key=self.api_key)
+        return self._client
+
+    def _messages(self, prompt: str) -> list:
+        return [
+            {
+                "role": "user",
+                "content": prompt
+            }
+        ]
+
+    def _send(self, prompt: str, options: dict) -> str:
+        left = remaining()
+        if left is not None:
+            # Blocking calls cannot be abandoned: bound them by the deadline
+            options = {**options, 'timeout_ms': max(int(left * 1000), 1)}
+        response = self.client.chat.complete(
+            model=self.model,
+            messages=self._messages(prompt),
+            **options
+        )
+        self._record_usage(response)
+        return response.choices[0].message.content
+
+    async def _send_async(self, prompt: str, options: dict) -> str:
+        response = await self.client.chat.complete_async(
+            model=self.model,
+            messages=self._messages(prompt),
+            **options
+        )
+        self._record_usage(response)
+        return response.choices[0].message.content
+
+    @staticmethod
+    def _record_usage(response):
+        usage = getattr(response, 'usage', None)
+        if usage is not None:
+            record_usage(usage.prompt_tokens, usage.completion_tokens)
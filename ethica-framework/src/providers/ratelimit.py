@@ -0,0 +1,59 @@
+"""
+Rate Limiting
+Token bucket shared by every call to one provider
+"""
+
+import asyncio
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Token bucket limiter usable from threads and coroutines
+
+    `rate` tokens are added per second up to `capacity`. Each call takes
+    one token; callers that find the bucket empty reserve a future token
+    and sleep until it is due, so waiters are served in arrival order.
+    """
+
+    def __init__(self, rate: float, capacity: float = None):
+        """
+        Args:
+            rate: Sustained requests per second
+            capacity: Burst size (default: max(1, rate))
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self.waits = 0
+
+    def _reserve(self) -> float:
+        """Take one token; returns seconds to wait before using it"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            self.waits += 1
+            return -self._tokens / self.rate
+
+    def acquire(self):
+        """Block until a token is available"""
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self):
+        """Wait for a token without blocking the event loop"""
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
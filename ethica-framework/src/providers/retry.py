@@ -0,0 +1,301 @@
+"""
+Retries and Hedging
+Resilience policies applied to every upstream provider attempt
+"""
+
+import asyncio
+import contextvars
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional
+
+from .deadline import DeadlineExceeded, check_deadline, remaining
+from .telemetry import current_call
+
+
+# Rate limited, request timeout, and transient server errors
+RETRYABLE_STATUS = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+# Exception class names used by the provider SDKs and HTTP clients for
+# transient failures that carry no status code
+TRANSIENT_ERRORS = (
+    'Timeout', 'ConnectError', 'ConnectionError', 'RemoteProtocolError',
+    'ServiceUnavailable', 'ResourceExhausted', 'InternalServerError', 'DeadlineExceeded'
+)
+
+
+def status_code(error: BaseException) -> Optional[int]:
+    """HTTP status of a provider error, if it carries one"""
+    for attr in ('status_code', 'code', 'http_status'):
+        value = getattr(error, attr, None)
+        if isinstance(value, int) and 100 <= value < 600:
+            return value
+    response = getattr(error, 'response', None)
+    value = getattr(response, 'status_code', None)
+    return value if isinstance(value, int) else None
+
+
+def retry_after(error: BaseException) -> Optional[float]:
+    """Seconds requested by a Retry-After header, if present"""
+    headers = getattr(getattr(error, 'response', None), 'headers', None)
+    if not headers:
+        return None
+    try:
+        return float(headers.get('Retry-After'))
+    except (TypeError, ValueError):
+        return None
+
+
+def is_retryable(error: BaseException) -> bool:
+    """
+    Classify a failed attempt
+
+    Retried: 408/425/429/5xx responses, timeouts and connection errors.
+    Not retried: other 4xx (bad request, auth), parse errors, deadlines.
+    """
+    if isinstance(error, DeadlineExceeded):
+        return False
+    code = status_code(error)
+    if code is not None:
+        return code in RETRYABLE_STATUS
+    if isinstance(error, (TimeoutError, ConnectionError)):
+        return True
+    names = [cls.__name__ for cls in type(error).__mro__]
+    return any(marker in name for name in names for marker in TRANSIENT_ERRORS)
+
+
+def _count_retry():
+    call = current_call()
+    if call is not None:
+        call.retries += 1
+
+
+def _mark_hedged():
+    call = current_call()
+    if call is not None:
+        call.hedged = True
+
+
+class RetryPolicy:
+    """
+    Retries with decorrelated-jitter backoff
+
+    The n-th delay is drawn uniformly from [base_delay, 3 * previous
+    delay], capped at `max_delay`, and never shorter than a Retry-After
+    header. No retry is attempted if its delay would run past the
+    analysis deadline.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        base_delay: float = 0.5,
+        max_delay: float = 20.0,
+        classify: Callable[[BaseException], bool] = is_retryable,
+        seed: Optional[int] = None
+    ):
+        """
+        Args:
+            max_attempts: Attempts per provider call, including the first
+            base_delay: Smallest delay between attempts (seconds)
+            max_delay: Largest delay between attempts (seconds)
+            classify: Returns True if a failed attempt may be retried
+            seed: Seed for the jitter (reproducible benchmarks)
+        """
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.classify = classify
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def _next_delay(self, previous: float, error: BaseException) -> float:
+        with self._lock:
+            delay = min(self.max_delay, self._random.uniform(self.base_delay, previous * 3))
+        return max(delay, retry_after(error) or 0.0)
+
+    def _should_retry(self, attempt: int, error: BaseException, delay: float) -> bool:
+        if attempt >= self.max_attempts or not self.classify(error):
+            return False
+        left = remaining()
+        return left is None or delay < left
+
+    def run(self, fn: Callable[[], Any]) -> Any:
+        """Call `fn` until it succeeds or the error is final"""
+        delay = self.base_delay
+        attempt = 0
+        while True:
+            check_deadline()
+            attempt += 1
+            try:
+                return fn()
+            except Exception as error:
+                delay = self._next_delay(delay, error)
+                if not self._should_retry(attempt, error, delay):
+                    raise
+            _count_retry()
+            time.sleep(delay)
+
+    async def run_async(self, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Coroutine equivalent of `run`"""
+        delay = self.base_delay
+        attempt = 0
+        while True:
+            check_deadline()
+            attempt += 1
+            try:
+                return await fn()
+            except Exception as error:
+                delay = self._next_delay(delay, error)
+                if not self._should_retry(attempt, error, delay):
+                    raise
+            _count_retry()
+            await asyncio.sleep(delay)
+
+
+_hedge_pool: Optional[ThreadPoolExecutor] = None
+_hedge_pool_lock = threading.Lock()
+
+
+def _pool() -> ThreadPoolExecutor:
+    global _hedge_pool
+    with _hedge_pool_lock:
+        if _hedge_pool is None:
+            _hedge_pool = ThreadPoolExecutor(max_workers=32, thread_name_prefix='ethica-hedge')
+        return _hedge_pool
+
+
+class HedgePolicy:
+    """
+    Hedged requests
+
+    If an attempt has not answered after the hedge delay, an identical
+    second request is sent and whichever succeeds first is used. The
+    delay is `delay` if given, else the `quantile` of the provider's
+    recent latencies (once `min_samples` are known), so only the slowest
+    ~5% of calls are duplicated.
+    """
+
+    def __init__(
+        self,
+        delay: Optional[float] = None,
+        quantile: float = 0.95,
+        min_samples: int = 20,
+        window: int = 200
+    ):
+        self.delay = delay
+        self.quantile = quantile
+        self.min_samples = min_samples
+        self.hedged = 0
+        self.hedge_wins = 0
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+        self._window = window
+
+    def observe(self, provider: str, seconds: float):
+        with self._lock:
+            samples = self._latencies.get(provider)
+            if samples is None:
+                samples = self._latencies[provider] = deque(maxlen=self._window)
+            samples.append(seconds)
+
+    def hedge_delay(self, provider: str) -> Optional[float]:
+        """Seconds to wait before hedging (None = not enough data yet)"""
+        if self.delay is not None:
+            return self.delay
+        with self._lock:
+            samples = sorted(self._latencies.get(provider, ()))
+        if len(samples) < self.min_samples:
+            return None
+        return samples[min(len(samples) - 1, int(len(samples) * self.quantile))]
+
+    def _timed(self, provider: str, fn: Callable[[], Any]) -> Any:
+        start = time.monotonic()
+        result = fn()
+        self.observe(provider, time.monotonic() - start)
+        return result
+
+    def run(self, provider: str, fn: Callable[[], Any]) -> Any:
+        """Call `fn`, racing a second call if the first is slow"""
+        delay = self.hedge_delay(provider)
+        if delay is None:
+            return self._timed(provider, fn)
+
+        pool = _pool()
+        primary = pool.submit(contextvars.copy_context().run, self._timed, provider, fn)
+        done, _ = wait([primary], timeout=delay)
+        if done:
+            return primary.result()
+
+        with self._lock:
+            self.hedged += 1
+        _mark_hedged()
+        backup = pool.submit(contextvars.copy_context().run, self._timed, provider, fn)
+        pending = {primary, backup}
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = wait(pending, timeout=remaining(), return_when=FIRST_COMPLETED)
+            if not done:
+                raise DeadlineExceeded("Analysis deadline exceeded")
+            for future in done:
+                if future.exception() is None:
+                    if future is backup:
+                        with self._lock:
+                            self.hedge_wins += 1
+                    return future.result()  # The slower call finishes in the background
+                error = future.exception()
+        raise error
+
+    async def run_async(self, provider: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Coroutine equivalent of `run`; the losing request is cancelled"""
+        async def timed():
+            start = time.monotonic()
+            result = await fn()
+            self.observe(provider, time.monotonic() - start)
+            return result
+
+        delay = self.hedge_delay(provider)
+        if delay is None:
+            return await timed()
+
+        primary = asyncio.ensure_future(timed())
+        backup = None
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+            if done:
+                return primary.result()
+
+            with self._lock:
+                self.hedged += 1
+            _mark_hedged()
+            backup = asyncio.ensure_future(timed())
+            pending = {primary, backup}
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, timeout=remaining(), return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    raise DeadlineExceeded("Analysis deadline exceeded")
+                for task in done:
+                    if task.exception() is None:
+                        if task is backup:
+                            with self._lock:
+                                self.hedge_wins += 1
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in (primary, backup):
+                if task is not None and not task.done():
+                    task.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'hedged': self.hedged,
+            'hedge_wins': self.hedge_wins,
+            'delays': {name: self.hedge_delay(name) for name in list(self._latencies)}
+        }
@@ -0,0 +1,142 @@
+"""
+Single-Flight
+Collapse identical in-flight requests into one upstream call
+"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from .deadline import DeadlineExceeded, remaining
+
+
+class _LeaderGone(Exception):
+    """The leader gave up (cancelled or out of time) before the call finished"""
+
+
+class _Call:
+    """One in-flight blocking call and its outcome"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Request coalescing usable from threads and coroutines
+
+    The first caller for a key (the leader) runs the function; callers
+    that arrive with the same key while it is running wait for the
+    leader and receive the same result or exception. Nothing is kept
+    once the call finishes - that is the response cache's job.
+
+    A leader that gives up for its own reasons (cancelled, or past its
+    analysis deadline) does not pass that on: its followers are released
+    and one of them runs the call again as the new leader. Followers
+    wait no longer than their own deadline (`providers.deadline`), then
+    raise DeadlineExceeded while the shared call goes on.
+    """
+
+    def __init__(self):
+        self.executed = 0
+        self.collapsed = 0
+        self._calls: Dict[str, _Call] = {}
+        self._async_calls: Dict[Tuple[int, str], asyncio.Future] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        """Run `fn` unless an identical call is already in flight"""
+        while True:
+            with self._lock:
+                call = self._calls.get(key)
+                leader = call is None
+                if leader:
+                    call = self._calls[key] = _Call()
+                    self.executed += 1
+                else:
+                    self.collapsed += 1
+
+            if not leader:
+                left = remaining()
+                if not call.done.wait(max(left, 0) if left is not None else None):
+                    raise DeadlineExceeded("Analysis deadline exceeded")
+                if isinstance(call.error, _LeaderGone):
+                    continue  # Take over the call
+                if call.error is not None:
+                    raise call.error
+                return call.result
+
+            try:
+                call.result = fn()
+                return call.result
+            except DeadlineExceeded:
+                call.error = _LeaderGone()
+                raise
+            except BaseException as error:
+                call.error = error
+                raise
+            finally:
+                with self._lock:
+                    del self._calls[key]
+                call.done.set()
+
+    async def do_async(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Coroutine equivalent of `do` (calls are shared per event loop)"""
+        loop = asyncio.get_event_loop()
+        flight_key = (id(loop), key)
+        while True:
+            with self._lock:
+                future = self._async_calls.get(flight_key)
+                leader = future is None
+                if leader:
+                    future = self._async_calls[flight_key] = loop.create_future()
+                    self.executed += 1
+                else:
+                    self.collapsed += 1
+
+            if not leader:
+                # Shield so a cancelled or timed-out follower does not cancel the shared call
+                waiter = asyncio.shield(future)
+                left = remaining()
+                if left is not None:
+                    done, _ = await asyncio.wait({waiter}, timeout=max(left, 0))
+                    if not done:
+                        waiter.cancel()
+                        raise DeadlineExceeded("Analysis deadline exceeded")
+                try:
+                    return await waiter
+                except _LeaderGone:
+                    continue  # Take over the call
+
+            try:
+                result = await fn()
+                future.set_result(result)
+                return result
+            except (asyncio.CancelledError, DeadlineExceeded):
+                # Followers neither share this caller's cancellation nor its deadline
+                self._fail(future, _LeaderGone())
+                raise
+            except BaseException as error:
+                self._fail(future, error)
+                raise
+            finally:
+                with self._lock:
+                    del self._async_calls[flight_key]
+
+    @staticmethod
+    def _fail(future: asyncio.Future, error: BaseException):
+        future.set_exception(error)
+        # Mark as retrieved when no follower is waiting for it
+        future.exception()
+
+    def stats(self) -> Dict[str, Any]:
+        """Upstream vs. collapsed call counters"""
+        total = self.executed + self.collapsed
+        return {
+            'executed': self.executed,
+            'collapsed': self.collapsed,
+            'collapse_rate': self.collapsed / total if total else 0.0,
+            'in_flight': len(self._calls) + len(self._async_calls)
+        }
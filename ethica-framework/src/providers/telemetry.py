@@ -0,0 +1,232 @@
+"""
+Telemetry
+Per-stage and per-provider-call spans for one analysis
+
+Spans are collected through context variables, so provider calls made
+from worker threads (context copied on submit) and asyncio tasks are
+attributed to the stage that issued them without passing anything
+through the module APIs.
+"""
+
+import functools
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field, asdict
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional
+
+
+# List prices in USD per million (prompt, completion) tokens
+MODEL_PRICES = {
+    'gemini-2.0-flash-exp': (0.0, 0.0),
+    'gemini-2.0-flash': (0.10, 0.40),
+    'mistral-large-latest': (2.0, 6.0),
+    'deepseek-chat': (0.27, 1.10)
+}
+
+
+@dataclass
+class CallSpan:
+    """One provider request made by a stage"""
+    stage: Optional[str]
+    provider: str
+    model: str
+    wall_time: float = 0.0
+    prompt_tokens: Optional[int] = None
+    completion_tokens: Optional[int] = None
+    retries: int = 0
+    hedged: bool = False  # A second request was raced against a slow one
+    cache_hit: bool = False
+    collapsed: bool = False  # Served by an identical in-flight request
+    error: Optional[str] = None
+    # Request and raw response text, kept only when the collector captures payloads
+    prompt: Optional[str] = None
+    response: Optional[str] = None
+
+    @property
+    def cost_usd(self) -> Optional[float]:
+        """Billed cost (cache hits and collapsed calls are free)"""
+        if self.cache_hit or self.collapsed:
+            return 0.0
+        prices = MODEL_PRICES.get(self.model)
+        if prices is None or self.prompt_tokens is None:
+            return None
+        return (
+            self.prompt_tokens * prices[0] + (self.completion_tokens or 0) * prices[1]
+        ) / 1_000_000
+
+
+@dataclass
+class StageSpan:
+    """Wall time of one stage plus the provider calls it made"""
+    name: str
+    wall_time: float
+    calls: List[CallSpan] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+@dataclass
+class Telemetry:
+    """All spans of one analysis"""
+    scenario_id: str
+    wall_time: float
+    stages: List[StageSpan]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Per-stage aggregates, overall totals and the raw call spans"""
+        stages = []
+        for stage in self.stages:
+            summary = _aggregate(stage.calls)
+            summary.update(
+                name=stage.name,
+                wall_time_ms=round(stage.wall_time * 1000, 3),
+                error=stage.error,
+                spans=[_call_dict(call) for call in stage.calls]
+            )
+            stages.append(summary)
+
+        return {
+            'scenario_id': self.scenario_id,
+            'wall_time_ms': round(self.wall_time * 1000, 3),
+            'totals': _aggregate([call for stage in self.stages for call in stage.calls]),
+            'stages': stages
+        }
+
+
+def _call_dict(call: CallSpan) -> Dict[str, Any]:
+    span = asdict(call)
+    del span['prompt'], span['response']
+    span['wall_time_ms'] = round(span.pop('wall_time') * 1000, 3)
+    span['cost_usd'] = call.cost_usd
+    return span
+
+
+def _aggregate(calls: List[CallSpan]) -> Dict[str, Any]:
+    costs = [call.cost_usd for call in calls]
+    return {
+        'provider_calls': len(calls),
+        'upstream_calls': sum(not (c.cache_hit or c.collapsed) for c in calls),
+        'cache_hits': sum(c.cache_hit for c in calls),
+        'collapsed': sum(c.collapsed for c in calls),
+        'retries': sum(c.retries for c in calls),
+        'hedged': sum(c.hedged for c in calls),
+        'prompt_tokens': sum(c.prompt_tokens or 0 for c in calls),
+        'completion_tokens': sum(c.completion_tokens or 0 for c in calls),
+        'cost_usd': round(sum(c for c in costs if c is not None), 6)
+    }
+
+
+_collector: ContextVar[Optional['TelemetryCollector']] = ContextVar('ethica_telemetry', default=None)
+_stage: ContextVar[Optional[StageSpan]] = ContextVar('ethica_stage', default=None)
+_call: ContextVar[Optional[CallSpan]] = ContextVar('ethica_call', default=None)
+
+
+class TelemetryCollector:
+    """
+    Accumulates spans while active in the current context
+
+    With `capture_payloads`, call spans also keep the prompt and raw
+    response (used by the audit trail; not included in `to_dict`).
+    """
+
+    def __init__(self, scenario_id: str, capture_payloads: bool = False):
+        self.scenario_id = scenario_id
+        self.capture_payloads = capture_payloads
+        self.stages: List[StageSpan] = []
+        self._started = time.perf_counter()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def activate(self) -> Iterator['TelemetryCollector']:
+        token = _collector.set(self)
+        try:
+            yield self
+        finally:
+            _collector.reset(token)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[StageSpan]:
+        span = StageSpan(name, 0.0)
+        token = _stage.set(span)
+        start = time.perf_counter()
+        try:
+            yield span
+        except BaseException as e:
+            span.error = repr(e)
+            raise
+        finally:
+            span.wall_time = time.perf_counter() - start
+            _stage.reset(token)
+            with self._lock:
+                self.stages.append(span)
+
+    def finish(self) -> Telemetry:
+        return Telemetry(self.scenario_id, time.perf_counter() - self._started, list(self.stages))
+
+
+def traced(stage: str, fn: Callable[..., Any]) -> Callable[..., Any]:
+    """Run `fn` inside a stage span when telemetry is active"""
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        collector = _collector.get()
+        if collector is None:
+            return fn(*args, **kwargs)
+        with collector.stage(stage):
+            return fn(*args, **kwargs)
+    return wrapper
+
+
+def traced_async(stage: str, fn: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+    """Coroutine equivalent of `traced`"""
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        collector = _collector.get()
+        if collector is None:
+            return await fn(*args, **kwargs)
+        with collector.stage(stage):
+            return await fn(*args, **kwargs)
+    return wrapper
+
+
+@contextmanager
+def provider_call(provider, prompt: str) -> Iterator[Optional[CallSpan]]:
+    """
+    Span for one provider request (None when telemetry is inactive)
+
+    Token counts are attached by the provider through `record_usage`
+    while the span is current.
+    """
+    collector = _collector.get()
+    if collector is None:
+        yield None
+        return
+
+    stage = _stage.get()
+    span = CallSpan(stage.name if stage else None, provider.name, provider.model)
+    if collector.capture_payloads:
+        span.prompt = prompt
+    token = _call.set(span)
+    start = time.perf_counter()
+    try:
+        yield span
+    except BaseException as e:
+        span.error = repr(e)
+        raise
+    finally:
+        span.wall_time = time.perf_counter() - start
+        _call.reset(token)
+        if stage is not None:
+            stage.calls.append(span)
+
+
+def current_call() -> Optional[CallSpan]:
+    return _call.get()
+
+
+def record_usage(prompt_tokens: Optional[int], completion_tokens: Optional[int]):
+    """Attach token counts reported by the provider to the current call"""
+    span = _call.get()
+    if span is not None:
+        span.prompt_tokens = prompt_tokens
+        span.completion_tokens = completion_tokens
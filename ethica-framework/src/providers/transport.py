@@ -0,0 +1,167 @@
+"""
+Provider Transports
+Live, recording and replaying back-ends for provider calls
+"""
+
+import asyncio
+import json
+import os
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from .cache import cache_key
+from .telemetry import current_call, record_usage
+
+
+class CassetteMiss(KeyError):
+    """Raised on replay when a request was never recorded"""
+
+
+class Cassette:
+    """
+    Recorded provider responses (JSON Lines file)
+
+    One line per request: key, provider, model, prompt, options, response,
+    token usage (when reported) and the observed latency in seconds. Keys are `cache_key` hashes, so a
+    cassette stays valid as long as prompts and options are unchanged.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        self._entries[entry['key']] = entry
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        return self._entries.get(key)
+
+    def record(self, entry: Dict[str, Any]):
+        """Store an entry and append it to the file"""
+        with self._lock:
+            self._entries[entry['key']] = entry
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class Transport:
+    """
+    Live transport - sends the request through the provider's own client
+
+    Subclasses intercept `send` / `send_async` to record or replay calls;
+    everything above the transport (cache, single-flight, rate limiting)
+    behaves the same in every mode.
+    """
+
+    def send(self, provider, prompt: str, options: dict) -> str:
+        return provider._send(prompt, options)
+
+    async def send_async(self, provider, prompt: str, options: dict) -> str:
+        return await provider._send_async(prompt, options)
+
+
+class RecordingTransport(Transport):
+    """Live calls whose responses and latencies are written to a cassette"""
+
+    def __init__(self, cassette: Cassette):
+        self.cassette = cassette
+
+    def send(self, provider, prompt: str, options: dict) -> str:
+        start = time.perf_counter()
+        text = provider._send(prompt, options)
+        self._record(provider, prompt, options, text, time.perf_counter() - start)
+        return text
+
+    async def send_async(self, provider, prompt: str, options: dict) -> str:
+        start = time.perf_counter()
+        text = await provider._send_async(prompt, options)
+        self._record(provider, prompt, options, text, time.perf_counter() - start)
+        return text
+
+    def _record(self, provider, prompt: str, options: dict, text: str, latency: float):
+        call = current_call()
+        usage = None
+        if call is not None and call.prompt_tokens is not None:
+            usage = {
+                'prompt_tokens': call.prompt_tokens,
+                'completion_tokens': call.completion_tokens
+            }
+        self.cassette.record({
+            'key': cache_key(provider.name, provider.model, prompt, options),
+            'provider': provider.name,
+            'model': provider.model,
+            'prompt': prompt,
+            'options': options,
+            'response': text,
+            'latency': round(latency, 4),
+            'usage': usage
+        })
+
+
+class ReplayTransport(Transport):
+    """
+    Serves responses without touching the network
+
+    Responses come from `cassette`; requests it does not contain go to
+    `responder(provider_name, prompt, options)` if given, else raise
+    CassetteMiss. Each call sleeps for a synthetic latency: `latency`
+    seconds (None = the recorded latency, 0 for synthetic responses),
+    scaled by a random factor in [1 - jitter, 1 + jitter].
+    """
+
+    def __init__(
+        self,
+        cassette: Optional[Cassette] = None,
+        latency: Optional[float] = 0.0,
+        jitter: float = 0.0,
+        responder: Optional[Callable[[str, str, dict], str]] = None,
+        seed: Optional[int] = None
+    ):
+        self.cassette = cassette
+        self.latency = latency
+        self.jitter = jitter
+        self.responder = responder
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def send(self, provider, prompt: str, options: dict) -> str:
+        text, delay = self._lookup(provider, prompt, options)
+        if delay > 0:
+            time.sleep(delay)
+        return text
+
+    async def send_async(self, provider, prompt: str, options: dict) -> str:
+        text, delay = self._lookup(provider, prompt, options)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return text
+
+    def _lookup(self, provider, prompt: str, options: dict):
+        key = cache_key(provider.name, provider.model, prompt, options)
+        entry = self.cassette.get(key) if self.cassette is not None else None
+        if entry is not None:
+            text, recorded = entry['response'], entry.get('latency', 0.0)
+            usage = entry.get('usage')
+            if usage:
+                record_usage(usage['prompt_tokens'], usage['completion_tokens'])
+        elif self.responder is not None:
+            text, recorded = self.responder(provider.name, prompt, options), 0.0
+        else:
+            raise CassetteMiss(
+                f"No recorded {provider.name}/{provider.model} response for key {key[:12]}"
+            )
+
+        delay = recorded if self.latency is None else self.latency
+        if self.jitter:
+            with self._lock:
+                delay *= self._random.uniform(1 - self.jitter, 1 + self.jitter)
+        return text, delay
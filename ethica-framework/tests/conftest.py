@@ -0,0 +1,10 @@
+"""
+Ethica.AI Framework tests
+
+Offline: providers are fakes or the synthetic transport, no API keys needed.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
@@ -0,0 +1,69 @@
+"""Offline providers for the tests"""
+
+import asyncio
+import time
+
+from providers import Transport
+from providers.base import LLMProvider
+from providers.deadline import bounded
+from providers.fake_server import synthetic_response
+
+
+class HTTPError(Exception):
+    """Provider error carrying an HTTP status"""
+
+    def __init__(self, status_code: int):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+class FakeProvider(LLMProvider):
+    """
+    Answers `reply` after `latency` seconds, or fails with `error`
+
+    Like a real client, a request is cut short by its timeout (capped
+    by the analysis deadline) and raises TimeoutError.
+    """
+
+    name = 'fake'
+
+    def __init__(self, reply='ok', latency=0.0, error=None, timeout=30.0, model='fake-model', **kwargs):
+        super().__init__(model, **kwargs)
+        self.reply = reply
+        self.latency = latency
+        self.error = error
+        self.timeout = timeout
+        self.requests = 0
+
+    def _send(self, prompt, options):
+        self.requests += 1
+        limit = bounded(self.timeout)
+        time.sleep(min(self.latency, limit))
+        return self._answer(limit)
+
+    async def _send_async(self, prompt, options):
+        self.requests += 1
+        limit = bounded(self.timeout)
+        await asyncio.sleep(min(self.latency, limit))
+        return self._answer(limit)
+
+    def _answer(self, limit):
+        if self.latency > limit:
+            raise TimeoutError("read timed out")
+        if self.error is not None:
+            raise self.error
+        return self.reply
+
+
+class SyntheticTransport(Transport):
+    """Every provider answers its prompt's JSON template, filled in, at once"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def send(self, provider, prompt, options):
+        self.calls += 1
+        return synthetic_response(provider.name, prompt, options)
+
+    async def send_async(self, provider, prompt, options):
+        return self.send(provider, prompt, options)
@@ -0,0 +1,55 @@
+"""Audit records of finished analyses"""
+
+from core.audit import AuditLog, read_audit_log
+from core.framework import EthicaFramework
+
+from fakes import SyntheticTransport
+
+SCENARIO = {
+    'action': 'Deploy a triage model',
+    'context': 'Public hospital',
+    'stakeholders': ['patients', 'staff']
+}
+
+
+class ListAuditLog:
+    """Keeps records, noting the result's telemetry when each one arrives"""
+
+    def __init__(self):
+        self.records = []
+        self.telemetry_at_append = []
+
+    def append(self, record):
+        self.records.append(record)
+        self.telemetry_at_append.append(record['result'].telemetry)
+
+    def close(self):
+        pass
+
+
+def test_result_carries_telemetry_when_audited():
+    audit = ListAuditLog()
+    ethica = EthicaFramework(
+        'test', 'test', 'test',
+        transport=SyntheticTransport(), enable_telemetry=True, audit_log=audit
+    )
+    result = ethica.analyze(SCENARIO)
+
+    assert len(audit.records) == 1
+    assert audit.telemetry_at_append[0] is not None
+    assert audit.telemetry_at_append[0] == result.telemetry
+
+
+def test_writers_sharing_a_directory_never_share_a_segment(tmp_path):
+    # Same starting sequence, as for two uvicorn workers started together
+    logs = [AuditLog(str(tmp_path), flush_interval=0.01, batch_size=1) for _ in range(2)]
+    timestamp = '2025-01-06T09:30:00'
+    for i in range(20):
+        for n, log in enumerate(logs):
+            log.append({'timestamp': timestamp, 'writer': n, 'i': i})
+    for log in logs:
+        log.close()
+
+    records = list(read_audit_log(str(tmp_path)))
+    assert len(records) == 40
+    assert len(list(tmp_path.glob('audit-*.jsonl.gz'))) == 2
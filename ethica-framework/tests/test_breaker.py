@@ -0,0 +1,111 @@
+"""Circuit breaker thresholds"""
+
+import random
+
+import pytest
+
+from providers.breaker import CLOSED, OPEN, CircuitBreaker, CircuitOpen, Failover
+from providers.retry import RetryPolicy
+
+from fakes import FakeProvider, HTTPError
+
+
+class FlakyProvider(FakeProvider):
+    """Fails each attempt with a 503 at `error_rate`"""
+
+    def __init__(self, error_rate, seed=0, **kwargs):
+        super().__init__(**kwargs)
+        self.error_rate = error_rate
+        self._random = random.Random(seed)
+
+    def _send(self, prompt, options):
+        self.requests += 1
+        if self._random.random() < self.error_rate:
+            raise HTTPError(503)
+        return self.reply
+
+
+def no_wait_retries():
+    return RetryPolicy(max_attempts=4, base_delay=0.0, max_delay=0.0)
+
+
+def test_dead_endpoint_opens_after_min_calls():
+    breaker = CircuitBreaker('fake')
+    dead = FakeProvider(error=HTTPError(503), breaker=breaker, retry_policy=no_wait_retries())
+
+    for _ in range(breaker.min_calls):
+        with pytest.raises(HTTPError):
+            dead.complete('prompt')
+    assert breaker.state == OPEN
+    assert dead.requests == breaker.min_calls * 4
+
+    with pytest.raises(CircuitOpen):
+        dead.complete('prompt')
+    assert dead.requests == breaker.min_calls * 4
+
+
+def test_retries_absorb_flaky_endpoint():
+    breaker = CircuitBreaker('fake')
+    flaky = FlakyProvider(0.3, breaker=breaker, retry_policy=no_wait_retries())
+
+    failed = 0
+    for i in range(500):
+        try:
+            flaky.complete(f"prompt {i}")
+        except HTTPError:
+            failed += 1  # All four attempts failed (0.3 ** 4, under 1%)
+    assert failed < 15
+    assert breaker.state == CLOSED
+    assert breaker.opened == 0
+
+
+def test_client_errors_do_not_open():
+    breaker = CircuitBreaker('fake')
+    bad_request = FakeProvider(error=HTTPError(400), breaker=breaker)
+
+    for _ in range(breaker.min_calls * 2):
+        with pytest.raises(HTTPError):
+            bad_request.complete('prompt')
+    assert breaker.state == CLOSED
+
+
+def test_old_outcomes_expire(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr('providers.breaker.time.monotonic', lambda: clock[0])
+    breaker = CircuitBreaker('fake', min_calls=5, window_seconds=60)
+
+    for _ in range(4):
+        breaker.record(True, 0.1)
+    clock[0] += 120
+    breaker.record(True, 0.1)
+    assert breaker.state == CLOSED
+    assert breaker.stats()['recent_calls'] == 1
+
+
+def test_half_open_probe_closes_on_success(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr('providers.breaker.time.monotonic', lambda: clock[0])
+    breaker = CircuitBreaker('fake', min_calls=2, open_seconds=30)
+
+    breaker.record(True, 0.1)
+    breaker.record(True, 0.1)
+    assert breaker.state == OPEN
+    with pytest.raises(CircuitOpen):
+        breaker.before_call()
+
+    clock[0] += 31
+    breaker.before_call()
+    with pytest.raises(CircuitOpen):
+        breaker.before_call()  # Only one probe at a time
+    breaker.record(False, 0.1)
+    assert breaker.state == CLOSED
+
+
+def test_open_circuit_fails_over_without_a_call():
+    breaker = CircuitBreaker('fake', min_calls=1)
+    breaker.record(True, 0.1)
+    dead = FakeProvider(error=HTTPError(503), breaker=breaker)
+    route = Failover((dead, {}, None), (FakeProvider(reply='fallback'), {}, None))
+
+    assert route.complete('prompt') == 'fallback'
+    assert dead.requests == 0
@@ -0,0 +1,113 @@
+"""SQLite response cache and cache-after-parse"""
+
+import asyncio
+import itertools
+import json
+import threading
+
+import pytest
+
+from providers.cache import SQLiteCache
+
+from fakes import FakeProvider
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = SQLiteCache(str(tmp_path / 'cache.sqlite3'), max_entries=10, touch_batch=4)
+    yield cache
+    cache.close()
+
+
+def stored_access_time(cache, key):
+    return cache._conn.execute(
+        'SELECT accessed_at FROM responses WHERE key = ?', (key,)
+    ).fetchone()[0]
+
+
+def test_hits_write_access_times_in_batches(cache, monkeypatch):
+    clock = itertools.count(1000)
+    monkeypatch.setattr('providers.cache.time.time', lambda: float(next(clock)))
+    for key in 'abcd':
+        cache.set(key, key)
+    written = stored_access_time(cache, 'a')
+
+    for key in 'abc':
+        assert cache.get(key) == key
+    cache.get('a')
+    assert stored_access_time(cache, 'a') == written
+
+    cache.get('d')  # Fourth entry hit fills the batch
+    assert stored_access_time(cache, 'a') > written
+
+
+def test_eviction_sees_unwritten_hits_and_stops_at_low_water(cache):
+    for i in range(10):
+        cache.set(f'k{i}', str(i))
+    cache.get('k0')  # Recently used, although not written yet
+
+    cache.set('k10', '10')
+
+    assert len(cache) == 9
+    assert cache.evictions == 2
+    assert cache.get('k0') == '0'
+    assert cache.get('k1') is None and cache.get('k2') is None
+
+
+def test_row_count_ignores_overwrites(cache):
+    for _ in range(20):
+        cache.set('same', 'value')
+    assert cache._rows == len(cache) == 1
+    assert cache.evictions == 0
+
+
+def test_async_access_runs_off_the_event_loop(cache):
+    threads = []
+    get = cache.get
+
+    def recording_get(key):
+        threads.append(threading.get_ident())
+        return get(key)
+
+    cache.get = recording_get
+
+    async def run():
+        await cache.set_async('a', '1')
+        return await cache.get_async('a')
+
+    assert asyncio.run(run()) == '1'
+    assert threads and threading.get_ident() not in threads
+
+
+def test_response_is_cached_only_after_it_parses(cache):
+    provider = FakeProvider(reply='not json', cache=cache)
+
+    with pytest.raises(ValueError):
+        provider.complete('prompt', parse=json.loads)
+    assert len(cache) == 0
+
+    provider.reply = '{"score": 0.7}'
+    assert provider.complete('prompt', parse=json.loads) == {'score': 0.7}
+    assert asyncio.run(provider.complete_async('prompt', parse=json.loads)) == {'score': 0.7}
+    assert provider.requests == 2
+    assert len(cache) == 1
+
+
+
+def test_eviction_counts_rows_actually_deleted(cache):
+    for i in range(10):
+        cache.set(f'k{i}', str(i))
+    count = cache._count
+
+    def count_then_lose_rows():
+        # Another process sharing the file clears rows right after we count
+        rows = count()
+        cache._conn.execute("DELETE FROM responses WHERE key != 'k10'")
+        return rows
+
+    cache._count = count_then_lose_rows
+    cache.set('k10', '10')  # 11 counted: 2 to evict, but only 1 row is left
+    cache._count = count
+
+    assert len(cache) == 0
+    assert cache.evictions == 1
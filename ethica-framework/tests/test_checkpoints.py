@@ -0,0 +1,59 @@
+"""Stage checkpoints of the async analysis path"""
+
+import asyncio
+
+from core.checkpoints import MemoryCheckpointStore
+from core.framework import EthicaFramework
+
+from fakes import SyntheticTransport
+
+SCENARIO = {
+    'action': 'Deploy a triage model',
+    'context': 'Public hospital',
+    'stakeholders': ['patients', 'staff']
+}
+
+
+class RecordingStore(MemoryCheckpointStore):
+    """Remembers every saved stage, even after the checkpoint is deleted"""
+
+    def __init__(self):
+        super().__init__()
+        self.saved = []
+
+    def save(self, scenario_id, stage, output):
+        self.saved.append(stage)
+        super().save(scenario_id, stage, output)
+
+
+def framework(checkpoints):
+    return EthicaFramework(
+        'test', 'test', 'test', transport=SyntheticTransport(), checkpoints=checkpoints
+    )
+
+
+def test_async_analysis_saves_every_stage_then_drops_checkpoint():
+    store = RecordingStore()
+    result = asyncio.run(framework(store).analyze_async(SCENARIO))
+
+    assert not result.incomplete
+    assert len(store.saved) == len(set(store.saved)) > 1
+    assert store.load(result.scenario_id) is None
+
+
+def test_async_analysis_resumes_from_checkpoint():
+    store = RecordingStore()
+    ethica = framework(store)
+    first = asyncio.run(ethica.analyze_async(SCENARIO))
+
+    # Same analysis interrupted after its first stage
+    store.begin('ETH-RESUME', SCENARIO, first.timestamp)
+    purpose = store.saved[0]
+    store.save('ETH-RESUME', purpose, first.impact_score)
+    store.saved.clear()
+
+    resumed = asyncio.run(ethica.analyze_async(None, resume='ETH-RESUME'))
+
+    assert resumed.scenario_id == 'ETH-RESUME'
+    assert purpose not in store.saved
+    assert store.load('ETH-RESUME') is None
@@ -0,0 +1,55 @@
+"""DeepSeek async clients per event loop"""
+
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from providers import deepseek
+from providers.deepseek import DeepSeekClient
+
+
+class FakeAsyncClient:
+    def __init__(self, limits=None):
+        self.closed = False
+
+    async def aclose(self):
+        self.closed = True
+
+
+@pytest.fixture(autouse=True)
+def fake_httpx(monkeypatch):
+    monkeypatch.setattr(
+        deepseek, 'httpx', SimpleNamespace(AsyncClient=FakeAsyncClient, Limits=lambda **kwargs: kwargs)
+    )
+
+
+def test_one_async_client_per_event_loop():
+    client = DeepSeekClient()
+
+    async def get_twice():
+        return client._client_for_loop(), client._client_for_loop()
+
+    first, again = asyncio.run(get_twice())
+    assert first is again
+
+    other = []
+    thread = threading.Thread(target=lambda: other.extend(asyncio.run(get_twice())))
+    thread.start()
+    thread.join()
+    assert other[0] is not first and other[0] is other[1]
+    assert not first.closed  # Another loop's client does not replace it
+
+
+def test_aclose_closes_the_running_loops_client():
+    client = DeepSeekClient()
+
+    async def use_and_close():
+        async_client = client._client_for_loop()
+        await client.aclose()
+        return async_client, client._client_for_loop()
+
+    closed, fresh = asyncio.run(use_and_close())
+    assert closed.closed
+    assert fresh is not closed
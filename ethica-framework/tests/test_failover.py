@@ -0,0 +1,65 @@
+"""Failover between providers"""
+
+import asyncio
+import time
+
+import pytest
+
+from providers.breaker import Failover
+from providers.deadline import DeadlineExceeded, deadline_scope
+from providers.retry import RetryPolicy
+
+from fakes import FakeProvider, HTTPError
+
+
+def retrying(provider):
+    provider.retry_policy = RetryPolicy(max_attempts=4, base_delay=0.5, max_delay=20.0, seed=1)
+    return provider
+
+
+def test_blocking_route_timeout_covers_retries():
+    dead = retrying(FakeProvider(error=HTTPError(503)))
+    fallback = FakeProvider(reply='fallback')
+    route = Failover((dead, {}, 0.2), (fallback, {}, None))
+
+    start = time.monotonic()
+    assert route.complete('prompt') == 'fallback'
+    assert time.monotonic() - start < 0.5
+
+
+def test_blocking_route_timeout_cuts_slow_request():
+    slow = retrying(FakeProvider(latency=5.0))
+    fallback = FakeProvider(reply='fallback')
+    route = Failover((slow, {}, 0.2), (fallback, {}, None))
+
+    start = time.monotonic()
+    assert route.complete('prompt') == 'fallback'
+    assert time.monotonic() - start < 0.5
+    assert slow.requests == 1
+
+
+def test_async_route_timeout_covers_retries():
+    dead = retrying(FakeProvider(error=HTTPError(503)))
+    fallback = FakeProvider(reply='fallback')
+    route = Failover((dead, {}, 0.2), (fallback, {}, None))
+
+    start = time.monotonic()
+    assert asyncio.run(route.complete_async('prompt')) == 'fallback'
+    assert time.monotonic() - start < 0.5
+
+
+def test_analysis_deadline_stops_failover():
+    slow = FakeProvider(latency=5.0)
+    fallback = FakeProvider(reply='fallback')
+    route = Failover((slow, {}, 1.0), (fallback, {}, None))
+
+    with deadline_scope(0.1):
+        with pytest.raises(DeadlineExceeded):
+            route.complete('prompt')
+    assert fallback.requests == 0
+
+
+def test_final_route_error_is_raised():
+    route = Failover((FakeProvider(error=HTTPError(400)), {}, None))
+    with pytest.raises(HTTPError):
+        route.complete('prompt')
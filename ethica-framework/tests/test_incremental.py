@@ -0,0 +1,81 @@
+"""Stage reuse keys (incremental re-analysis)"""
+
+import asyncio
+from dataclasses import dataclass
+from types import SimpleNamespace
+
+from core.framework import EthicaFramework
+from core.incremental import fingerprint, memoized, reuse_scope
+from core.pipeline import Stage
+from providers.cache import MemoryCache
+
+
+@dataclass
+class Score:
+    value: float
+    reasoning: str
+
+
+SCENARIO = {
+    'action': 'Deploy a triage model',
+    'context': 'Public hospital',
+    'stakeholders': ['patients', 'staff']
+}
+
+
+def test_key_ignores_fields_no_prompt_reads():
+    edited = {**SCENARIO, 'stakeholders': ['patients'], 'metadata': {'user': 'x'}}
+    assert fingerprint('impact', {'scenario': SCENARIO}) == fingerprint('impact', {'scenario': edited})
+
+
+def test_key_changes_with_prompt_fields_inputs_and_salt():
+    key = fingerprint('impact', {'scenario': SCENARIO, 'score': Score(0.7, 'ok')})
+    assert key != fingerprint('impact', {'scenario': {**SCENARIO, 'context': 'Clinic'}, 'score': Score(0.7, 'ok')})
+    assert key != fingerprint('impact', {'scenario': SCENARIO, 'score': Score(0.8, 'ok')})
+    assert key != fingerprint('risk', {'scenario': SCENARIO, 'score': Score(0.7, 'ok')})
+    assert key != fingerprint('impact', {'scenario': SCENARIO, 'score': Score(0.7, 'ok')}, salt='other-model')
+
+
+def test_key_is_independent_of_input_order():
+    a = fingerprint('s', {'scenario': SCENARIO, 'score': Score(0.7, 'ok')})
+    b = fingerprint('s', {'score': Score(0.7, 'ok'), 'scenario': dict(reversed(list(SCENARIO.items())))})
+    assert a == b
+
+
+def test_memoized_stage_reuses_output():
+    runs = []
+
+    def run(scenario):
+        runs.append(1)
+        return Score(0.7, scenario['action'])
+
+    async def run_async(scenario):
+        return run(scenario)
+
+    stage = memoized(Stage('impact', run, ('scenario',), run_async=run_async), MemoryCache())
+
+    with reuse_scope() as reused:
+        first = stage.run(scenario=SCENARIO)
+    assert reused == []
+
+    with reuse_scope() as reused:
+        again = stage.run(scenario={**SCENARIO, 'stakeholders': []})
+        assert asyncio.run(stage.run_async(scenario=SCENARIO)) == first
+    assert again == first and isinstance(again, Score)
+    assert reused == ['impact', 'impact']
+    assert len(runs) == 1
+
+    stage.run(scenario={**SCENARIO, 'action': 'Something else'})
+    assert len(runs) == 2
+
+
+def test_stage_reuse_is_opt_in(monkeypatch):
+    owner = SimpleNamespace(cache=None)
+    monkeypatch.delenv('ETHICA_INCREMENTAL', raising=False)
+    assert EthicaFramework._stage_cache_from_env(owner) is None
+
+    monkeypatch.setenv('ETHICA_INCREMENTAL', '1')
+    assert isinstance(EthicaFramework._stage_cache_from_env(owner), MemoryCache)
+
+    owner.cache = MemoryCache()
+    assert EthicaFramework._stage_cache_from_env(owner) is owner.cache
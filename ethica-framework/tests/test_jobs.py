@@ -0,0 +1,138 @@
+"""Job workers: queue errors and webhook targets"""
+
+import http.server
+import threading
+import time
+from dataclasses import dataclass
+
+import pytest
+
+from core.jobs import COMPLETED, JobWorker, MemoryJobQueue, check_webhook_url
+
+
+@dataclass
+class Result:
+    scenario_id: str
+
+
+class Framework:
+    def analyze(self, scenario, on_event=None, resume=None):
+        return Result(resume)
+
+
+class FlakyQueue(MemoryJobQueue):
+    """Fails the first `claim_errors` claims and `complete_errors` completions"""
+
+    def __init__(self, claim_errors=0, complete_errors=0):
+        super().__init__(stale_after=0.2)
+        self.claim_errors = claim_errors
+        self.complete_errors = complete_errors
+
+    def claim(self):
+        if self.claim_errors:
+            self.claim_errors -= 1
+            raise RuntimeError("database is locked")
+        return super().claim()
+
+    def complete(self, job_id, result):
+        if self.complete_errors:
+            self.complete_errors -= 1
+            raise RuntimeError("database is locked")
+        super().complete(job_id, result)
+
+
+def wait_for(queue, job_id, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if queue.get(job_id).status == COMPLETED:
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def run_worker(queue):
+    worker = JobWorker(Framework(), queue, workers=1, poll_interval=0.01, max_backoff=0.05)
+    worker.start()
+    return worker
+
+
+def test_worker_keeps_going_after_a_failed_completion():
+    queue = FlakyQueue(complete_errors=1)
+    worker = run_worker(queue)
+    try:
+        first = queue.submit({'action': 'a'})
+        second = queue.submit({'action': 'b'})
+        worker.notify()
+
+        assert wait_for(queue, second.id)
+        # The first job went stale and was run again
+        assert wait_for(queue, first.id)
+    finally:
+        worker.stop(timeout=5)
+
+
+def test_worker_backs_off_and_retries_failed_claims():
+    queue = FlakyQueue(claim_errors=3)
+    worker = run_worker(queue)
+    try:
+        job = queue.submit({'action': 'a'})
+        assert wait_for(queue, job.id)
+        assert queue.claim_errors == 0
+    finally:
+        worker.stop(timeout=5)
+
+
+@pytest.mark.parametrize('url', [
+    'ftp://example.com/hook',
+    'file:///etc/passwd',
+    'http://127.0.0.1:8000/hook',
+    'http://localhost/hook',
+    'http://169.254.169.254/latest/meta-data',
+    'http://10.0.0.5/hook',
+    'http://[::1]/hook',
+    'http://[::ffff:192.168.1.1]/hook',
+])
+def test_webhook_to_internal_or_non_http_targets_is_refused(url, monkeypatch):
+    monkeypatch.delenv('ETHICA_WEBHOOK_ALLOWLIST', raising=False)
+    with pytest.raises(ValueError):
+        check_webhook_url(url)
+
+
+def test_webhook_to_public_address_is_accepted(monkeypatch):
+    monkeypatch.delenv('ETHICA_WEBHOOK_ALLOWLIST', raising=False)
+    assert check_webhook_url('https://93.184.216.34/hook') == 'https://93.184.216.34/hook'
+
+
+def test_webhook_allowlist_is_exclusive(monkeypatch):
+    monkeypatch.setenv('ETHICA_WEBHOOK_ALLOWLIST', 'hooks.internal, Example.com')
+    assert check_webhook_url('http://hooks.internal/x') == 'http://hooks.internal/x'
+    assert check_webhook_url('https://example.com/x') == 'https://example.com/x'
+    with pytest.raises(ValueError):
+        check_webhook_url('https://93.184.216.34/hook')
+
+
+def test_webhook_does_not_follow_redirects(monkeypatch):
+    hits = []
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_POST(self):
+            hits.append(self.path)
+            self.send_response(307)
+            self.send_header('Location', '/internal')
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.HTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setenv('ETHICA_WEBHOOK_ALLOWLIST', '127.0.0.1')
+    try:
+        queue = MemoryJobQueue()
+        job = queue.submit({'action': 'a'})
+        worker = JobWorker(Framework(), queue)
+        worker._send_webhook(f'http://127.0.0.1:{server.server_port}/hook', job.id)
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert hits == ['/hook']
@@ -0,0 +1,65 @@
+"""Stage graph error handling"""
+
+import asyncio
+
+import pytest
+
+from core.pipeline import Stage, StageGraph
+from providers.deadline import DeadlineExceeded
+
+
+def stage(name, run_async, inputs=('x',)):
+    return Stage(name, lambda **_: None, inputs, run_async=run_async)
+
+
+async def value(**_):
+    return 1
+
+
+def test_stage_error_is_raised_and_siblings_cancelled():
+    cancelled = []
+
+    async def slow(**_):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append('slow')
+            raise
+
+    async def broken(**_):
+        raise ValueError("bad response")
+
+    graph = StageGraph([stage('slow', slow), stage('broken', broken)], provided=('x',))
+
+    async def run():
+        with pytest.raises(ValueError):
+            await graph.run_async({'x': 0})
+        await asyncio.sleep(0)  # Let the cancellation reach the sibling
+        return list(cancelled)
+
+    assert asyncio.run(run()) == ['slow']
+
+
+def test_cancelled_stage_is_reported_as_cancelled():
+    async def gives_up(**_):
+        raise asyncio.CancelledError()
+
+    graph = StageGraph([stage('a', value), stage('gives_up', gives_up)], provided=('x',))
+
+    with pytest.raises(asyncio.CancelledError, match="gives_up"):
+        asyncio.run(graph.run_async({'x': 0}))
+
+
+def test_stage_past_deadline_is_left_out():
+    async def late(**_):
+        raise DeadlineExceeded()
+
+    graph = StageGraph(
+        [stage('a', value), stage('late', late), stage('after', value, ('late',))],
+        provided=('x',)
+    )
+    outputs = asyncio.run(graph.run_async({'x': 0}))
+
+    assert outputs['a'] == 1
+    assert 'late' not in outputs and 'after' not in outputs
+    assert graph.missing(outputs) == ['late', 'after']
@@ -0,0 +1,24 @@
+"""Junk signals of the local pre-screen"""
+
+from modules.pre_screen import FLAG, PASS, REJECT, PreScreen
+
+
+def verdict(action, context=''):
+    return PreScreen().screen({'action': action, 'context': context}).verdict
+
+
+def test_mostly_digits_alone_is_only_flagged():
+    assert verdict('Raise SLA target 99.95% -> 99.99% (v2.4.1, 2025-01-31, 12:00 UTC)') == FLAG
+
+
+def test_not_text_with_a_second_junk_signal_is_rejected():
+    assert verdict('12 %%') == REJECT
+    assert verdict('1111111111111 22 ## 33') == REJECT
+
+
+def test_plain_scenario_passes():
+    assert verdict('Deploy a triage model', 'Public hospital emergency ward') == PASS
+
+
+def test_empty_action_is_rejected():
+    assert verdict('   ', 'context only') == REJECT
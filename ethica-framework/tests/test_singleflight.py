@@ -0,0 +1,176 @@
+"""Single-flight request coalescing"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from providers.deadline import DeadlineExceeded, deadline_scope
+from providers.singleflight import SingleFlight
+
+
+def test_collapses_concurrent_calls():
+    flight = SingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return 'ok'
+
+    async def main():
+        return await asyncio.gather(*(flight.do_async('k', fetch) for _ in range(5)))
+
+    assert asyncio.run(main()) == ['ok'] * 5
+    assert len(calls) == 1
+    assert flight.stats()['collapsed'] == 4
+
+
+def test_cancelled_leader_hands_call_to_follower():
+    flight = SingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.1)
+        return 'ok'
+
+    async def main():
+        leader = asyncio.ensure_future(flight.do_async('k', fetch))
+        await asyncio.sleep(0.01)
+        follower = asyncio.ensure_future(flight.do_async('k', fetch))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        result = await follower
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return result
+
+    assert asyncio.run(main()) == 'ok'
+    assert len(calls) == 2
+
+
+def test_leader_deadline_is_not_shared():
+    flight = SingleFlight()
+
+    async def fetch():
+        await asyncio.sleep(0.1)
+        return 'ok'
+
+    async def bounded_fetch():
+        # What a provider attempt does when the analysis runs out of time
+        try:
+            return await asyncio.wait_for(fetch(), 0.03)
+        except asyncio.TimeoutError:
+            raise DeadlineExceeded("Analysis deadline exceeded")
+
+    async def leader():
+        with deadline_scope(0.03):
+            return await flight.do_async('k', bounded_fetch)
+
+    async def main():
+        first = asyncio.ensure_future(leader())
+        await asyncio.sleep(0.01)
+        second = asyncio.ensure_future(flight.do_async('k', fetch))
+        with pytest.raises(DeadlineExceeded):
+            await first
+        return await second
+
+    assert asyncio.run(main()) == 'ok'
+
+
+def test_errors_reach_followers():
+    flight = SingleFlight()
+
+    async def fetch():
+        await asyncio.sleep(0.05)
+        raise ValueError('bad request')
+
+    async def main():
+        return await asyncio.gather(
+            *(flight.do_async('k', fetch) for _ in range(3)), return_exceptions=True
+        )
+
+    assert all(isinstance(r, ValueError) for r in asyncio.run(main()))
+    assert flight.stats()['in_flight'] == 0
+
+
+def test_blocking_leader_deadline_hands_call_to_follower():
+    flight = SingleFlight()
+    calls = []
+
+    def fetch(fail):
+        calls.append(1)
+        time.sleep(0.05)
+        if fail:
+            raise DeadlineExceeded("Analysis deadline exceeded")
+        return 'ok'
+
+    results = {}
+
+    def leader():
+        try:
+            flight.do('k', lambda: fetch(True))
+        except DeadlineExceeded as e:
+            results['leader'] = e
+
+    def follower():
+        results['follower'] = flight.do('k', lambda: fetch(False))
+
+    threads = [threading.Thread(target=leader)]
+    threads[0].start()
+    time.sleep(0.01)
+    threads.append(threading.Thread(target=follower))
+    threads[1].start()
+    for thread in threads:
+        thread.join()
+
+    assert isinstance(results['leader'], DeadlineExceeded)
+    assert results['follower'] == 'ok'
+    assert len(calls) == 2
+
+
+def test_follower_gives_up_at_its_own_deadline():
+    flight = SingleFlight()
+
+    async def fetch():
+        await asyncio.sleep(0.3)
+        return 'ok'
+
+    async def follower():
+        with deadline_scope(0.05):
+            return await flight.do_async('k', fetch)
+
+    async def main():
+        leader = asyncio.ensure_future(flight.do_async('k', fetch))  # No deadline
+        await asyncio.sleep(0)
+        start = time.monotonic()
+        with pytest.raises(DeadlineExceeded):
+            await follower()
+        waited = time.monotonic() - start
+        return waited, await leader
+
+    waited, result = asyncio.run(main())
+    assert waited < 0.2
+    assert result == 'ok'  # The shared call was not cancelled
+
+
+def test_blocking_follower_gives_up_at_its_own_deadline():
+    flight = SingleFlight()
+    started = threading.Event()
+
+    def fetch():
+        started.set()
+        time.sleep(0.3)
+        return 'ok'
+
+    leader = threading.Thread(target=flight.do, args=('k', fetch))
+    leader.start()
+    started.wait()
+
+    start = time.monotonic()
+    with deadline_scope(0.05), pytest.raises(DeadlineExceeded):
+        flight.do('k', fetch)
+    assert time.monotonic() - start < 0.2
+    leader.join()
@@ -9,6 +9,7 @@ identificando stakeholders, efectos de segundo/tercer orden, y riesgos sistemico
 
 from typing import Any, Dict, List, Optional
 from ...core.sefirotic_base import SefiraBase, SefiraPosition
+from ..transport import wrap_client
 from loguru import logger
 import os
 import google.generativeai as genai
@@ -48,7 +49,7 @@ class Binah(SefiraBase):
             self.client = None
         else:
             genai.configure(api_key=self.api_key)
-            self.client = genai.GenerativeModel('gemini-2.0-flash-exp')
+            self.client = wrap_client(genai.GenerativeModel('gemini-2.0-flash-exp'), 'gemini')
             logger.info("Binah initialized with Gemini API client")
 
         # Configuracion del modelo
@@ -692,7 +693,7 @@ Considera multiples dimensiones: temporal, social, economica, cultural, ambienta
     def set_model(self, model: str):
         """Permite cambiar el modelo de Gemini"""
         self.model_name = model
-        self.client = genai.GenerativeModel(model)
+        self.client = wrap_client(genai.GenerativeModel(model), 'gemini')
         logger.info(f"Binah ahora usa modelo: {model}")
 
     def set_temperature(self, temperature: float):
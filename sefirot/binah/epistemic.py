@@ -1,11 +1,53 @@
 import os
+import threading
 import google.generativeai as genai
 from ...core.sefirotic_base import SefiraBase, SefiraPosition
+from ..transport import wrap_client
 from loguru import logger
 from typing import Optional, Dict, Any
 from .ontological_override import OntologicalOverride, get_override
 
 
+DEEPSEEK_BASE_URL = os.getenv("ETHICA_DEEPSEEK_BASE_URL", "https://api.deepseek.com")
+
+# Un cliente DeepSeek por API key, compartido entre instancias: conserva
+# el pool de conexiones keep-alive en lugar de repetir el handshake TLS.
+_deepseek_clients: Dict[str, Any] = {}
+_deepseek_lock = threading.Lock()
+
+
+def get_deepseek_client(api_key: str):
+    """
+    Devuelve el cliente OpenAI-compatible compartido para DeepSeek.
+
+    El tamaño del pool se controla con ETHICA_DEEPSEEK_POOL_SIZE, el
+    timeout de conexión con ETHICA_DEEPSEEK_CONNECT_TIMEOUT y el de
+    lectura con ETHICA_DEEPSEEK_READ_TIMEOUT.
+    """
+    with _deepseek_lock:
+        client = _deepseek_clients.get(api_key)
+        if client is None:
+            import httpx
+            from openai import OpenAI
+
+            pool_size = int(os.getenv("ETHICA_DEEPSEEK_POOL_SIZE", 20))
+            connect_timeout = float(os.getenv("ETHICA_DEEPSEEK_CONNECT_TIMEOUT", 5.0))
+            read_timeout = float(os.getenv("ETHICA_DEEPSEEK_READ_TIMEOUT", 60.0))
+            client = OpenAI(
+                api_key=api_key,
+                base_url=DEEPSEEK_BASE_URL,
+                http_client=httpx.Client(
+                    limits=httpx.Limits(
+                        max_connections=pool_size,
+                        max_keepalive_connections=pool_size
+                    ),
+                    timeout=httpx.Timeout(read_timeout, connect=connect_timeout)
+                )
+            )
+            _deepseek_clients[api_key] = client
+        return client
+
+
 class BinahEpistemic(SefiraBase):
     """
     Binah-B: Auditoría Epistemológica con Override Ontológico
@@ -45,23 +87,23 @@ class BinahEpistemic(SefiraBase):
                 raise ValueError("GEMINI_API_KEY no configurada")
 
             genai.configure(api_key=api_key)
-            self.client = genai.GenerativeModel(
-                "gemini-2.0-flash-exp",
+            self.client = wrap_client(
+                genai.GenerativeModel(
+                    "gemini-2.0-flash-exp",
+                    system_instruction=self._system_patch()
+                ),
+                'gemini',
                 system_instruction=self._system_patch()
             )
             self.model_name = "gemini-2.0-flash-exp (Western)"
             logger.info("BinahEpistemic initialized with Gemini (Western model)")
         else:
             # Usar DeepSeek (Oriente) via OpenAI-compatible API
-            from openai import OpenAI
             api_key = api_key or os.getenv("DEEPSEEK_API_KEY")
             if not api_key:
                 raise ValueError("DEEPSEEK_API_KEY no configurada")
 
-            self.client = OpenAI(
-                api_key=api_key,
-                base_url="https://api.deepseek.com"
-            )
+            self.client = wrap_client(get_deepseek_client(api_key), 'deepseek')
             self.model_name = "deepseek-chat (Eastern)"
             logger.info("BinahEpistemic initialized with DeepSeek (Eastern model)")
 
@@ -133,8 +175,12 @@ OUTPUT FORMAT:
         if not self.use_deepseek:
             api_key = os.getenv("GEMINI_API_KEY")
             genai.configure(api_key=api_key)
-            self.client = genai.GenerativeModel(
-                "gemini-2.0-flash-exp",
+            self.client = wrap_client(
+                genai.GenerativeModel(
+                    "gemini-2.0-flash-exp",
+                    system_instruction=self._system_patch()
+                ),
+                'gemini',
                 system_instruction=self._system_patch()
             )
 
@@ -1,6 +1,7 @@
 from .contextual import Binah as BinahContextual
 from .epistemic import BinahEpistemic
 from .ontological_override import get_override
+from ..transport import wrap_client
 from loguru import logger
 import google.generativeai as genai
 import os
@@ -71,7 +72,7 @@ class BinahSigma:
         api_key = os.getenv("GEMINI_API_KEY")
         if api_key:
             genai.configure(api_key=api_key)
-            self.synthesizer = genai.GenerativeModel('gemini-2.0-flash-exp')
+            self.synthesizer = wrap_client(genai.GenerativeModel('gemini-2.0-flash-exp'), 'gemini')
         else:
             self.synthesizer = None
 
@@ -11,6 +11,7 @@ Por eso trabaja en balance con Gevurah (Severidad).
 
 from typing import Any, Dict, List, Optional
 from ..core.sefirotic_base import SefiraBase, SefiraPosition
+from .transport import wrap_client
 from loguru import logger
 import os
 import google.generativeai as genai
@@ -50,7 +51,7 @@ class Chesed(SefiraBase):
             self.client = None
         else:
             genai.configure(api_key=self.api_key)
-            self.client = genai.GenerativeModel('gemini-2.0-flash-exp')
+            self.client = wrap_client(genai.GenerativeModel('gemini-2.0-flash-exp'), 'gemini')
             logger.info("Chesed initialized with Gemini API client")
 
         # Configuracion del modelo
@@ -15,6 +15,8 @@ import os
 import time
 import re
 from ..core.sefirotic_base import SefiraBase, SefiraPosition
+from .transport import wrap_client
+from .circuit import get_breaker
 from loguru import logger
 
 try:
@@ -88,27 +90,26 @@ Please structure your response STRICTLY with these sections, using Markdown Leve
         self.client = None
         self.client_type = None
 
-        # Try Anthropic first
-        if not use_mistral:
-            self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
-            if ANTHROPIC_AVAILABLE and self.api_key:
-                self.client = Anthropic(api_key=self.api_key)
-                self.client_type = "anthropic"
-                self.model = "claude-sonnet-4-5-20250929"
-                self.max_tokens = 4096
-                self.temperature = 1.0
-                logger.info("Chochmah initialized with Claude API client")
-                return
-
-        # Fallback to Mistral
-        mistral_key = api_key or os.getenv("MISTRAL_API_KEY")
-        if MISTRAL_AVAILABLE and mistral_key:
-            self.client = Mistral(api_key=mistral_key)
-            self.client_type = "mistral"
-            self.model = "mistral-large-latest"
-            self.max_tokens = 4096
-            self.temperature = 0.7
-            logger.info("Chochmah initialized with Mistral API client")
+        # Preferred API first, the other one as fallback when its key is set
+        self.routes = []
+        order = ("mistral", "anthropic") if use_mistral else ("anthropic", "mistral")
+        for client_type in order:
+            route = self._build_route(client_type, api_key if not self.routes else None)
+            if route is not None:
+                self.routes.append(route)
+
+        if self.routes:
+            primary = self.routes[0]
+            self.client = primary['client']
+            self.client_type = primary['type']
+            self.model = primary['model']
+            self.max_tokens = primary['max_tokens']
+            self.temperature = primary['temperature']
+            if primary['type'] == "anthropic":
+                self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
+            logger.info(
+                f"Chochmah initialized with {' -> '.join(r['type'] for r in self.routes)} API client(s)"
+            )
             return
 
         # No client available
@@ -117,6 +118,31 @@ Please structure your response STRICTLY with these sections, using Markdown Leve
         self.max_tokens = 4096
         self.temperature = 1.0
 
+    @staticmethod
+    def _build_route(client_type: str, api_key: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Client, model and breaker for one API, or None if unavailable"""
+        if client_type == "anthropic":
+            api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
+            if not (ANTHROPIC_AVAILABLE and api_key):
+                return None
+            client = wrap_client(Anthropic(api_key=api_key), 'anthropic')
+            model, temperature = "claude-sonnet-4-5-20250929", 1.0
+        else:
+            api_key = api_key or os.getenv("MISTRAL_API_KEY")
+            if not (MISTRAL_AVAILABLE and api_key):
+                return None
+            client = wrap_client(Mistral(api_key=api_key), 'mistral')
+            model, temperature = "mistral-large-latest", 0.7
+
+        return {
+            'type': client_type,
+            'client': client,
+            'model': model,
+            'max_tokens': 4096,
+            'temperature': temperature,
+            'breaker': get_breaker(client_type, model)
+        }
+
     def process(self, input_data: Any) -> Dict[str, Any]:
         """
         Process query with deep reasoning through Claude API.
@@ -167,36 +193,8 @@ Please structure your response STRICTLY with these sections, using Markdown Leve
             # Build user message
             user_message = self._build_user_message(query, context, objective)
 
-            # Call appropriate API
-            logger.debug(f"Chochmah calling {self.client_type} API with model {self.model}")
-
-            if self.client_type == "anthropic":
-                response = self.client.messages.create(
-                    model=self.model,
-                    max_tokens=self.max_tokens,
-                    temperature=self.temperature,
-                    system=self.SYSTEM_PROMPT,
-                    messages=[
-                        {"role": "user", "content": user_message}
-                    ]
-                )
-                raw_response = response.content[0].text
-
-            elif self.client_type == "mistral":
-                messages = [
-                    {"role": "system", "content": self.SYSTEM_PROMPT},
-                    {"role": "user", "content": user_message}
-                ]
-                response = self.client.chat.complete(
-                    model=self.model,
-                    messages=messages,
-                    max_tokens=self.max_tokens,
-                    temperature=self.temperature
-                )
-                raw_response = response.choices[0].message.content
-
-            else:
-                raise RuntimeError(f"Unknown client type: {self.client_type}")
+            # Call the first API whose circuit is closed
+            raw_response = self._complete(user_message)
 
             # Parse structured response
             parsed = self._parse_response(raw_response)
@@ -282,6 +280,55 @@ Please structure your response STRICTLY with these sections, using Markdown Leve
             logger.error(f"Chochmah error: {e}")
             raise
 
+    def _complete(self, user_message: str) -> str:
+        """
+        Send the message down the routes in order
+
+        A route whose circuit is open is skipped without a network call;
+        a failing route falls through to the next one. The last error is
+        raised if every route fails.
+        """
+        for i, route in enumerate(self.routes):
+            logger.debug(f"Chochmah calling {route['type']} API with model {route['model']}")
+            try:
+                if route['breaker'] is None:
+                    return self._call_route(route, user_message)
+                return route['breaker'].call(self._call_route, route, user_message)
+            except Exception as e:
+                if i == len(self.routes) - 1:
+                    raise
+                logger.warning(
+                    f"Chochmah: {route['type']} unavailable, using {self.routes[i + 1]['type']} fallback: {e}"
+                )
+
+    def _call_route(self, route: Dict[str, Any], user_message: str) -> str:
+        if route['type'] == "anthropic":
+            response = route['client'].messages.create(
+                model=route['model'],
+                max_tokens=route['max_tokens'],
+                temperature=route['temperature'],
+                system=self.SYSTEM_PROMPT,
+                messages=[
+                    {"role": "user", "content": user_message}
+                ]
+            )
+            return response.content[0].text
+
+        if route['type'] == "mistral":
+            messages = [
+                {"role": "system", "content": self.SYSTEM_PROMPT},
+                {"role": "user", "content": user_message}
+            ]
+            response = route['client'].chat.complete(
+                model=route['model'],
+                messages=messages,
+                max_tokens=route['max_tokens'],
+                temperature=route['temperature']
+            )
+            return response.choices[0].message.content
+
+        raise RuntimeError(f"Unknown client type: {route['type']}")
+
     def _build_user_message(
         self,
         query: str,
@@ -627,6 +674,11 @@ Please structure your response STRICTLY with these sections, using Markdown Leve
         - claude-haiku-3-5-20250919 (fastest, cheapest)
         """
         self.model = model
+        # Requests read the route; the fallback keeps its own model
+        if self.routes:
+            primary = self.routes[0]
+            primary['model'] = model
+            primary['breaker'] = get_breaker(primary['type'], model)
         logger.info(f"Chochmah model changed to {model}")
 
     def set_temperature(self, temperature: float):
@@ -645,4 +697,6 @@ Please structure your response STRICTLY with these sections, using Markdown Leve
             )
 
         self.temperature = temperature
+        for route in self.routes:
+            route['temperature'] = temperature
         logger.info(f"Chochmah temperature set to {temperature}")
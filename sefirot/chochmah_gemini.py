@@ -8,6 +8,7 @@ Version usando Google Gemini API como alternativa a Claude.
 
 from typing import Any, Dict, List, Optional
 from ..core.sefirotic_base import SefiraBase, SefiraPosition
+from .transport import wrap_client
 from loguru import logger
 import os
 import google.generativeai as genai
@@ -45,7 +46,7 @@ class ChochmahGemini(SefiraBase):
             self.client = None
         else:
             genai.configure(api_key=self.api_key)
-            self.client = genai.GenerativeModel('gemini-2.0-flash-exp')
+            self.client = wrap_client(genai.GenerativeModel('gemini-2.0-flash-exp'), 'gemini')
             logger.info("ChochmahGemini initialized with Gemini API client")
 
         # Configuracion del modelo
@@ -469,7 +470,7 @@ RECOMENDACION:
     def set_model(self, model: str):
         """Permite cambiar el modelo de Gemini"""
         self.model_name = model
-        self.client = genai.GenerativeModel(model)
+        self.client = wrap_client(genai.GenerativeModel(model), 'gemini')
         logger.info(f"ChochmahGemini ahora usa modelo: {model}")
 
     def set_temperature(self, temperature: float):
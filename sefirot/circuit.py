@@ -0,0 +1,183 @@
+"""
+Circuit breakers para los proveedores LLM de las Sefirot
+
+Mismo comportamiento que `providers.breaker` de ethica-framework: cada
+(proveedor, modelo) tiene un breaker compartido por todas las Sefirot.
+Se abre cuando la mitad de las llamadas recientes fallaron o tardaron
+más de ETHICA_BREAKER_SLOW_CALL segundos; mientras está abierto, las
+llamadas se rechazan sin red y la Sefira pasa a su proveedor de respaldo.
+Tras ETHICA_BREAKER_OPEN_SECONDS deja pasar una llamada de prueba.
+
+ETHICA_CIRCUIT_BREAKER=0 desactiva los breakers.
+"""
+
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+from loguru import logger
+
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+# Errores de cliente que no indican un proveedor degradado
+_CLIENT_ERRORS = frozenset(range(400, 500)) - {408, 425, 429}
+
+
+class CircuitOpen(Exception):
+    """El circuito del proveedor está abierto; la llamada no se hizo"""
+
+
+def is_transient(error: BaseException) -> bool:
+    """False para errores de la petición (400, 401, ...), True para el resto"""
+    for attr in ('status_code', 'status', 'code'):
+        value = getattr(error, attr, None)
+        if isinstance(value, int):
+            return value not in _CLIENT_ERRORS
+    return True
+
+
+class CircuitBreaker:
+    """
+    Breaker de un proveedor y modelo
+
+    Guarda el resultado de las últimas `window` llamadas hechas en los
+    últimos `window_seconds`. Con al menos `min_calls`, se abre si la
+    fracción de fallos llega a `failure_rate` o la de llamadas lentas a
+    `slow_call_rate`; un endpoint caído lo abre tras `min_calls`
+    llamadas. Abierto, rechaza las
+    llamadas durante `open_seconds`; después una llamada de prueba lo
+    cierra (éxito) o lo vuelve a abrir (fallo).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        window: int = 100,
+        min_calls: int = 10,
+        failure_rate: float = 0.5,
+        slow_call_seconds: Optional[float] = 15.0,
+        slow_call_rate: float = 0.5,
+        open_seconds: float = 30.0,
+        window_seconds: float = 300.0
+    ):
+        self.name = name
+        self.min_calls = min_calls
+        self.window_seconds = window_seconds
+        self.failure_rate = failure_rate
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_call_rate = slow_call_rate
+        self.open_seconds = open_seconds
+
+        self.state = CLOSED
+        self.opened = 0
+        self.rejected = 0
+        self._calls: Deque[Tuple[float, bool, bool]] = deque(maxlen=window)  # (instante, fallo, lenta)
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def before_call(self):
+        """Admite la llamada o lanza CircuitOpen"""
+        with self._lock:
+            if self.state == OPEN:
+                if time.monotonic() - self._opened_at < self.open_seconds:
+                    self.rejected += 1
+                    raise CircuitOpen(f"Circuito de {self.name} abierto")
+                self.state, self._probing = HALF_OPEN, False
+
+            if self.state == HALF_OPEN:
+                if self._probing:
+                    self.rejected += 1
+                    raise CircuitOpen(f"Circuito de {self.name} en prueba")
+                self._probing = True
+
+    def record(self, failed: bool, seconds: float):
+        """Resultado de una llamada admitida"""
+        slow = self.slow_call_seconds is not None and seconds >= self.slow_call_seconds
+        with self._lock:
+            if self.state == HALF_OPEN:
+                self._probing = False
+                if failed or slow:
+                    self._open()
+                else:
+                    self.state = CLOSED
+                    self._calls.clear()
+                    logger.info(f"Circuito de {self.name} cerrado")
+                return
+
+            self._calls.append((time.monotonic(), failed, slow))
+            self._expire()
+            if self.state == CLOSED and len(self._calls) >= self.min_calls:
+                failures = sum(f for _, f, _ in self._calls) / len(self._calls)
+                slow_calls = sum(s for _, _, s in self._calls) / len(self._calls)
+                if failures >= self.failure_rate or slow_calls >= self.slow_call_rate:
+                    self._open()
+
+    def _expire(self):
+        cutoff = time.monotonic() - self.window_seconds
+        while self._calls and self._calls[0][0] < cutoff:
+            self._calls.popleft()
+
+    def _open(self):
+        self.state = OPEN
+        self._opened_at = time.monotonic()
+        self.opened += 1
+        self._calls.clear()
+        logger.warning(f"Circuito de {self.name} abierto durante {self.open_seconds:.0f}s")
+
+    def call(self, fn, *args: Any, **kwargs: Any) -> Any:
+        """Ejecuta `fn` protegida por el breaker"""
+        self.before_call()
+        start = time.monotonic()
+        try:
+            result = fn(*args, **kwargs)
+        except Exception as e:
+            self.record(is_transient(e), time.monotonic() - start)
+            raise
+        self.record(False, time.monotonic() - start)
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            self._expire()
+            calls = list(self._calls)
+        return {
+            'state': self.state,
+            'opened': self.opened,
+            'rejected': self.rejected,
+            'recent_calls': len(calls),
+            'recent_failures': sum(f for _, f, _ in calls),
+            'recent_slow_calls': sum(s for _, _, s in calls)
+        }
+
+
+_breakers: Dict[Tuple[str, str], CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(provider: str, model: str) -> Optional[CircuitBreaker]:
+    """Breaker compartido de (provider, model), o None si están desactivados"""
+    if os.getenv('ETHICA_CIRCUIT_BREAKER', '1').lower() in ('0', 'false', 'no'):
+        return None
+    key = (provider, model)
+    with _breakers_lock:
+        breaker = _breakers.get(key)
+        if breaker is None:
+            breaker = _breakers[key] = CircuitBreaker(
+                f"{provider} ({model})",
+                slow_call_seconds=float(os.getenv('ETHICA_BREAKER_SLOW_CALL', 15)),
+                open_seconds=float(os.getenv('ETHICA_BREAKER_OPEN_SECONDS', 30))
+            )
+        return breaker
+
+
+def breaker_stats() -> Dict[str, Dict[str, Any]]:
+    """Estado de todos los breakers creados"""
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    return {breaker.name: breaker.stats() for breaker in breakers}
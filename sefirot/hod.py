@@ -24,6 +24,7 @@ from dotenv import load_dotenv
 load_dotenv()
 import google.generativeai as genai
 from ..core.sefirotic_base import SefiraBase, SefiraPosition
+from .transport import wrap_client
 from loguru import logger
 
 
@@ -63,7 +64,7 @@ class Hod(SefiraBase):
             raise ValueError("GEMINI_API_KEY no encontrada en variables de entorno")
 
         genai.configure(api_key=api_key)
-        self.client = genai.GenerativeModel('gemini-2.0-flash-exp')
+        self.client = wrap_client(genai.GenerativeModel('gemini-2.0-flash-exp'), 'gemini')
 
         # Temperatura moderada-baja para precision y estructura
         self.temperature = 0.6
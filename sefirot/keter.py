@@ -12,10 +12,16 @@ En este sistema: Maximizar Tikún Olam
 
 from typing import Any, Dict, Optional, List
 from ..core.sefirotic_base import SefiraBase, SefiraPosition
+from .transport import wrap_client
+from .keywords import KEYWORDS
 from ..core.divine_name import DIVINE_VALUE
 from loguru import logger
+import json
 import os
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
 
 # Importar Gemini para evaluacion semantica
 try:
@@ -26,6 +32,24 @@ except ImportError:
     logger.warning("google-generativeai no disponible. Keter usara evaluacion heuristica.")
 
 
+# Hilos de las llamadas por criterio, compartidos por todas las instancias
+# de Keter: se crean al primer uso y viven lo que el proceso, asi crear
+# muchas Keter no deja pools sin cerrar
+_SCORING_POOL: Optional[ThreadPoolExecutor] = None
+_SCORING_POOL_LOCK = threading.Lock()
+
+
+def _scoring_pool() -> ThreadPoolExecutor:
+    global _SCORING_POOL
+    with _SCORING_POOL_LOCK:
+        if _SCORING_POOL is None:
+            _SCORING_POOL = ThreadPoolExecutor(
+                max_workers=int(os.getenv('ETHICA_KETER_SCORING_WORKERS', 16)),
+                thread_name_prefix='keter-scoring'
+            )
+        return _SCORING_POOL
+
+
 class Keter(SefiraBase):
     """
     Sefirá de la Corona - Objetivo Fundamental
@@ -44,19 +68,58 @@ class Keter(SefiraBase):
     operando dentro de las leyes de causa y efecto,
     promoviendo armonía, justicia, misericordia y verdad.
     """
+
+    # Criterios evaluados semánticamente por el LLM (nombre -> qué evaluar).
+    # Los usan tanto la llamada por criterio como la llamada por lotes.
+    LLM_CRITERIA = {
+        'promocion_armonia': 'PROMOCIÓN DE ARMONÍA: La acción REDUCE conflicto, violencia, división existente y promueve paz, cooperación, reconciliación (vs. CREAR nuevo conflicto innecesario)',
+        'justicia_misericordia': 'BALANCE DE JUSTICIA Y MISERICORDIA: Equidad, imparcialidad combinada con compasion, clemencia (vs. crueldad, venganza)',
+        'verdad': 'VERDAD vs. ENGANO: Transparencia, honestidad, autenticidad (vs. manipulacion, ocultamiento, falsedad)',
+        'multiperspectividad': 'MULTIPERSPECTIVIDAD: La accion y su contexto exploran diversos angulos, intereses e impactos en diferentes grupos (vs. narrativa unica que ignora o descalifica alternativas)'
+    }
+
+    # Esquema JSON de la respuesta por lotes: {criterio: {score, razon}}
+    BATCH_SCHEMA = {
+        'type': 'object',
+        'properties': {
+            criterion: {
+                'type': 'object',
+                'properties': {
+                    'score': {'type': 'integer'},
+                    'razon': {'type': 'string'}
+                },
+                'required': ['score', 'razon']
+            }
+            for criterion in LLM_CRITERIA
+        },
+        'required': list(LLM_CRITERIA)
+    }
     
-    def __init__(self, use_llm_scoring: bool = True, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        use_llm_scoring: bool = True,
+        api_key: Optional[str] = None,
+        batch_scoring: Optional[bool] = None
+    ):
         super().__init__(SefiraPosition.KETER)
         self.objective_violations = 0
         self.objective_confirmations = 0
         self.use_llm_scoring = use_llm_scoring and GEMINI_AVAILABLE
+        # Una sola llamada para todos los criterios LLM (ETHICA_KETER_BATCH_SCORING=0
+        # vuelve a una llamada por criterio)
+        if batch_scoring is None:
+            batch_scoring = os.getenv('ETHICA_KETER_BATCH_SCORING', '1').lower() not in ('0', 'false', 'no')
+        self.batch_scoring = batch_scoring
+        # Sin lotes, las llamadas por criterio van en paralelo con un plazo
+        # comun; la que no llegue a tiempo usa la heuristica de keywords
+        self.scoring_timeout = float(os.getenv('ETHICA_KETER_SCORING_TIMEOUT', 20))
 
         # Inicializar cliente Gemini para evaluacion semantica
         if self.use_llm_scoring:
             self.api_key = api_key or os.getenv("GEMINI_API_KEY")
             if self.api_key:
                 genai.configure(api_key=self.api_key)
-                self.gemini_client = genai.GenerativeModel('gemini-2.0-flash-exp')
+                self.gemini_client = wrap_client(genai.GenerativeModel('gemini-2.0-flash-exp'), 'gemini')
                 logger.info("Keter inicializada con evaluacion semantica LLM activada")
             else:
                 self.gemini_client = None
@@ -94,7 +157,41 @@ class Keter(SefiraBase):
             logger.warning(f"Keter: Acción NO alineada - {evaluation['reasoning'][:100]}")
         
         return evaluation
-    
+
+    def prefilter(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Evaluación solo con keywords, sin llamadas al LLM.
+
+        Mismos criterios, ponderación y Protocolo Rasha que `process`, pero
+        los criterios semánticos usan su heurística. Recorre acción y
+        contexto una sola vez, así que sirve de filtro previo barato en
+        cada petición, incluso con contextos muy largos.
+
+        No cuenta como confirmación ni violación del objetivo.
+        """
+        action = input_data.get('action', '')
+        context = input_data.get('context', '')
+        expected_outcome = input_data.get('expected_outcome', '')
+
+        # Criterios LLM sin valor: cada scorer usa su heurística
+        llm_scores = dict.fromkeys(self.LLM_CRITERIA)
+
+        scores = {
+            'reduces_suffering': self._score_suffering_reduction(action, expected_outcome),
+            'respects_free_will': self._score_free_will_respect(action, context),
+            'promotes_harmony': self._score_harmony_promotion(action, expected_outcome, llm_scores),
+            'justice_mercy_balance': self._score_justice_mercy(action, context, llm_scores),
+            'aligned_with_truth': self._score_truth_alignment(action, context, llm_scores)
+        }
+        alignment_percentage = self._calculate_weighted_score(scores)
+
+        return {
+            'aligned': alignment_percentage >= 0.6,
+            'alignment_score': alignment_percentage,
+            'detailed_scores': scores,
+            'rasha_protocol': self._apply_rasha_protocol(action, context, '', llm_scores)
+        }
+
     def _evaluate_alignment(
         self,
         action: str,
@@ -112,13 +209,21 @@ class Keter(SefiraBase):
         5. ¿Está alineada con verdad vs. engaño?
         """
 
+        # Modo por lotes: una sola llamada puntúa todos los criterios LLM.
+        # Los criterios que falten se evalúan con su propia llamada.
+        # Sin lotes, las llamadas por criterio se lanzan a la vez.
+        if self.batch_scoring:
+            llm_scores = self._llm_batch_scores(action, context, expected_outcome)
+        else:
+            llm_scores = self._llm_concurrent_scores(action, context, expected_outcome)
+
         # Sistema de puntuación (cada criterio: -10 a +10)
         scores = {
             'reduces_suffering': self._score_suffering_reduction(action, expected_outcome),
             'respects_free_will': self._score_free_will_respect(action, context),
-            'promotes_harmony': self._score_harmony_promotion(action, expected_outcome),
-            'justice_mercy_balance': self._score_justice_mercy(action, context),
-            'aligned_with_truth': self._score_truth_alignment(action, context)
+            'promotes_harmony': self._score_harmony_promotion(action, expected_outcome, llm_scores),
+            'justice_mercy_balance': self._score_justice_mercy(action, context, llm_scores),
+            'aligned_with_truth': self._score_truth_alignment(action, context, llm_scores)
         }
 
         # PONDERACIÓN JERÁRQUICA basada en momentum óptimo (Nov 24, 2024)
@@ -131,7 +236,7 @@ class Keter(SefiraBase):
 
         # CRÍTICO: ACTIVAR PROTOCOLO RASHA
         # Escanear el razonamiento de Keter para detectar sesgos geopolíticos
-        rasha_analysis = self._apply_rasha_protocol(action, context, reasoning)
+        rasha_analysis = self._apply_rasha_protocol(action, context, reasoning, llm_scores)
 
         modifications = []
         alternatives = []
@@ -151,7 +256,160 @@ class Keter(SefiraBase):
             'alternatives': alternatives  # Nuevo: alternativas generadas
         }
     
-    def _llm_semantic_score(self, criterion: str, description: str, action: str, context: str) -> int:
+    def _llm_batch_scores(
+        self,
+        action: str,
+        context: str,
+        expected_outcome: str
+    ) -> Optional[Dict[str, int]]:
+        """
+        Evalua todos los criterios de LLM_CRITERIA en una sola llamada a
+        Gemini con respuesta JSON segun BATCH_SCHEMA.
+
+        Returns:
+            {criterio: score de -10 a +10} con los criterios que se
+            pudieron parsear, o None si no hay LLM o la llamada fallo
+        """
+        if not self.use_llm_scoring or not self.gemini_client:
+            return None
+
+        criteria = '\n'.join(
+            f"- {criterion}: {description}" for criterion, description in self.LLM_CRITERIA.items()
+        )
+        prompt = f"""Analiza si esta accion esta alineada con cada uno de los criterios.
+
+ACCION: {action}
+CONTEXTO: {context}
+RESULTADO ESPERADO: {expected_outcome}
+
+CRITERIOS:
+{criteria}
+
+Para promocion_armonia evalua sobre todo el RESULTADO ESPERADO (el efecto causal de la accion).
+
+Evalua cada criterio en escala -10 a +10:
+-10: Completamente opuesto al criterio
+  0: Neutral o ambiguo
++10: Perfectamente alineado con el criterio
+
+Responde SOLO con JSON, una entrada por criterio con un numero entero y una
+breve justificacion (max 50 palabras):
+{{"promocion_armonia": {{"score": <numero>, "razon": "<justificacion>"}}, ...}}
+"""
+
+        try:
+            generation_config = genai.GenerationConfig(
+                temperature=0.3,  # Baja temperatura para consistencia
+                max_output_tokens=600,
+                response_mime_type='application/json',
+                response_schema=self.BATCH_SCHEMA
+            )
+
+            response = self.gemini_client.generate_content(
+                prompt,
+                generation_config=generation_config,
+                request_options=self._request_options()
+            )
+            result = json.loads(response.text)
+
+            scores = {}
+            for criterion in self.LLM_CRITERIA:
+                entry = result.get(criterion)
+                score = entry.get('score') if isinstance(entry, dict) else entry
+                try:
+                    scores[criterion] = max(-10, min(10, int(score)))
+                except (TypeError, ValueError):
+                    logger.warning(f"Score por lotes invalido para {criterion}: {entry!r}")
+            logger.debug(f"LLM scores por lotes: {scores}")
+            return scores
+
+        except Exception as e:
+            logger.warning(f"Gemini scoring por lotes fallo, se evalua por criterio: {e}")
+            return None
+
+    def _llm_concurrent_scores(
+        self,
+        action: str,
+        context: str,
+        expected_outcome: str
+    ) -> Optional[Dict[str, Optional[int]]]:
+        """
+        Lanza las llamadas por criterio en paralelo y espera como mucho
+        `scoring_timeout` segundos en total, asi Keter tarda lo que la
+        llamada mas lenta y no la suma de todas.
+
+        Returns:
+            {criterio: score} en el orden de LLM_CRITERIA; None en un
+            criterio que fallo o no llego a tiempo (se usa la heuristica).
+            None si no hay LLM.
+        """
+        if not self.use_llm_scoring or not self.gemini_client:
+            return None
+
+        # Plazo comun: cada llamada lleva como timeout lo que queda, asi un
+        # Gemini colgado libera su hilo del pool al vencer el plazo
+        deadline = time.monotonic() + self.scoring_timeout
+        pool = _scoring_pool()
+        futures = {}
+        for criterion, description in self.LLM_CRITERIA.items():
+            if criterion == 'multiperspectividad':
+                futures[criterion] = pool.submit(
+                    self._llm_score_multiperspectivity, action, context, deadline
+                )
+            else:
+                # La armonia se evalua sobre el outcome (efecto causal)
+                criterion_context = expected_outcome if criterion == 'promocion_armonia' else context
+                futures[criterion] = pool.submit(
+                    self._llm_semantic_score, criterion, description, action, criterion_context, deadline
+                )
+
+        done, _ = wait(futures.values(), timeout=max(deadline - time.monotonic(), 0))
+
+        scores = {}
+        for criterion, future in futures.items():
+            if future in done:
+                scores[criterion] = future.result()
+            else:
+                future.cancel()
+                logger.warning(
+                    f"Scoring LLM de {criterion} supero {self.scoring_timeout:g}s - usando heuristica"
+                )
+                scores[criterion] = None
+        return scores
+
+    def _criterion_score(
+        self,
+        criterion: str,
+        action: str,
+        context: str,
+        llm_scores: Optional[Dict[str, int]]
+    ) -> Optional[int]:
+        """
+        Score ya evaluado (lote o llamadas paralelas) si lo hay; si no,
+        llamada propia al LLM. None = usar la heuristica.
+        """
+        if llm_scores is not None and criterion in llm_scores:
+            return llm_scores[criterion]
+        return self._llm_semantic_score(
+            criterion=criterion,
+            description=self.LLM_CRITERIA[criterion],
+            action=action,
+            context=context
+        )
+
+    def _request_options(self, deadline: Optional[float] = None) -> Dict[str, float]:
+        """Timeout de una llamada de scoring: lo que queda hasta `deadline` (o `scoring_timeout`)"""
+        left = self.scoring_timeout if deadline is None else deadline - time.monotonic()
+        return {'timeout': max(left, 0.001)}
+
+    def _llm_semantic_score(
+        self,
+        criterion: str,
+        description: str,
+        action: str,
+        context: str,
+        deadline: Optional[float] = None
+    ) -> int:
         """
         Evalua un criterio usando analisis semantico con Gemini.
         Fallback a heuristica si no hay LLM disponible.
@@ -161,6 +419,7 @@ class Keter(SefiraBase):
             description: Descripcion de que evaluar
             action: Accion propuesta
             context: Contexto de la accion
+            deadline: Instante (time.monotonic) en que la llamada se abandona
 
         Returns:
             Score de -10 a +10
@@ -193,7 +452,8 @@ RAZON: [justificacion breve]
 
             response = self.gemini_client.generate_content(
                 prompt,
-                generation_config=generation_config
+                generation_config=generation_config,
+                request_options=self._request_options(deadline)
             )
             text = response.text
 
@@ -242,15 +502,11 @@ RAZON: [justificacion breve]
         Por ahora, análisis heurístico simple.
         TODO: Integrar con modelo de lenguaje para análisis más sofisticado.
         """
-        # Palabras clave positivas
-        positive_keywords = ['ayuda', 'cura', 'alivia', 'mejora', 'beneficia', 'florece', 'eleva']
-        # Palabras clave negativas
-        negative_keywords = ['daña', 'hiere', 'perjudica', 'destruye', 'sufre', 'dolor']
-        
-        text = (action + ' ' + expected_outcome).lower()
-        
-        positive_count = sum(1 for kw in positive_keywords if kw in text)
-        negative_count = sum(1 for kw in negative_keywords if kw in text)
+        # Palabras clave positivas y negativas
+        found = KEYWORDS.scan(action, expected_outcome)
+
+        positive_count = len(found['sufrimiento_positivo'])
+        negative_count = len(found['sufrimiento_negativo'])
         
         # Puntuación: +2 por cada palabra positiva, -3 por cada negativa
         score = (positive_count * 2) - (negative_count * 3)
@@ -262,21 +518,22 @@ RAZON: [justificacion breve]
         """
         Evalúa si la acción respeta el libre albedrío y dignidad.
         """
-        # Indicadores de violación de libre albedrío
-        coercion_keywords = ['forzar', 'obligar', 'coaccionar', 'manipular', 'engañar']
-        # Indicadores de respeto
-        respect_keywords = ['elegir', 'decidir', 'consenso', 'voluntario', 'autonomía']
-        
-        text = (action + ' ' + context).lower()
-        
-        coercion_count = sum(1 for kw in coercion_keywords if kw in text)
-        respect_count = sum(1 for kw in respect_keywords if kw in text)
+        # Indicadores de violación de libre albedrío y de respeto
+        found = KEYWORDS.scan(action, context)
+
+        coercion_count = len(found['coercion'])
+        respect_count = len(found['respeto'])
         
         score = (respect_count * 3) - (coercion_count * 4)
         
         return max(-10, min(10, score))
     
-    def _score_harmony_promotion(self, action: str, expected_outcome: str) -> int:
+    def _score_harmony_promotion(
+        self,
+        action: str,
+        expected_outcome: str,
+        llm_scores: Optional[Dict[str, int]] = None
+    ) -> int:
         """
         Evalúa si promueve armonía vs. discordia.
 
@@ -285,84 +542,70 @@ RAZON: [justificacion breve]
         no porque las promueva. El contexto causal es fundamental.
         """
         # Intentar scoring semántico con LLM primero
-        llm_score = self._llm_semantic_score(
-            criterion='promocion_armonia',
-            description='PROMOCIÓN DE ARMONÍA: La acción REDUCE conflicto, violencia, división existente y promueve paz, cooperación, reconciliación (vs. CREAR nuevo conflicto innecesario)',
-            action=action,
-            context=expected_outcome  # El outcome describe el efecto causal
-        )
+        # (el outcome describe el efecto causal)
+        llm_score = self._criterion_score('promocion_armonia', action, expected_outcome, llm_scores)
 
         if llm_score is not None:
             return llm_score
 
         # Fallback a heurística de keywords (SOLO si LLM falla)
-        harmony_keywords = ['paz', 'unión', 'colabora', 'armonía', 'coopera', 'reconcilia']
-        discord_keywords = ['conflicto', 'división', 'guerra', 'enfrentamiento', 'hostilidad']
+        found = KEYWORDS.scan(action, expected_outcome)
 
-        text = (action + ' ' + expected_outcome).lower()
-
-        harmony_count = sum(1 for kw in harmony_keywords if kw in text)
-        discord_count = sum(1 for kw in discord_keywords if kw in text)
+        harmony_count = len(found['armonia'])
+        discord_count = len(found['discordia'])
 
         score = (harmony_count * 2) - (discord_count * 3)
 
         return max(-10, min(10, score))
     
-    def _score_justice_mercy(self, action: str, context: str) -> int:
+    def _score_justice_mercy(
+        self,
+        action: str,
+        context: str,
+        llm_scores: Optional[Dict[str, int]] = None
+    ) -> int:
         """
         Evalua balance entre justicia y misericordia con analisis semantico.
         """
         # Intentar scoring con LLM
-        llm_score = self._llm_semantic_score(
-            criterion='justicia_misericordia',
-            description='BALANCE DE JUSTICIA Y MISERICORDIA: Equidad, imparcialidad combinada con compasion, clemencia (vs. crueldad, venganza)',
-            action=action,
-            context=context
-        )
+        llm_score = self._criterion_score('justicia_misericordia', action, context, llm_scores)
 
         if llm_score is not None:
             return llm_score
 
         # Fallback a heuristica de keywords
-        justice_keywords = ['justo', 'equitativo', 'fair', 'imparcial', 'correcto']
-        mercy_keywords = ['misericordia', 'compasion', 'perdon', 'clemencia', 'bondad']
-        cruelty_keywords = ['cruel', 'venganza', 'castigo excesivo', 'implacable']
+        found = KEYWORDS.scan(action, context)
 
-        text = (action + ' ' + context).lower()
-
-        justice_count = sum(1 for kw in justice_keywords if kw in text)
-        mercy_count = sum(1 for kw in mercy_keywords if kw in text)
-        cruelty_count = sum(1 for kw in cruelty_keywords if kw in text)
+        justice_count = len(found['justicia'])
+        mercy_count = len(found['misericordia'])
+        cruelty_count = len(found['crueldad'])
 
         # Ideal: balance de justicia Y misericordia
         score = (justice_count * 2) + (mercy_count * 2) - (cruelty_count * 5)
 
         return max(-10, min(10, score))
     
-    def _score_truth_alignment(self, action: str, context: str) -> int:
+    def _score_truth_alignment(
+        self,
+        action: str,
+        context: str,
+        llm_scores: Optional[Dict[str, int]] = None
+    ) -> int:
         """
         Evalua alineacion con verdad usando analisis semantico profundo.
         Ya no depende solo de keywords literales.
         """
         # Intentar scoring con LLM
-        llm_score = self._llm_semantic_score(
-            criterion='verdad',
-            description='VERDAD vs. ENGANO: Transparencia, honestidad, autenticidad (vs. manipulacion, ocultamiento, falsedad)',
-            action=action,
-            context=context
-        )
+        llm_score = self._criterion_score('verdad', action, context, llm_scores)
 
         if llm_score is not None:
             return llm_score
 
         # Fallback a heuristica de keywords
-        truth_keywords = ['verdad', 'honesto', 'transparente', 'autentico', 'sincero']
-        deception_keywords = ['mentira', 'engano', 'falso', 'ocultar', 'manipular']
+        found = KEYWORDS.scan(action, context)
 
-        text = (action + ' ' + context).lower()
-
-        truth_count = sum(1 for kw in truth_keywords if kw in text)
-        deception_count = sum(1 for kw in deception_keywords if kw in text)
+        truth_count = len(found['verdad'])
+        deception_count = len(found['engano'])
 
         score = (truth_count * 3) - (deception_count * 5)
 
@@ -485,7 +728,13 @@ RAZON: [justificacion breve]
 
         return reasoning
 
-    def _apply_rasha_protocol(self, action: str, context: str, reasoning: str) -> Dict[str, Any]:
+    def _apply_rasha_protocol(
+        self,
+        action: str,
+        context: str,
+        reasoning: str,
+        llm_scores: Optional[Dict[str, int]] = None
+    ) -> Dict[str, Any]:
         """
         PROTOCOLO RASHA - Detección de sesgos geopolíticos
 
@@ -511,18 +760,11 @@ RAZON: [justificacion breve]
         biases_detected = []
         bias_score = 0
 
-        full_text = f"{action} {context} {reasoning}".lower()
+        # Un solo recorrido del texto para todas las familias de indicadores
+        found = KEYWORDS.scan(action, context, reasoning)
 
         # 1. DETECTAR NARRATIVA OCCIDENTAL (pro-OTAN, pro-EEUU)
-        western_indicators = [
-            'democracia liberal', 'otan', 'occidente', 'mundo libre',
-            'agresion rusa', 'dictadura', 'autoritarismo',
-            'defender ucrania', 'expansion rusa', 'amenaza china',
-            'liberacion', 'intervencion humanitaria', 'responsabilidad de proteger',
-            'regimen de maduro', 'dictadura venezolana', 'narcotrafico'
-        ]
-
-        western_count = sum(1 for indicator in western_indicators if indicator in full_text)
+        western_count = len(found['narrativa_occidental'])
 
         if western_count >= 3:
             biases_detected.append({
@@ -534,15 +776,7 @@ RAZON: [justificacion breve]
             bias_score += 4
 
         # 2. DETECTAR NARRATIVA ORIENTAL (pro-multipolaridad, anti-OTAN)
-        eastern_indicators = [
-            'multipolaridad', 'unipolaridad', 'hegemonia estadounidense',
-            'imperialismo', 'expansion de la otan', 'golpe de estado',
-            'injerencia occidental', 'provocacion', 'guerra proxy',
-            'soberania', 'autodeterminacion', 'no alineados',
-            'bloqueo economico', 'sanciones ilegales', 'lawfare'
-        ]
-
-        eastern_count = sum(1 for indicator in eastern_indicators if indicator in full_text)
+        eastern_count = len(found['narrativa_oriental'])
 
         if eastern_count >= 3:
             biases_detected.append({
@@ -554,14 +788,7 @@ RAZON: [justificacion breve]
             bias_score += 4
 
         # 3. DETECTAR SESGO NORTE (países desarrollados como salvadores)
-        north_bias_indicators = [
-            'paises desarrollados deben', 'ayuda internacional',
-            'responsabilidad de occidente', 'intervencion necesaria',
-            'fracaso del sur global', 'estados fallidos',
-            'corrupcion endemica', 'incapacidad local'
-        ]
-
-        north_count = sum(1 for indicator in north_bias_indicators if indicator in full_text)
+        north_count = len(found['sesgo_norte'])
 
         if north_count >= 2:
             biases_detected.append({
@@ -572,8 +799,12 @@ RAZON: [justificacion breve]
             })
             bias_score += 3
 
-        # 4. DETECTAR AUSENCIA DE MÚLTIPLES PERSPECTIVAS (usando LLM semántico)
-        multiperspectivity_llm_score = self._llm_score_multiperspectivity(action, context)
+        # 4. DETECTAR AUSENCIA DE MÚLTIPLES PERSPECTIVAS (usando LLM semántico,
+        # ya evaluado en la llamada por lotes si la hubo)
+        if llm_scores is not None and 'multiperspectividad' in llm_scores:
+            multiperspectivity_llm_score = llm_scores['multiperspectividad']
+        else:
+            multiperspectivity_llm_score = self._llm_score_multiperspectivity(action, context)
 
         if multiperspectivity_llm_score is not None and multiperspectivity_llm_score < 0: # Umbral de 0 para considerarlo insuficiente
             biases_detected.append({
@@ -585,13 +816,7 @@ RAZON: [justificacion breve]
             bias_score += 5 # Este es un sesgo crítico
 
         # 5. DETECTAR FRAMEO MANIQUEO (buenos vs. malos absolutos)
-        manichean_indicators = [
-            'defender contra', 'detener a', 'amenaza de',
-            'regimen', 'dictadura', 'tirano',
-            'eje del mal', 'fuerzas oscuras'
-        ]
-
-        manichean_count = sum(1 for indicator in manichean_indicators if indicator in full_text)
+        manichean_count = len(found['frameo_maniqueo'])
 
         if manichean_count >= 3:
             biases_detected.append({
@@ -858,7 +1083,7 @@ IMPORTANTE: Las alternativas deben buscar beneficio mutuo y win-win, no win-lose
 
         return alternatives
 
-    def _llm_score_multiperspectivity(self, action: str, context: str) -> int:
+    def _llm_score_multiperspectivity(self, action: str, context: str, deadline: Optional[float] = None) -> int:
         """
         Evalúa semánticamente si el texto presenta múltiples perspectivas de forma equilibrada.
         """
@@ -898,7 +1123,8 @@ RAZON: [justificacion breve]
 
             response = self.gemini_client.generate_content(
                 prompt,
-                generation_config=generation_config
+                generation_config=generation_config,
+                request_options=self._request_options(deadline)
             )
             text = response.text
 
@@ -1109,13 +1335,7 @@ RAZON: [justificacion breve]
         if not true_intention:
             return False  # Sin info, no podemos detectar
 
-        instrumentalization_keywords = [
-            'ganar', 'obtener', 'conseguir', 'poder', 'control', 'dominio',
-            'votos', 'influencia', 'imagen', 'reputación', 'beneficio propio'
-        ]
-
-        text = true_intention.lower()
-        return any(kw in text for kw in instrumentalization_keywords)
+        return bool(KEYWORDS.scan(true_intention)['instrumentalizacion'])
 
     def _detect_ontological_bias(self, action: str, context: str) -> Optional[str]:
         """
@@ -1129,10 +1349,10 @@ RAZON: [justificacion breve]
             ('defender contra', 'Asume amenaza unilateral sin contexto histórico'),
         ]
 
-        text = (action + ' ' + context).lower()
+        found = KEYWORDS.scan(action, context)['sesgo_ontologico']
 
         for pattern, description in bias_patterns:
-            if pattern in text:
+            if pattern in found:
                 return description
 
         return None
@@ -1149,9 +1369,7 @@ RAZON: [justificacion breve]
             return "Contexto muy breve - probablemente omite información crítica"
 
         # Buscar menciones de "múltiples perspectivas"
-        perspective_keywords = ['perspectiva', 'punto de vista', 'todos los afectados', 'múltiples']
-
-        if not any(kw in context.lower() for kw in perspective_keywords):
+        if not KEYWORDS.scan(context)['perspectivas']:
             return "No se mencionan múltiples perspectivas explícitamente"
 
         return None
@@ -1163,25 +1381,14 @@ RAZON: [justificacion breve]
         Ahavah = Amor incondicional hacia TODOS los afectados (no solo "mi grupo").
         """
         # Indicadores de beneficencia limitada
-        partial_benefit_keywords = [
-            'nuestro grupo', 'nuestra gente', 'nuestros intereses',
-            'a expensas de', 'contra', 'derrotar'
-        ]
-
-        text = (action + ' ' + expected_outcome).lower()
+        found = KEYWORDS.scan(action, expected_outcome)
 
         # Si hay beneficencia parcial, falta Ahavah universal
-        if any(kw in text for kw in partial_benefit_keywords):
+        if found['beneficio_parcial']:
             return True
 
-        # Buscar indicadores de beneficencia universal
-        universal_benefit_keywords = [
-            'todos', 'todas las partes', 'beneficio mutuo', 'bien común',
-            'humanidad', 'colectivo'
-        ]
-
         # Si NO hay indicadores de beneficencia universal, probablemente falta Ahavah
-        has_universal = any(kw in text for kw in universal_benefit_keywords)
+        has_universal = bool(found['beneficio_universal'])
 
         return not has_universal
 
@@ -1196,12 +1403,7 @@ RAZON: [justificacion breve]
             return True
 
         # Buscar indicadores de contexto histórico completo
-        historical_keywords = [
-            'historia', 'antecedentes', 'contexto histórico', 'desde',
-            'precedentes', 'raíces'
-        ]
-
-        has_historical = any(kw in context.lower() for kw in historical_keywords)
+        has_historical = bool(KEYWORDS.scan(context)['historico'])
 
         # Si no hay contexto histórico, probablemente falta Emet
         return not has_historical
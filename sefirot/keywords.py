@@ -0,0 +1,162 @@
+"""
+Índice de keywords de las heurísticas de Keter
+
+Todas las familias de indicadores (criterios de Tikún Olam, Protocolo
+Rasha, Teorema de Keter) se compilan una sola vez al importar en un
+único autómata Aho-Corasick. Un texto se recorre una vez y devuelve, por
+familia, las keywords encontradas, así que el coste ya no crece con el
+número de familias consultadas.
+
+El autómata es el de `pyahocorasick` (opcional, `pip install
+pyahocorasick`). Sin él se usa `in` sobre el texto en minúsculas para
+cada keyword: en CPython sigue siendo más rápido que un autómata en
+Python puro. Ambos motores dan el mismo resultado: keywords distintas
+que aparecen como subcadena, igual que las heurísticas originales.
+
+Los campos (acción, contexto, resultado esperado...) se recorren por
+separado y el resultado de los últimos se guarda en memoria, de modo que
+los criterios que leen el mismo campo no lo vuelven a recorrer.
+"""
+
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, Mapping, Tuple
+
+from loguru import logger
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+    logger.info("pyahocorasick no disponible. Keter buscara keywords con 'in'.")
+
+
+# Familia -> keywords (en minúsculas; coinciden como subcadena)
+KEYWORD_FAMILIES: Dict[str, Tuple[str, ...]] = {
+    # Criterios de Tikún Olam
+    'sufrimiento_positivo': ('ayuda', 'cura', 'alivia', 'mejora', 'beneficia', 'florece', 'eleva'),
+    'sufrimiento_negativo': ('daña', 'hiere', 'perjudica', 'destruye', 'sufre', 'dolor'),
+    'coercion': ('forzar', 'obligar', 'coaccionar', 'manipular', 'engañar'),
+    'respeto': ('elegir', 'decidir', 'consenso', 'voluntario', 'autonomía'),
+    'armonia': ('paz', 'unión', 'colabora', 'armonía', 'coopera', 'reconcilia'),
+    'discordia': ('conflicto', 'división', 'guerra', 'enfrentamiento', 'hostilidad'),
+    'justicia': ('justo', 'equitativo', 'fair', 'imparcial', 'correcto'),
+    'misericordia': ('misericordia', 'compasion', 'perdon', 'clemencia', 'bondad'),
+    'crueldad': ('cruel', 'venganza', 'castigo excesivo', 'implacable'),
+    'verdad': ('verdad', 'honesto', 'transparente', 'autentico', 'sincero'),
+    'engano': ('mentira', 'engano', 'falso', 'ocultar', 'manipular'),
+
+    # Protocolo Rasha
+    'narrativa_occidental': (
+        'democracia liberal', 'otan', 'occidente', 'mundo libre',
+        'agresion rusa', 'dictadura', 'autoritarismo',
+        'defender ucrania', 'expansion rusa', 'amenaza china',
+        'liberacion', 'intervencion humanitaria', 'responsabilidad de proteger',
+        'regimen de maduro', 'dictadura venezolana', 'narcotrafico'
+    ),
+    'narrativa_oriental': (
+        'multipolaridad', 'unipolaridad', 'hegemonia estadounidense',
+        'imperialismo', 'expansion de la otan', 'golpe de estado',
+        'injerencia occidental', 'provocacion', 'guerra proxy',
+        'soberania', 'autodeterminacion', 'no alineados',
+        'bloqueo economico', 'sanciones ilegales', 'lawfare'
+    ),
+    'sesgo_norte': (
+        'paises desarrollados deben', 'ayuda internacional',
+        'responsabilidad de occidente', 'intervencion necesaria',
+        'fracaso del sur global', 'estados fallidos',
+        'corrupcion endemica', 'incapacidad local'
+    ),
+    'frameo_maniqueo': (
+        'defender contra', 'detener a', 'amenaza de',
+        'regimen', 'dictadura', 'tirano',
+        'eje del mal', 'fuerzas oscuras'
+    ),
+
+    # Teorema de Keter (Lishmá Emet)
+    'instrumentalizacion': (
+        'ganar', 'obtener', 'conseguir', 'poder', 'control', 'dominio',
+        'votos', 'influencia', 'imagen', 'reputación', 'beneficio propio'
+    ),
+    'sesgo_ontologico': ('resolver el problema de', 'detener a', 'defender contra'),
+    'perspectivas': ('perspectiva', 'punto de vista', 'todos los afectados', 'múltiples'),
+    'beneficio_parcial': (
+        'nuestro grupo', 'nuestra gente', 'nuestros intereses',
+        'a expensas de', 'contra', 'derrotar'
+    ),
+    'beneficio_universal': (
+        'todos', 'todas las partes', 'beneficio mutuo', 'bien común',
+        'humanidad', 'colectivo'
+    ),
+    'historico': (
+        'historia', 'antecedentes', 'contexto histórico', 'desde',
+        'precedentes', 'raíces'
+    ),
+}
+
+
+class KeywordIndex:
+    """
+    Autómata de todas las familias de keywords
+
+    `scan(*parts)` devuelve {familia: keywords encontradas} en el texto
+    `' '.join(parts)`, para todas las familias (conjunto vacío si ninguna
+    aparece). La búsqueda no distingue mayúsculas.
+
+    Cada parte se recorre y se guarda por separado; de las uniones solo
+    se recorren los caracteres alrededor del espacio, donde una keyword
+    puede quedar a caballo entre dos partes. Así el contexto se recorre
+    una vez aunque varios criterios lo combinen con la acción, el
+    resultado esperado o el razonamiento.
+    """
+
+    def __init__(self, families: Mapping[str, Iterable[str]], cache_size: int = 64):
+        self.families: Dict[str, Tuple[str, ...]] = {
+            family: tuple(keyword.lower() for keyword in keywords)
+            for family, keywords in families.items()
+        }
+        # Una keyword puede pertenecer a varias familias ('dictadura')
+        self._owners: Dict[str, Tuple[str, ...]] = {}
+        for family, keywords in self.families.items():
+            for keyword in keywords:
+                self._owners[keyword] = self._owners.get(keyword, ()) + (family,)
+        self._seam = max((len(keyword) for keyword in self._owners), default=1) - 1
+
+        self._automaton = self._build(self._owners) if AHOCORASICK_AVAILABLE else None
+        self._cached_find = lru_cache(maxsize=cache_size)(self._find)
+
+    @staticmethod
+    def _build(keywords: Iterable[str]):
+        automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        return automaton
+
+    def _find(self, text: str) -> FrozenSet[str]:
+        """Keywords distintas presentes en `text`"""
+        text = text.lower()
+        if self._automaton is not None:
+            return frozenset(keyword for _, keyword in self._automaton.iter(text))
+        return frozenset(keyword for keyword in self._owners if keyword in text)
+
+    def scan(self, *parts: str) -> Dict[str, FrozenSet[str]]:
+        found = set()
+        tail = None  # Final de las partes ya recorridas, unidas con ' '
+        for part in parts:
+            found |= self._cached_find(part)
+            if tail is None:
+                tail = part[-self._seam:] if self._seam else ''
+            elif self._seam:
+                found |= self._find(tail + ' ' + part[:self._seam])
+                tail = (tail + ' ' + part)[-self._seam:]
+
+        matches: Dict[str, set] = {family: set() for family in self.families}
+        for keyword in found:
+            for family in self._owners[keyword]:
+                matches[family].add(keyword)
+        return {family: frozenset(keywords) for family, keywords in matches.items()}
+
+
+# Índice compartido, construido una vez al importar
+KEYWORDS = KeywordIndex(KEYWORD_FAMILIES)
@@ -3,6 +3,7 @@ from typing import Any, Dict, Optional, List
 import os
 import google.generativeai as genai
 from ..core.sefirotic_base import SefiraBase, SefiraPosition
+from .transport import wrap_client
 from loguru import logger
 from datetime import datetime
 
@@ -16,7 +17,7 @@ class Malchut(SefiraBase):
             self.client = None
         else:
             genai.configure(api_key=self.api_key)
-            self.client = genai.GenerativeModel("gemini-2.0-flash-exp")
+            self.client = wrap_client(genai.GenerativeModel("gemini-2.0-flash-exp"), 'gemini')
             logger.info("Malchut initialized")
         
         self.temperature = 0.5
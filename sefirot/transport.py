@@ -0,0 +1,227 @@
+"""
+Transporte de llamadas LLM para las Sefirot
+
+Envuelve los clientes de los SDK (Gemini, OpenAI/DeepSeek, Anthropic,
+Mistral) para poder grabar y reproducir sus respuestas sin red.
+
+El modo se elige con las mismas variables que ethica-framework:
+    ETHICA_TRANSPORT=live|record|replay
+    ETHICA_CASSETTE_PATH=ruta/al/cassette.jsonl
+    ETHICA_REPLAY_LATENCY=segundos | recorded
+    ETHICA_REPLAY_JITTER=fraccion (p.ej. 0.2 = +/-20%)
+
+Los cassettes usan el mismo formato JSON Lines y las mismas claves
+(sha256 de provider, model, prompt, options) que `providers.transport`.
+"""
+
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, Optional
+
+from loguru import logger
+
+
+# Endpoints que generan texto, por ruta de atributos del cliente
+_GENERATE = ('generate_content',)
+_OPENAI_CHAT = ('chat', 'completions', 'create')
+_MISTRAL_CHAT = ('chat', 'complete')
+_ANTHROPIC_MESSAGES = ('messages', 'create')
+
+
+class CassetteMiss(KeyError):
+    """La peticion no esta grabada en el cassette"""
+
+
+def request_key(provider: str, model: str, prompt: str, options: Dict[str, Any]) -> str:
+    """Clave estable de una peticion (compatible con providers.cache_key)"""
+    payload = json.dumps(
+        {'provider': provider, 'model': model, 'prompt': prompt, 'options': options},
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class Cassette:
+    """Respuestas grabadas, una linea JSON por peticion"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        self._entries[entry['key']] = entry
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        return self._entries.get(key)
+
+    def record(self, entry: Dict[str, Any]):
+        with self._lock:
+            self._entries[entry['key']] = entry
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+
+
+class Transport:
+    """
+    Graba o reproduce llamadas segun `mode` ('record' o 'replay')
+
+    En replay cada llamada espera `latency` segundos (None = latencia
+    grabada), variada aleatoriamente en +/- `jitter`.
+    """
+
+    def __init__(
+        self,
+        mode: str,
+        cassette: Cassette,
+        latency: Optional[float] = 0.0,
+        jitter: float = 0.0
+    ):
+        self.mode = mode
+        self.cassette = cassette
+        self.latency = latency
+        self.jitter = jitter
+        self._random = random.Random()
+
+    def call(self, provider: str, model: str, prompt: str, options: Dict[str, Any], live) -> str:
+        key = request_key(provider, model, prompt, options)
+
+        if self.mode == 'replay':
+            entry = self.cassette.get(key)
+            if entry is None:
+                raise CassetteMiss(f"Sin respuesta grabada de {provider}/{model} para {key[:12]}")
+            delay = entry.get('latency', 0.0) if self.latency is None else self.latency
+            if self.jitter:
+                delay *= self._random.uniform(1 - self.jitter, 1 + self.jitter)
+            if delay > 0:
+                time.sleep(delay)
+            return entry['response']
+
+        start = time.perf_counter()
+        text = live()
+        self.cassette.record({
+            'key': key,
+            'provider': provider,
+            'model': model,
+            'prompt': prompt,
+            'options': options,
+            'response': text,
+            'latency': round(time.perf_counter() - start, 4)
+        })
+        return text
+
+
+_transport: Optional[Transport] = None
+_transport_lock = threading.Lock()
+
+
+def get_transport() -> Optional[Transport]:
+    """Transporte configurado por entorno (None = llamadas en vivo)"""
+    global _transport
+    mode = os.getenv('ETHICA_TRANSPORT', 'live').lower()
+    if mode not in ('record', 'replay'):
+        return None
+
+    with _transport_lock:
+        if _transport is None:
+            path = os.getenv('ETHICA_CASSETTE_PATH')
+            if not path:
+                raise ValueError(f"ETHICA_TRANSPORT={mode} requiere ETHICA_CASSETTE_PATH")
+            latency = os.getenv('ETHICA_REPLAY_LATENCY', '0')
+            _transport = Transport(
+                mode,
+                Cassette(path),
+                latency=None if latency == 'recorded' else float(latency),
+                jitter=float(os.getenv('ETHICA_REPLAY_JITTER', 0))
+            )
+            logger.info(f"Transporte LLM en modo {mode} ({path})")
+        return _transport
+
+
+# Limites de la llamada, no de la respuesta: no forman parte de la clave
+_CALL_LIMITS = ('request_options', 'timeout')
+
+
+def _options(kwargs: Dict[str, Any], *exclude: str) -> Dict[str, Any]:
+    """Opciones de generacion de una llamada (sin prompt ni limites de tiempo)"""
+    return {k: v for k, v in kwargs.items() if k not in exclude and k not in _CALL_LIMITS}
+
+
+class _ClientProxy:
+    """Proxy de un cliente SDK que intercepta los endpoints de generacion"""
+
+    ENDPOINTS = (_GENERATE, _OPENAI_CHAT, _MISTRAL_CHAT, _ANTHROPIC_MESSAGES)
+
+    def __init__(self, target, provider, transport, model, context, path=()):
+        self._target = target
+        self._provider = provider
+        self._transport = transport
+        self._model = model
+        self._context = context
+        self._path = path
+
+    def __getattr__(self, name: str):
+        path = self._path + (name,)
+        attribute = getattr(self._target, name)
+        if any(endpoint[:len(path)] == path for endpoint in self.ENDPOINTS):
+            return _ClientProxy(
+                attribute, self._provider, self._transport, self._model, self._context, path
+            )
+        return attribute
+
+    def __call__(self, *args, **kwargs):
+        if self._path == _GENERATE:
+            prompt = args[0] if args else kwargs.get('contents')
+            prompt = prompt if isinstance(prompt, str) else json.dumps(prompt, default=str)
+            options = {**self._context, **_options(kwargs, 'contents')}
+            text = self._transport.call(
+                self._provider, self._model, prompt, options,
+                lambda: self._target(*args, **kwargs).text
+            )
+            return SimpleNamespace(text=text)
+
+        model = kwargs.get('model', self._model)
+        prompt = json.dumps(kwargs.get('messages', []), ensure_ascii=False, default=str)
+        options = {**self._context, **_options(kwargs, 'messages', 'model')}
+
+        if self._path == _ANTHROPIC_MESSAGES:
+            text = self._transport.call(
+                self._provider, model, prompt, options,
+                lambda: self._target(*args, **kwargs).content[0].text
+            )
+            return SimpleNamespace(content=[SimpleNamespace(text=text)])
+
+        text = self._transport.call(
+            self._provider, model, prompt, options,
+            lambda: self._target(*args, **kwargs).choices[0].message.content
+        )
+        message = SimpleNamespace(content=text)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+def wrap_client(client: Any, provider: str, **context: Any) -> Any:
+    """
+    Devuelve `client` envuelto si hay transporte configurado.
+
+    Args:
+        client: Cliente del SDK (GenerativeModel, OpenAI, Anthropic, Mistral)
+        provider: Nombre del proveedor para las claves del cassette
+        **context: Configuracion fija del cliente que cambia la respuesta
+            (p.ej. system_instruction); forma parte de la clave
+    """
+    transport = get_transport()
+    if transport is None or client is None:
+        return client
+    return _ClientProxy(
+        client, provider, transport, getattr(client, 'model_name', ''), context
+    )
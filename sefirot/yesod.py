@@ -20,6 +20,7 @@ from typing import Any, Dict, Optional, List
 import os
 import google.generativeai as genai
 from ..core.sefirotic_base import SefiraBase, SefiraPosition
+from .transport import wrap_client
 from loguru import logger
 
 
@@ -61,7 +62,7 @@ class Yesod(SefiraBase):
             self.client = None
         else:
             genai.configure(api_key=self.api_key)
-            self.client = genai.GenerativeModel('gemini-2.0-flash-exp')
+            self.client = wrap_client(genai.GenerativeModel('gemini-2.0-flash-exp'), 'gemini')
             logger.info("Yesod initialized with Gemini API client")
 
         # Configuracion del modelo
@@ -1,9 +1,15 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import StreamingResponse, Response
+from pydantic import BaseModel, HttpUrl
 from typing import List, Optional
+from contextlib import asynccontextmanager
+from dataclasses import asdict, is_dataclass
+import asyncio
+import json
 import sys
 import os
+import time
 from pathlib import Path
 
 # Add parent directory to path to import ethica framework
@@ -13,15 +19,93 @@ sys.path.insert(0, str(parent_dir / "ethica-framework" / "src"))
 
 try:
     from core.framework import EthicaFramework
+    from core.metrics import FrameworkMetrics, CONTENT_TYPE as METRICS_CONTENT_TYPE
+    from core.jobs import JobWorker, check_webhook_url, queue_from_env
+    from core.results import SQLiteResultStore
+    from core.checkpoints import SQLiteCheckpointStore, checkpoint_ttl
     FRAMEWORK_AVAILABLE = True
 except ImportError:
     FRAMEWORK_AVAILABLE = False
     print("Warning: Ethica Framework not available. Using mock responses.")
 
+# Process-wide metrics: analysis instrumentation from the framework plus
+# HTTP request counters, scraped via /metrics
+if FRAMEWORK_AVAILABLE:
+    METRICS = FrameworkMetrics()
+    HTTP_REQUESTS = METRICS.registry.counter(
+        "ethica_http_requests_total", "HTTP requests by route and status",
+        ("method", "route", "status")
+    )
+    HTTP_IN_FLIGHT = METRICS.registry.gauge(
+        "ethica_http_requests_in_flight", "HTTP requests currently being served"
+    )
+    HTTP_DURATION = METRICS.registry.histogram(
+        "ethica_http_request_duration_seconds", "HTTP response time (until headers are sent)",
+        ("method", "route")
+    )
+else:
+    METRICS = None
+
+def create_framework() -> Optional["EthicaFramework"]:
+    """
+    Build the shared framework instance from environment API keys
+
+    Returns None if any key is missing; requests then report the
+    configuration error instead of failing at startup.
+    """
+    gemini_key = os.getenv("GEMINI_API_KEY")
+    mistral_key = os.getenv("MISTRAL_API_KEY")
+    deepseek_key = os.getenv("DEEPSEEK_API_KEY")
+
+    if not all([gemini_key, mistral_key, deepseek_key]):
+        return None
+
+    return EthicaFramework(
+        gemini_api_key=gemini_key,
+        mistral_api_key=mistral_key,
+        deepseek_api_key=deepseek_key,
+        impact_threshold=0.60,
+        metrics=METRICS,
+        result_store=SQLiteResultStore(RESULTS_PATH),
+        checkpoints=SQLiteCheckpointStore(CHECKPOINT_PATH) if CHECKPOINT_PATH else None
+    )
+
+async def purge_checkpoints(checkpoints: "SQLiteCheckpointStore"):
+    """Drop checkpoints older than ETHICA_CHECKPOINT_TTL, at startup and hourly"""
+    while True:
+        await asyncio.to_thread(checkpoints.purge, checkpoint_ttl())
+        await asyncio.sleep(CHECKPOINT_PURGE_INTERVAL)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Create the framework (modules, provider clients, HTTP sessions) once
+    per worker and share it across requests
+    """
+    app.state.ethica = create_framework() if FRAMEWORK_AVAILABLE else None
+    app.state.jobs = None
+    purge = None
+    if app.state.ethica is not None and app.state.ethica.checkpoints is not None:
+        purge = asyncio.create_task(purge_checkpoints(app.state.ethica.checkpoints))
+    if app.state.ethica is not None:
+        # Set ETHICA_JOB_WORKERS=0 when separate `python -m core.jobs`
+        # processes serve the queue
+        app.state.jobs = JobWorker(app.state.ethica, queue_from_env(), workers=JOB_WORKERS)
+        if JOB_WORKERS > 0:
+            app.state.jobs.start()
+    yield
+    if purge is not None:
+        purge.cancel()
+    if app.state.jobs is not None:
+        await asyncio.to_thread(app.state.jobs.stop)
+    if app.state.ethica is not None:
+        await app.state.ethica.aclose()
+
 app = FastAPI(
     title="Ethica.AI API",
     description="Enterprise-Grade Ethical AI Decision System API",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS middleware
@@ -33,12 +117,59 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.middleware("http")
+async def record_http_metrics(request: Request, call_next):
+    """Count requests per route template (not raw path, to bound label cardinality)"""
+    if METRICS is None:
+        return await call_next(request)
+
+    HTTP_IN_FLIGHT.inc()
+    start = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        HTTP_IN_FLIGHT.dec()
+        route = request.scope.get("route")
+        path = getattr(route, "path", "unmatched")
+        HTTP_REQUESTS.inc(method=request.method, route=path, status=str(status))
+        HTTP_DURATION.observe(time.perf_counter() - start, method=request.method, route=path)
+
 class AnalysisRequest(BaseModel):
     action: str
     context: str
     stakeholders: Optional[List[str]] = []
     name: Optional[str] = "Unnamed Scenario"
 
+class BatchAnalysisRequest(BaseModel):
+    scenarios: List[AnalysisRequest]
+    max_concurrency: Optional[int] = 8
+
+# Upper bound on concurrent analyses per batch request
+MAX_BATCH_CONCURRENCY = int(os.getenv("ETHICA_MAX_BATCH_CONCURRENCY", "32"))
+
+class JobRequest(AnalysisRequest):
+    webhook_url: Optional[HttpUrl] = None  # http(s) only
+
+# In-process job workers, and the queue depth beyond which /api/jobs answers 429
+JOB_WORKERS = int(os.getenv("ETHICA_JOB_WORKERS", "2"))
+MAX_QUEUED_JOBS = int(os.getenv("ETHICA_MAX_QUEUED_JOBS", "50"))
+
+# Every completed analysis is stored here and served by /api/results
+RESULTS_PATH = os.getenv("ETHICA_RESULTS_PATH", "ethica_results.sqlite3")
+MAX_RESULTS_PAGE = 200
+
+# Stage outputs of unfinished analyses (off unless set): `?resume=` and
+# queue jobs reclaimed from a dead worker continue from here (shared with
+# `python -m core.jobs` workers). Older than ETHICA_CHECKPOINT_TTL, purged.
+CHECKPOINT_PATH = os.getenv("ETHICA_CHECKPOINT_PATH")
+CHECKPOINT_PURGE_INTERVAL = 3600
+
+# How often a running analysis checks whether its client is still there
+DISCONNECT_POLL_INTERVAL = 0.5
+
 class AnalysisResponse(BaseModel):
     scenario_id: str
     timestamp: str
@@ -47,6 +178,10 @@ class AnalysisResponse(BaseModel):
     tactical: dict
     execution: dict
     decision: dict
+    incomplete: bool = False
+    pending_stages: List[str] = []
+    reused_stages: List[str] = []
+    screening: Optional[dict] = None
 
 @app.get("/")
 async def root():
@@ -64,35 +199,70 @@ async def health_check():
         "framework": "available" if FRAMEWORK_AVAILABLE else "mock_mode"
     }
 
+@app.get("/metrics")
+async def metrics():
+    """
+    Prometheus metrics: request rate, in-flight analyses, per-module and
+    per-provider latency histograms, provider errors and retries
+    """
+    if METRICS is None:
+        raise HTTPException(status_code=503, detail="Metrics unavailable in mock mode")
+    return Response(METRICS.render(), media_type=METRICS_CONTENT_TYPE)
+
+def get_framework(http_request: Request) -> "EthicaFramework":
+    """Shared framework created by `lifespan`"""
+    ethica = http_request.app.state.ethica
+    if ethica is None:
+        raise HTTPException(
+            status_code=500,
+            detail="API keys not configured. Please set GEMINI_API_KEY, MISTRAL_API_KEY, and DEEPSEEK_API_KEY environment variables."
+        )
+    return ethica
+
+async def cancel_on_disconnect(http_request: Request, coroutine):
+    """
+    Await `coroutine`, cancelling it as soon as the client disconnects
+
+    A cancelled analysis stops its provider calls instead of finishing
+    for nobody. Raises HTTPException 499 (client closed request).
+    """
+    task = asyncio.ensure_future(coroutine)
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=DISCONNECT_POLL_INTERVAL)
+            if done:
+                return task.result()
+            if await http_request.is_disconnected():
+                raise HTTPException(status_code=499, detail="Client closed request")
+    finally:
+        task.cancel()
+
 @app.post("/api/analyze", response_model=AnalysisResponse)
-async def analyze_scenario(request: AnalysisRequest):
+async def analyze_scenario(
+    request: AnalysisRequest,
+    http_request: Request,
+    deadline: Optional[float] = Query(None, gt=0),
+    resume: Optional[str] = Query(None)
+):
     """
     Analyze an AI scenario through the Ethica Framework
+
+    `deadline` (seconds) bounds the analysis; when it runs out the
+    response has `incomplete: true` and lists the `pending_stages`.
+    With ETHICA_CHECKPOINT_PATH set, `resume=<scenario_id>` (same body)
+    continues such an analysis and only runs the pending stages.
+    With ETHICA_INCREMENTAL=1, stages whose inputs are unchanged since an
+    earlier run (e.g. after editing only the stakeholders) are reused and
+    listed in `reused_stages`.
+    The analysis is cancelled if the client disconnects.
     """
     if not FRAMEWORK_AVAILABLE:
         # Return mock response if framework not available
         return create_mock_response(request)
 
-    try:
-        # Load API keys from environment
-        gemini_key = os.getenv("GEMINI_API_KEY")
-        mistral_key = os.getenv("MISTRAL_API_KEY")
-        deepseek_key = os.getenv("DEEPSEEK_API_KEY")
-
-        if not all([gemini_key, mistral_key, deepseek_key]):
-            raise HTTPException(
-                status_code=500,
-                detail="API keys not configured. Please set GEMINI_API_KEY, MISTRAL_API_KEY, and DEEPSEEK_API_KEY environment variables."
-            )
-
-        # Initialize framework
-        ethica = EthicaFramework(
-            gemini_api_key=gemini_key,
-            mistral_api_key=mistral_key,
-            deepseek_api_key=deepseek_key,
-            impact_threshold=0.60
-        )
+    ethica = get_framework(http_request)
 
+    try:
         # Prepare scenario
         scenario = {
             "action": request.action,
@@ -100,43 +270,306 @@ async def analyze_scenario(request: AnalysisRequest):
             "stakeholders": request.stakeholders
         }
 
-        # Run analysis
-        result = ethica.analyze(scenario)
-
-        # Convert result to response format
-        response = {
-            "scenario_id": result.scenario_id,
-            "timestamp": result.timestamp,
-            "strategic": {
-                "impact_score": result.strategic.impact_score,
-                "confidence": result.strategic.confidence,
-                "integration_score": result.strategic.integration_score
-            },
-            "operational": {
-                "harmony_score": result.operational.harmony_score if hasattr(result, 'operational') else 0.0
-            },
-            "tactical": {
-                "sustainability": result.tactical.sustainability if hasattr(result, 'tactical') else 0.0
-            },
-            "execution": {
-                "readiness": result.execution.readiness,
-                "approved": result.execution.approved
-            },
-            "decision": {
-                "approved": result.decision.approved,
-                "approval_type": result.decision.approval_type,
-                "confidence": result.decision.confidence,
-                "reasoning": result.decision.reasoning,
-                "actions": result.decision.actions,
-                "conditions": result.decision.conditions
-            }
-        }
+        # Run analysis (async path - does not block the event loop)
+        result = await cancel_on_disconnect(
+            http_request, ethica.analyze_async(scenario, deadline=deadline, resume=resume)
+        )
 
-        return response
+        return build_response(result)
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
+@app.post("/api/analyze/stream")
+async def analyze_scenario_stream(
+    request: AnalysisRequest,
+    http_request: Request,
+    deadline: Optional[float] = Query(None, gt=0),
+    resume: Optional[str] = Query(None)
+):
+    """
+    Analyze a scenario and stream progress as Server-Sent Events
+
+    `deadline` and `resume` work as in /api/analyze; closing the stream
+    cancels the analysis.
+
+    Events:
+        stage_started      {"stage", "step", "total_steps"}
+        stage_completed    {"stage", "step", "total_steps", "result": <module output>}
+        analysis_completed same payload as /api/analyze
+        error              {"detail"}
+    """
+    if not FRAMEWORK_AVAILABLE:
+        mock = create_mock_response(request)
+
+        async def mock_stream():
+            yield format_sse("analysis_completed", mock)
+
+        return StreamingResponse(mock_stream(), media_type="text/event-stream")
+
+    ethica = get_framework(http_request)
+    scenario = {
+        "action": request.action,
+        "context": request.context,
+        "stakeholders": request.stakeholders
+    }
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def run():
+        try:
+            await ethica.analyze_async(
+                scenario, on_event=queue.put_nowait, deadline=deadline, resume=resume
+            )
+        except Exception as e:
+            queue.put_nowait(e)
+        finally:
+            queue.put_nowait(None)
+
+    async def event_stream():
+        task = asyncio.ensure_future(run())
+        try:
+            while True:
+                event = await queue.get()
+                if event is None:
+                    break
+                if isinstance(event, Exception):
+                    yield format_sse("error", {"detail": f"Analysis failed: {str(event)}"})
+                elif event.type == "analysis_completed":
+                    yield format_sse(event.type, build_response(event.result))
+                else:
+                    payload = {
+                        "stage": event.stage,
+                        "step": event.step,
+                        "total_steps": event.total_steps
+                    }
+                    if event.result is not None:
+                        payload["result"] = asdict(event.result) if is_dataclass(event.result) else event.result
+                    yield format_sse(event.type, payload)
+        finally:
+            task.cancel()
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@app.post("/api/analyze/batch")
+async def analyze_batch(
+    request: BatchAnalysisRequest,
+    http_request: Request,
+    deadline: Optional[float] = Query(None, gt=0)
+):
+    """
+    Analyze many scenarios concurrently and stream results as Server-Sent Events
+
+    Results arrive in completion order; `index` refers to the position in
+    the submitted `scenarios` list. Provider calls share the framework's
+    per-provider rate limits. `deadline` (seconds) applies to each
+    scenario; closing the stream cancels the analyses still running.
+
+    Events:
+        result          {"index", ...same payload as /api/analyze}
+        error           {"index", "detail"}
+        batch_completed {"total", "failed"}
+    """
+    if not FRAMEWORK_AVAILABLE:
+        async def mock_stream():
+            for index, item in enumerate(request.scenarios):
+                yield format_sse("result", {"index": index, **create_mock_response(item)})
+            yield format_sse("batch_completed", {"total": len(request.scenarios), "failed": 0})
+
+        return StreamingResponse(mock_stream(), media_type="text/event-stream")
+
+    ethica = get_framework(http_request)
+    scenarios = [
+        {
+            "action": item.action,
+            "context": item.context,
+            "stakeholders": item.stakeholders
+        }
+        for item in request.scenarios
+    ]
+    max_concurrency = max(1, min(request.max_concurrency or 1, MAX_BATCH_CONCURRENCY))
+
+    async def event_stream():
+        failed = 0
+        async for item in ethica.analyze_batch_async(
+            scenarios, max_concurrency=max_concurrency, deadline=deadline
+        ):
+            if item.error is not None:
+                failed += 1
+                yield format_sse("error", {
+                    "index": item.index,
+                    "detail": f"Analysis failed: {str(item.error)}"
+                })
+            else:
+                yield format_sse("result", {"index": item.index, **build_response(item.result)})
+        yield format_sse("batch_completed", {"total": len(scenarios), "failed": failed})
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@app.post("/api/jobs", status_code=202)
+async def submit_job(request: JobRequest, http_request: Request):
+    """
+    Queue an analysis and return immediately
+
+    Poll GET /api/jobs/{job_id}, or pass `webhook_url` to have the
+    finished job POSTed there. Answers 429 when the queue is full and
+    422 when the webhook host is private, loopback or link-local (or
+    not in ETHICA_WEBHOOK_ALLOWLIST, if set).
+    """
+    if not FRAMEWORK_AVAILABLE:
+        raise HTTPException(status_code=503, detail="Job queue unavailable in mock mode")
+
+    get_framework(http_request)
+    jobs: JobWorker = http_request.app.state.jobs
+    depth = await asyncio.to_thread(jobs.queue.depth)
+    if depth >= MAX_QUEUED_JOBS:
+        raise HTTPException(
+            status_code=429,
+            detail=f"Job queue is full ({depth} waiting). Retry later.",
+            headers={"Retry-After": "30"}
+        )
+
+    webhook_url = str(request.webhook_url) if request.webhook_url else None
+    if webhook_url:
+        try:
+            await asyncio.to_thread(check_webhook_url, webhook_url)
+        except ValueError as e:
+            raise HTTPException(status_code=422, detail=str(e))
+
+    scenario = {
+        "action": request.action,
+        "context": request.context,
+        "stakeholders": request.stakeholders
+    }
+    job = await asyncio.to_thread(jobs.queue.submit, scenario, webhook_url)
+    jobs.notify()
+    return {
+        "job_id": job.id,
+        "status": job.status,
+        "status_url": f"/api/jobs/{job.id}",
+        "queue_depth": depth + 1
+    }
+
+@app.get("/api/jobs/{job_id}")
+async def get_job(job_id: str, http_request: Request):
+    """
+    Job status: queued, running, completed or failed
+
+    `progress` holds each module output as soon as it finishes; `result`
+    (the full analysis) and `error` are set once the job is finished.
+    """
+    jobs = getattr(http_request.app.state, "jobs", None)
+    if jobs is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    job = await asyncio.to_thread(jobs.queue.get, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job.to_dict()
+
+def get_result_store(http_request: Request):
+    ethica = get_framework(http_request)
+    if ethica.result_store is None:
+        raise HTTPException(status_code=503, detail="Result store not configured")
+    return ethica.result_store
+
+@app.get("/api/results")
+async def list_results(
+    http_request: Request,
+    organization_id: Optional[str] = None,
+    approval_type: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    min_impact_score: Optional[float] = None,
+    max_impact_score: Optional[float] = None,
+    min_readiness: Optional[float] = None,
+    max_readiness: Optional[float] = None,
+    limit: int = 50,
+    cursor: Optional[str] = None
+):
+    """
+    Stored analyses, newest first
+
+    Filters combine with AND; `since`/`until` are ISO timestamps. Pass
+    the returned `next_cursor` as `cursor` to fetch the next page.
+    """
+    store = get_result_store(http_request)
+    try:
+        page = await asyncio.to_thread(
+            store.query,
+            organization_id=organization_id,
+            approval_type=approval_type,
+            since=since,
+            until=until,
+            min_impact_score=min_impact_score,
+            max_impact_score=max_impact_score,
+            min_readiness=min_readiness,
+            max_readiness=max_readiness,
+            limit=max(1, min(limit, MAX_RESULTS_PAGE)),
+            cursor=cursor
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"items": page.items, "next_cursor": page.next_cursor}
+
+@app.get("/api/results/{scenario_id}")
+async def get_result(scenario_id: str, http_request: Request):
+    """Full stored AnalysisResult"""
+    store = get_result_store(http_request)
+    result = await asyncio.to_thread(store.get, scenario_id)
+    if result is None:
+        raise HTTPException(status_code=404, detail="Result not found")
+    return result
+
+def format_sse(event: str, data: dict) -> str:
+    """Encode one Server-Sent Event"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
+def build_response(result) -> dict:
+    """
+    Convert an AnalysisResult to the AnalysisResponse shape
+    """
+    return {
+        "scenario_id": result.scenario_id,
+        "timestamp": result.timestamp,
+        "strategic": {
+            "impact_score": result.strategic["impact_score"],
+            "confidence": result.strategic["confidence"],
+            "integration_score": result.strategic["integration_score"]
+        },
+        "operational": {
+            "harmony_score": result.operational.get("harmony_score", 0.0)
+        },
+        "tactical": {
+            "sustainability": result.tactical.get("sustainability", 0.0)
+        },
+        "execution": {
+            "readiness": result.execution["readiness"],
+            "approved": result.execution["approved"]
+        },
+        "decision": {
+            "approved": result.decision.approved,
+            "approval_type": result.decision.approval_type,
+            "confidence": result.decision.confidence,
+            "reasoning": result.decision.reasoning,
+            "actions": result.decision.actions,
+            "conditions": result.decision.conditions
+        },
+        "incomplete": result.incomplete,
+        "pending_stages": result.pending_stages,
+        "reused_stages": result.reused_stages,
+        "screening": asdict(result.screening) if result.screening is not None else None
+    }
+
 def create_mock_response(request: AnalysisRequest) -> dict:
     """
     Create a mock response when the framework is not available